@@ -5,6 +5,9 @@ from fastapi import HTTPException, Request
 from fastapi.security import HTTPBearer
 from jose import JWTError
 
+from app.core.settings.config import settings
+from app.core.timing import phase
+
 security = HTTPBearer()
 
 
@@ -51,16 +54,17 @@ def require_auth(func: Callable) -> Callable:
             auth_service = request.app.state.auth_service
 
             try:
-                payload = auth_service.verify_token(token)
-                email = payload.get("email")
+                with phase("auth"):
+                    payload = auth_service.verify_token(token)
+                    email = payload.get("email")
 
-                if not email:
-                    raise HTTPException(
-                        status_code=401,
-                        detail="Invalid token payload",
-                    )
+                    if not email:
+                        raise HTTPException(
+                            status_code=401,
+                            detail="Invalid token payload",
+                        )
 
-                user = await auth_service.user_repository.get_by_email(email)
+                    user = await auth_service.user_repository.get_by_email(email)
                 if not user:
                     raise HTTPException(
                         status_code=401,
@@ -93,3 +97,37 @@ def require_auth(func: Callable) -> Callable:
             )
 
     return wrapper
+
+
+def require_admin(func: Callable) -> Callable:
+    """
+    Decorator for routes restricted to the administrators (``ADMIN_EMAILS``).
+    Authenticates the user like :func:`require_auth` first.
+
+    Returns
+    -------
+    callable
+        Decorated function.
+
+    Raises
+    ------
+    HTTPException
+        401 if token is invalid or missing
+        403 if user is inactive or not an administrator
+    """
+
+    @wraps(func)
+    async def wrapper(
+        *args,
+        request: Request,
+        **kwargs,
+    ):
+        if request.state.user.email not in settings.ADMIN_EMAILS:
+            raise HTTPException(
+                status_code=403,
+                detail="Administrator privileges required",
+            )
+
+        return await func(*args, request=request, **kwargs)
+
+    return require_auth(wrapper)
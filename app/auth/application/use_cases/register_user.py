@@ -29,7 +29,7 @@ class RegisterUserUseCase:
         User
             The registered user.
         """
-        logger.info(f"Registering user: name={name}, email={email}")
+        logger.info("Registering user: name=%s, email=%s", name, email)
         user = await self.auth_service.register_user(name, email, password)
-        logger.info(f"User registered: name={user.name}, email={user.email}")
+        logger.info("User registered: name=%s, email=%s", user.name, user.email)
         return user
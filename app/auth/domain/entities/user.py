@@ -1,13 +1,15 @@
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from app.core.ids import uuid7
+
 
 class User(BaseModel):
     """User entity"""
 
-    id: Optional[UUID] = Field(default_factory=uuid4)
+    id: Optional[UUID] = Field(default_factory=uuid7)
     name: str
     email: EmailStr
     hashed_password: str
@@ -6,6 +6,7 @@ from passlib.context import CryptContext
 from app.auth.domain.entities.user import User
 from app.auth.domain.exceptions.user_exceptions import UserAlreadyRegisteredError
 from app.auth.domain.interfaces.user_repository import BaseUserRepository
+from app.core.metrics import PASSWORD_HASH_DURATION
 from app.core.settings.config import settings
 
 
@@ -34,7 +35,8 @@ class AuthService:
         str
             Hashed password.
         """
-        return self.pwd_context.hash(password)
+        with PASSWORD_HASH_DURATION.labels("hash").time():
+            return self.pwd_context.hash(password)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -52,7 +54,8 @@ class AuthService:
         bool
             True if the passwords match, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        with PASSWORD_HASH_DURATION.labels("verify").time():
+            return self.pwd_context.verify(plain_password, hashed_password)
 
     async def register_user(self, name: str, email: str, password: str) -> User:
         """
@@ -9,7 +9,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    name: Mapped[str] = mapped_column(String, index=True)
+    name: Mapped[str] = mapped_column(String)
     email: Mapped[str] = mapped_column(String, index=True, unique=True)
-    hashed_password: Mapped[str] = mapped_column(String, index=True)
-    is_active: Mapped[bool] = mapped_column(Boolean, index=True)
+    hashed_password: Mapped[str] = mapped_column(String)
+    is_active: Mapped[bool] = mapped_column(Boolean)
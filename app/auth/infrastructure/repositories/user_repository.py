@@ -1,9 +1,12 @@
+from typing import AsyncContextManager, Callable
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from app.auth.domain.entities.user import User as UserEntity
 from app.auth.domain.interfaces.user_repository import BaseUserRepository
 from app.auth.infrastructure.persistence.models.user import User as UserModel
+from app.core.infrastructure.persistence.rows import select_entities, to_entity
+from app.core.replicas import read_only
 
 
 class UserRepository(BaseUserRepository):
@@ -12,6 +15,7 @@ class UserRepository(BaseUserRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    @read_only
     async def get_by_email(self, email: str) -> UserEntity | None:
         """
         Get user by email
@@ -26,10 +30,12 @@ class UserRepository(BaseUserRepository):
         UserEntity | None
             User entity if user exists, None otherwise
         """
-        result = await self.session.execute(select(UserModel).filter_by(email=email))
-        user = result.scalar_one_or_none()
-        if user:
-            return UserEntity.model_validate(user)
+        result = await self.session.execute(
+            select_entities(UserModel, UserEntity).where(UserModel.email == email)
+        )
+        row = result.one_or_none()
+        if row:
+            return to_entity(UserEntity, row)
         return None
 
     async def save(self, user: UserEntity) -> None:
@@ -56,3 +62,45 @@ class UserRepository(BaseUserRepository):
         self.session.add(user_model)
         await self.session.commit()
         await self.session.refresh(user_model)
+
+
+class SessionFactoryUserRepository(BaseUserRepository):
+    """
+    User repository opening a short session for every call, for services that
+    outlive a request. The connection is back in the pool as soon as the call
+    returns, and concurrent requests never share a session.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], AsyncContextManager[AsyncSession]]
+    ) -> None:
+        self.session_factory = session_factory
+
+    async def get_by_email(self, email: str) -> UserEntity | None:
+        """
+        Get user by email
+
+        Parameters
+        ----------
+        email : str
+            User email
+
+        Returns
+        -------
+        UserEntity | None
+            User entity if user exists, None otherwise
+        """
+        async with self.session_factory() as session:
+            return await UserRepository(session).get_by_email(email)
+
+    async def save(self, user: UserEntity) -> None:
+        """
+        Save user
+
+        Parameters
+        ----------
+        user : UserEntity
+            User entity
+        """
+        async with self.session_factory() as session:
+            await UserRepository(session).save(user)
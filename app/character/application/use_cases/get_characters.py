@@ -0,0 +1,58 @@
+from typing import List, NamedTuple
+from uuid import UUID
+
+from app.character.domain.entities.character import Character
+from app.character.domain.exceptions.character_exceptions import (
+    TooManyCharacterIdsError,
+)
+from app.character.domain.interfaces.character_repository import BaseCharacterRepository
+
+
+class CharactersLookup(NamedTuple):
+    """The characters found, in the requested order, and the ids not found."""
+
+    characters: List[Character]
+    missing: List[UUID]
+
+
+class GetCharactersUseCase:
+    """Use case for retrieving several characters in one query."""
+
+    def __init__(
+        self, character_repository: BaseCharacterRepository, max_ids: int = 100
+    ) -> None:
+        self.character_repository = character_repository
+        self.max_ids = max_ids
+
+    async def execute(self, character_ids: List[UUID]) -> CharactersLookup:
+        """
+        Retrieve the characters with the given IDs.
+
+        Parameters
+        ----------
+        character_ids : List[UUID]
+            The IDs of the characters; duplicates are returned once.
+
+        Returns
+        -------
+        CharactersLookup
+            The characters in the order of their first ID, and the IDs that
+            matched no character.
+
+        Raises
+        ------
+        TooManyCharacterIdsError
+            If more than ``max_ids`` distinct IDs are requested.
+        """
+        unique_ids = list(dict.fromkeys(character_ids))
+        if len(unique_ids) > self.max_ids:
+            raise TooManyCharacterIdsError(self.max_ids)
+
+        found = {
+            character.id: character
+            for character in await self.character_repository.get_by_ids(unique_ids)
+        }
+        return CharactersLookup(
+            characters=[found[cid] for cid in unique_ids if cid in found],
+            missing=[cid for cid in unique_ids if cid not in found],
+        )
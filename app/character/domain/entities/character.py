@@ -1,13 +1,15 @@
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.ids import uuid7
+
 
 class Character(BaseModel):
     """Domain entity for a character."""
 
-    id: Optional[UUID] = Field(default_factory=uuid4)
+    id: Optional[UUID] = Field(default_factory=uuid7)
     name: str = Field(min_length=1)
     favorite_color: Optional[str] = None
     animal_friend: Optional[str] = None
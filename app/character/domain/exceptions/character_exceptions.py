@@ -7,3 +7,11 @@ class CharactersEmptyError(CharacterValidationError):
 
     def __init__(self):
         super().__init__("At least one character is required to generate a story.")
+
+
+class TooManyCharacterIdsError(CharacterValidationError):
+    """Raised when more characters are requested at once than allowed."""
+
+    def __init__(self, max_ids: int) -> None:
+        super().__init__(f"At most {max_ids} characters can be requested at once.")
+        self.max_ids = max_ids
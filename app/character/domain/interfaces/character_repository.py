@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 from uuid import UUID
 
 from app.character.domain.entities.character import Character as CharacterEntity
@@ -36,3 +37,19 @@ class BaseCharacterRepository(ABC):
         CharacterEntity or None
             The character entity if found, otherwise None.
         """
+
+    @abstractmethod
+    async def get_by_ids(self, character_ids: List[UUID]) -> List[CharacterEntity]:
+        """
+        Retrieve several character entities in a single query.
+
+        Parameters
+        ----------
+        character_ids : List[UUID]
+            The unique identifiers of the characters to retrieve.
+
+        Returns
+        -------
+        List[CharacterEntity]
+            The characters found, in no particular order. Unknown IDs are skipped.
+        """
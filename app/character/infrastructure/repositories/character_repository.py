@@ -1,13 +1,15 @@
+from typing import List
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from app.character.domain.entities.character import Character as CharacterEntity
 from app.character.domain.interfaces.character_repository import BaseCharacterRepository
 from app.character.infrastructure.persistence.models.character import (
     Character as CharacterModel,
 )
+from app.core.infrastructure.persistence.rows import select_entities, to_entity
+from app.core.replicas import read_only
 
 
 class CharacterRepository(BaseCharacterRepository):
@@ -43,8 +45,9 @@ class CharacterRepository(BaseCharacterRepository):
         await self.session.commit()
         await self.session.refresh(character_model)
 
-        return CharacterEntity(**character_model.__dict__)
+        return CharacterEntity.model_validate(character_model)
 
+    @read_only
     async def get_by_id(self, character_id: UUID) -> CharacterEntity | None:
         """
         Asynchronously retrieve a character entity by its ID.
@@ -59,12 +62,38 @@ class CharacterRepository(BaseCharacterRepository):
         """
 
         result = await self.session.execute(
-            select(CharacterModel).filter_by(id=character_id)
+            select_entities(CharacterModel, CharacterEntity).where(
+                CharacterModel.id == character_id
+            )
         )
 
-        character_model = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if character_model:
-            return CharacterEntity(**character_model.__dict__)
+        if row:
+            return to_entity(CharacterEntity, row)
 
         return None
+
+    @read_only
+    async def get_by_ids(self, character_ids: List[UUID]) -> List[CharacterEntity]:
+        """
+        Asynchronously retrieve several character entities in a single query.
+        Parameters
+        ----------
+        character_ids : List[UUID]
+            The unique identifiers of the characters to retrieve.
+        Returns
+        -------
+        List[CharacterEntity]
+            The characters found, in no particular order.
+        """
+        if not character_ids:
+            return []
+
+        result = await self.session.execute(
+            select_entities(CharacterModel, CharacterEntity).where(
+                CharacterModel.id.in_(set(character_ids))
+            )
+        )
+
+        return [to_entity(CharacterEntity, row) for row in result]
@@ -1,7 +1,10 @@
+from typing import List
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.character.domain.entities.character import Character
+
 
 class CreateCharacterRequest(BaseModel):
     """Request model for creating a new character."""
@@ -48,3 +51,23 @@ class CharacterResponse(BaseModel):
     superpower: str
     hobby: str
     personality: str
+
+
+class CharacterIdsRequest(BaseModel):
+    """Request model for retrieving several characters at once."""
+
+    ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        examples=[["123e4567-e89b-12d3-a456-426614174000"]],
+        description="The IDs of the characters, returned in this order.",
+    )
+
+
+class CharactersResponse(BaseModel):
+    """Response model for several characters retrieved at once."""
+
+    characters: List[Character]
+    missing: List[UUID] = Field(
+        ..., description="The requested IDs that matched no character."
+    )
@@ -1,23 +1,43 @@
+from typing import Any, List, Mapping
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from app.character.application.use_cases.create_character import CreateCharacterUseCase
+from app.character.application.use_cases.get_characters import GetCharactersUseCase
 from app.character.domain.entities.character import Character
+from app.character.domain.exceptions.character_exceptions import (
+    TooManyCharacterIdsError,
+)
 from app.character.infrastructure.repositories.character_repository import (
     CharacterRepository,
 )
 from app.character.presentation.models.character import (
+    CharacterIdsRequest,
     CharacterResponse,
+    CharactersResponse,
     CreateCharacterRequest,
 )
+from app.core.catalog import CHARACTERS, CatalogVersions
 from app.core.dependencies import (
+    get_catalog_version_repository,
+    get_catalog_versions,
     get_character_repository,
+    get_characters_use_case,
     get_create_character_use_case,
 )
+from app.core.fieldsets import field_selection, selection_tag
+from app.core.http_cache import cache_headers, etag_matches, make_etag, not_modified
+from app.core.infrastructure.repositories.catalog_version_repository import (
+    CatalogVersionRepository,
+)
+from app.core.responses import EntityJSONResponse
+from app.core.settings.config import settings
 
 router = APIRouter()
 
+character_fields = field_selection(Character)
+
 
 @router.post("/", response_model=CharacterResponse, status_code=status.HTTP_201_CREATED)
 async def create_character(
@@ -55,10 +75,21 @@ async def create_character(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{character_id}", response_model=Character, status_code=status.HTTP_200_OK)
+@router.get(
+    "/{character_id}",
+    response_model=Character,
+    status_code=status.HTTP_200_OK,
+    responses={304: {"description": "Not Modified - The cached character is current"}},
+)
 async def get_character_by_id(
+    request: Request,
     character_id: UUID,
     character_repository: CharacterRepository = Depends(get_character_repository),
+    catalog_versions: CatalogVersions = Depends(get_catalog_versions),
+    catalog_repository: CatalogVersionRepository = Depends(
+        get_catalog_version_repository
+    ),
+    include: Mapping[str, Any] = Depends(character_fields),
 ):
     """
     API endpoint to retrieve a character by its ID.
@@ -67,13 +98,30 @@ async def get_character_by_id(
     ----------
     character_id : UUID
         The unique identifier of the character.
+    include : Mapping[str, Any]
+        The fields to return, from the ``fields`` query parameter.
 
     Returns
     -------
     Character
-        The character entity if found.
+        The character entity if found, with an ETag (or a 304 when the
+        ``If-None-Match`` of the request is current).
     """
+    max_age = settings.CATALOG_CACHE_MAX_AGE_SECONDS
+    variant = selection_tag(Character, include)
+    etag = make_etag(
+        CHARACTERS,
+        await catalog_versions.get(CHARACTERS, catalog_repository),
+        character_id,
+        variant=variant,
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag, max_age)
+
+    # Tag the body with the version of the replica it is read from.
+    version = await catalog_repository.get(CHARACTERS)
     character = await character_repository.get_by_id(character_id)
+    etag = make_etag(CHARACTERS, version, character_id, variant=variant)
 
     if not character:
         raise HTTPException(
@@ -81,4 +129,114 @@ async def get_character_by_id(
             detail=f"Character with ID {character_id} not found.",
         )
 
-    return character
+    return EntityJSONResponse(
+        character, Character, headers=cache_headers(etag, max_age), include=include
+    )
+
+
+@router.get(
+    "/",
+    response_model=CharactersResponse,
+    status_code=status.HTTP_200_OK,
+    responses={422: {"description": "Validation Error - Invalid or too many IDs"}},
+)
+async def get_characters(
+    ids: List[str] = Query(
+        ...,
+        description="Character IDs, comma separated or repeated (``ids=a,b&ids=c``).",
+    ),
+    use_case: GetCharactersUseCase = Depends(get_characters_use_case),
+    include: Mapping[str, Any] = Depends(character_fields),
+):
+    """
+    API endpoint to retrieve several characters with a single query.
+
+    Parameters
+    ----------
+    ids : List[str]
+        The IDs of the characters.
+    use_case : GetCharactersUseCase
+        The use case retrieving the characters.
+    include : Mapping[str, Any]
+        The fields of the characters to return, from the ``fields`` parameter.
+
+    Returns
+    -------
+    CharactersResponse
+        The characters found, in the order of ``ids``, and the IDs not found.
+
+    Raises
+    ------
+    HTTPException
+        With 422 status code if an ID is malformed or too many are requested.
+    """
+    try:
+        character_ids = [
+            UUID(part) for value in ids for part in value.split(",") if part.strip()
+        ]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Character IDs must be UUIDs.",
+        )
+
+    if not character_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="At least one character ID is required.",
+        )
+
+    return await _lookup_characters(use_case, character_ids, include)
+
+
+@router.post(
+    "/batch-get",
+    response_model=CharactersResponse,
+    status_code=status.HTTP_200_OK,
+    responses={422: {"description": "Validation Error - Invalid or too many IDs"}},
+)
+async def batch_get_characters(
+    request: CharacterIdsRequest,
+    use_case: GetCharactersUseCase = Depends(get_characters_use_case),
+    include: Mapping[str, Any] = Depends(character_fields),
+):
+    """
+    Same as ``GET /characters?ids=``, with the IDs in the body for lists too long
+    for a URL.
+
+    Parameters
+    ----------
+    request : CharacterIdsRequest
+        The IDs of the characters.
+    use_case : GetCharactersUseCase
+        The use case retrieving the characters.
+    include : Mapping[str, Any]
+        The fields of the characters to return, from the ``fields`` parameter.
+
+    Returns
+    -------
+    CharactersResponse
+        The characters found, in the order of ``ids``, and the IDs not found.
+    """
+    return await _lookup_characters(use_case, request.ids, include)
+
+
+async def _lookup_characters(
+    use_case: GetCharactersUseCase,
+    character_ids: List[UUID],
+    include: Mapping[str, Any],
+) -> EntityJSONResponse:
+    try:
+        lookup = await use_case.execute(character_ids)
+    except TooManyCharacterIdsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+
+    return EntityJSONResponse(
+        CharactersResponse.model_construct(
+            characters=lookup.characters, missing=lookup.missing
+        ),
+        CharactersResponse,
+        include={"characters": {"__all__": dict(include)}, "missing": True},
+    )
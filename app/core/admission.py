@@ -0,0 +1,293 @@
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from enum import Enum
+from typing import AsyncIterator, Deque, Dict
+
+from app.core.exceptions.admission_exceptions import AdmissionRejectedError
+
+
+class AdmissionMode(str, Enum):
+    STATIC = "static"
+    AIMD = "aimd"
+
+
+class ConcurrencyLimiter:
+    """
+    Concurrency limit with a bounded FIFO wait queue for a single backend.
+
+    Requests beyond the limit wait in the queue for at most ``max_queue_time``
+    seconds. When the queue is full, or the wait expires, the request is rejected
+    right away instead of piling up on the inference server.
+
+    In ``AIMD`` mode the limit grows by ``1 / limit`` after every call that finishes
+    under ``target_latency`` and is multiplied by ``backoff_ratio`` after a failed or
+    slow call, always staying within ``[min_limit, max_limit]``.
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        limit: int,
+        max_queue_size: int,
+        max_queue_time: float,
+        mode: AdmissionMode = AdmissionMode.STATIC,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+        target_latency: float | None = None,
+        backoff_ratio: float = 0.9,
+    ) -> None:
+        if limit < 1:
+            raise ValueError("Concurrency limit must be at least 1.")
+
+        self.backend = backend
+        self.mode = AdmissionMode(mode)
+        self.max_queue_size = max_queue_size
+        self.max_queue_time = max_queue_time
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit or limit, limit)
+        self.target_latency = target_latency
+        self.backoff_ratio = backoff_ratio
+
+        self._limit = float(limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self._admitted_total = 0
+        self._rejected_total: Dict[str, int] = {"queue_full": 0, "queue_timeout": 0}
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._latency_ewma: float | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent calls allowed."""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting in the queue.
+
+        Raises
+        ------
+        AdmissionRejectedError
+            If the queue is full or the slot was not granted within
+            ``max_queue_time``.
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            self._record_admission(0.0)
+            return 0.0
+
+        if len(self._waiters) >= self.max_queue_size:
+            raise self._reject("queue_full")
+
+        started_at = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_queue_time)
+        except asyncio.TimeoutError:
+            if self._abandon(waiter):
+                raise self._reject("queue_timeout")
+        except asyncio.CancelledError:
+            if not self._abandon(waiter):
+                self.release(success=False)
+            raise
+
+        waited = time.monotonic() - started_at
+        self._record_admission(waited)
+        return waited
+
+    def release(self, latency: float | None = None, success: bool = True) -> None:
+        """
+        Give a slot back and hand it to the oldest waiter, if any.
+
+        Parameters
+        ----------
+        latency : float, optional
+            Seconds the admitted call took, used for ``Retry-After`` estimates and
+            the adaptive limit.
+        success : bool
+            Whether the admitted call completed without error.
+        """
+        self._in_flight = max(0, self._in_flight - 1)
+
+        if latency is not None:
+            self._observe_latency(latency)
+
+        if self.mode is AdmissionMode.AIMD:
+            self._adapt(latency, success)
+
+        self._wake_waiters()
+
+    def retry_after(self) -> int:
+        """Estimate, in whole seconds, when a rejected client should retry."""
+        if self._latency_ewma is None:
+            return max(1, math.ceil(self.max_queue_time))
+
+        backlog = (len(self._waiters) + 1) / self.limit
+        return max(1, math.ceil(self._latency_ewma * backlog))
+
+    def snapshot(self) -> dict:
+        """Return the limiter statistics as a plain dictionary."""
+        return {
+            "backend": self.backend,
+            "mode": self.mode.value,
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._waiters),
+            "max_queue_size": self.max_queue_size,
+            "admitted_total": self._admitted_total,
+            "rejected_total": dict(self._rejected_total),
+            "wait_seconds_total": round(self._wait_seconds_total, 6),
+            "wait_seconds_max": round(self._wait_seconds_max, 6),
+        }
+
+    def _abandon(self, waiter: asyncio.Future) -> bool:
+        """
+        Drop a waiter that stopped waiting.
+
+        Returns ``True`` if the waiter never got a slot, ``False`` if a slot was
+        granted concurrently and is now owned by the caller.
+        """
+        if waiter.done() and not waiter.cancelled():
+            return False
+
+        waiter.cancel()
+        with contextlib.suppress(ValueError):
+            self._waiters.remove(waiter)
+        return True
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _reject(self, reason: str) -> AdmissionRejectedError:
+        self._rejected_total[reason] += 1
+        return AdmissionRejectedError(self.backend, reason, self.retry_after())
+
+    def _record_admission(self, waited: float) -> None:
+        self._admitted_total += 1
+        self._wait_seconds_total += waited
+        self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def _observe_latency(self, latency: float) -> None:
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency
+
+    def _adapt(self, latency: float | None, success: bool) -> None:
+        too_slow = (
+            self.target_latency is not None
+            and latency is not None
+            and latency > self.target_latency
+        )
+
+        if not success or too_slow:
+            self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        else:
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+
+class AdmissionController:
+    """Keeps one ``ConcurrencyLimiter`` per story generation backend."""
+
+    def __init__(
+        self,
+        default_limit: int,
+        max_queue_size: int,
+        max_queue_time: float,
+        backend_limits: Dict[str, int] | None = None,
+        mode: AdmissionMode = AdmissionMode.STATIC,
+        max_limit: int | None = None,
+        target_latency: float | None = None,
+    ) -> None:
+        self.default_limit = default_limit
+        self.max_queue_size = max_queue_size
+        self.max_queue_time = max_queue_time
+        self.backend_limits = backend_limits or {}
+        self.mode = AdmissionMode(mode)
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self._limiters: Dict[str, ConcurrencyLimiter] = {}
+
+    def limiter(self, backend: str) -> ConcurrencyLimiter:
+        """
+        Return the limiter of a backend, creating it on first use.
+
+        Parameters
+        ----------
+        backend : str
+            Name of the story generation backend (e.g. llama, chatgpt, local).
+
+        Returns
+        -------
+        ConcurrencyLimiter
+            The limiter guarding that backend.
+        """
+        limiter = self._limiters.get(backend)
+        if limiter is None:
+            limiter = ConcurrencyLimiter(
+                backend=backend,
+                limit=self.backend_limits.get(backend, self.default_limit),
+                max_queue_size=self.max_queue_size,
+                max_queue_time=self.max_queue_time,
+                mode=self.mode,
+                max_limit=self.max_limit,
+                target_latency=self.target_latency,
+            )
+            self._limiters[backend] = limiter
+        return limiter
+
+    @contextlib.asynccontextmanager
+    async def admit(self, backend: str) -> AsyncIterator[float]:
+        """
+        Hold a slot of ``backend`` for the duration of the block.
+
+        Yields
+        ------
+        float
+            Seconds spent waiting in the queue.
+
+        Raises
+        ------
+        AdmissionRejectedError
+            If the backend is saturated.
+        """
+        limiter = self.limiter(backend)
+        waited = await limiter.acquire()
+        started_at = time.monotonic()
+        success = False
+        try:
+            yield waited
+            success = True
+        finally:
+            limiter.release(time.monotonic() - started_at, success)
+
+    def stats(self) -> Dict[str, dict]:
+        """Return the statistics of every known backend."""
+        return {
+            backend: limiter.snapshot() for backend, limiter in self._limiters.items()
+        }
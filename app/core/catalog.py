@@ -0,0 +1,76 @@
+"""
+Versions of the catalogs served with ETags (scenarios, characters).
+
+Each catalog has a counter in the ``catalog_versions`` table, bumped in the same
+transaction as any change to the catalog. Workers keep the counters in memory for
+``ttl`` seconds, so a conditional request can be answered with a 304 without
+touching the database; a change made by another worker is seen at most ``ttl``
+seconds later.
+
+Creating a character does not change any existing one, so the ``characters``
+counter only needs bumping when characters are updated or deleted.
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+from app.core.infrastructure.repositories.catalog_version_repository import (
+    CatalogVersionRepository,
+)
+
+SCENARIOS = "scenarios"
+CHARACTERS = "characters"
+
+
+class CatalogVersions:
+    """
+    In-memory cache of the catalog version counters.
+
+    Parameters
+    ----------
+    ttl : float
+        Seconds a counter read from the database is trusted.
+    """
+
+    def __init__(self, ttl: float = 5.0) -> None:
+        self.ttl = ttl
+        self._versions: Dict[str, int] = {}
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return (
+            self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self.ttl
+        )
+
+    async def get(self, name: str, repository: CatalogVersionRepository) -> int:
+        """
+        Return the current version of a catalog.
+
+        Parameters
+        ----------
+        name : str
+            The catalog name.
+        repository : CatalogVersionRepository
+            Reads the counters when the cached ones are stale, with the session
+            of the request.
+
+        Returns
+        -------
+        int
+            The version, 0 for a catalog that never changed.
+        """
+        if not self._fresh():
+            async with self._lock:
+                # Another request may have refreshed them while we waited.
+                if not self._fresh():
+                    self._versions = await repository.get_all()
+                    self._fetched_at = time.monotonic()
+
+        return self._versions.get(name, 0)
+
+    def invalidate(self) -> None:
+        """Read the counters from the database again on the next lookup."""
+        self._fetched_at = None
@@ -0,0 +1,206 @@
+"""
+Content encodings for the HTTP responses.
+
+gzip is always available; ``br`` needs the ``brotli`` package and ``zstd`` the
+``zstandard`` package (the ``compression`` extra). Every compressor can be
+flushed, so a streamed body can be compressed as it is sent and each chunk is
+readable by the client as soon as it arrives.
+"""
+
+import time
+import zlib
+from typing import Callable, Dict, List, Protocol, Sequence
+
+from app.core.metrics import (
+    HTTP_COMPRESSION_INPUT_BYTES,
+    HTTP_COMPRESSION_OUTPUT_BYTES,
+    HTTP_COMPRESSION_SECONDS,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+DEFAULT_LEVELS: Dict[str, int] = {"gzip": 6, "br": 4, "zstd": 3}
+
+# Aliases some clients still send.
+_ALIASES = {"x-gzip": "gzip"}
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """Return everything compressed so far, keeping the stream open."""
+        ...
+
+    def finish(self) -> bytes:
+        """Return the end of the compressed stream."""
+        ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+_COMPRESSORS: Dict[str, Callable[[int], Compressor]] = {"gzip": _GzipCompressor}
+if brotli is not None:
+    _COMPRESSORS["br"] = _BrotliCompressor
+if zstandard is not None:
+    _COMPRESSORS["zstd"] = _ZstdCompressor
+
+
+def supported_encodings() -> List[str]:
+    """Return the content encodings whose compressor is installed."""
+    return list(_COMPRESSORS)
+
+
+def create_compressor(encoding: str, level: int | None = None) -> Compressor:
+    """
+    Create a compressor for one response body.
+
+    Parameters
+    ----------
+    encoding : str
+        ``gzip``, ``br`` or ``zstd``.
+    level : int, optional
+        Compression level (quality for brotli), defaults to :data:`DEFAULT_LEVELS`.
+
+    Raises
+    ------
+    ValueError
+        If the encoding is unknown or its package is not installed.
+    """
+    factory = _COMPRESSORS.get(encoding)
+    if factory is None:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+    return factory(DEFAULT_LEVELS[encoding] if level is None else level)
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    weight = 0.0
+        weights[_ALIASES.get(name, name)] = weight
+    return weights
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """
+    Pick the content encoding of a response from the ``Accept-Encoding`` header.
+
+    Parameters
+    ----------
+    accept_encoding : str
+        The request header, q-values included (``gzip;q=0.8, br``).
+    encodings : Sequence[str]
+        The encodings the server offers, preferred first; the preference only
+        breaks ties between equal q-values.
+
+    Returns
+    -------
+    str or None
+        The chosen encoding, or None to send the body as is.
+    """
+    weights = _parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class MeteredCompressor:
+    """
+    Compresses one response body and records the bytes in and out, and the time
+    spent, in the ``http_compression_*`` metrics.
+    """
+
+    def __init__(self, encoding: str, level: int | None = None) -> None:
+        self.encoding = encoding
+        self._compressor = create_compressor(encoding, level)
+
+    def compress(self, data: bytes, flush: bool = False, finish: bool = False) -> bytes:
+        """
+        Compress the next chunk of the body.
+
+        Parameters
+        ----------
+        data : bytes
+            The chunk.
+        flush : bool
+            Make everything compressed so far decodable by the client.
+        finish : bool
+            End the compressed stream; ``data`` is the last chunk.
+        """
+        started_at = time.perf_counter()
+        compressed = self._compressor.compress(data)
+        if finish:
+            compressed += self._compressor.finish()
+        elif flush:
+            compressed += self._compressor.flush()
+        elapsed = time.perf_counter() - started_at
+
+        HTTP_COMPRESSION_SECONDS.labels(self.encoding).inc(elapsed)
+        HTTP_COMPRESSION_INPUT_BYTES.labels(self.encoding).inc(len(data))
+        HTTP_COMPRESSION_OUTPUT_BYTES.labels(self.encoding).inc(len(compressed))
+        return compressed
@@ -1,7 +1,9 @@
 import contextlib
 import logging
-from typing import AsyncIterator
+import time
+from typing import AsyncIterator, Sequence
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
@@ -9,41 +11,182 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from app.core.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTIONS,
+    DB_QUERY_DURATION,
+)
+from app.core.query_stats import query_stats
+from app.core.replicas import ReplicaSet, RoutingSession
 from app.core.settings.config import settings
+from app.core.tracing import tracer
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool recording how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started_at)
+
+
+def _operation(statement: str) -> str:
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    return operation if operation in SQL_OPERATIONS else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+    conn.info.setdefault("query_spans", []).append(
+        tracer.start_span(
+            "db.query",
+            {"db.system": "postgresql", "db.statement": statement},
+            kind="CLIENT",
+        )
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    DB_QUERY_DURATION.labels(_operation(statement)).observe(elapsed)
+    query_stats.record(statement, elapsed, cursor.rowcount)
+
+    span = conn.info["query_spans"].pop()
+    if span is not None:
+        span.set_attribute("db.operation", _operation(statement))
+        if cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+    tracer.end_span(span)
+
+
+def _handle_error(context):
+    # after_cursor_execute is not called for failed statements.
+    info = context.connection.info if context.connection is not None else {}
+    if info.get("query_started_at"):
+        info["query_started_at"].pop()
+    if info.get("query_spans"):
+        tracer.end_span(info["query_spans"].pop(), context.original_exception)
+
+
+def instrument_engine(engine: AsyncEngine, pool_metrics: bool = True) -> None:
+    """
+    Record and trace the duration of every statement, collect the per-statement
+    statistics and expose the pool usage as gauges.
+
+    Parameters
+    ----------
+    engine : AsyncEngine
+        The engine to instrument.
+    pool_metrics : bool
+        Expose the pool of this engine in ``db_pool_connections`` (the primary's).
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+    pool = engine.pool
+    if pool_metrics and isinstance(pool, AsyncAdaptedQueuePool):
+        DB_POOL_CONNECTIONS.labels("checked_out").set_function(pool.checkedout)
+        DB_POOL_CONNECTIONS.labels("idle").set_function(pool.checkedin)
+        DB_POOL_CONNECTIONS.labels("overflow").set_function(
+            lambda: max(pool.overflow(), 0)
+        )
+
+
 class DatabaseSessionManager:
     """
     Manages the lifecycle of the database engine and sessions for asynchronous database
     operations.
+
+    With ``replica_urls``, the queries of the repository methods marked
+    :func:`~app.core.replicas.read_only` run on the read replicas (see
+    :mod:`app.core.replicas`); call :meth:`start_replica_checks` to take the
+    lagging ones out of rotation.
     """
 
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        replica_urls: Sequence[str] = (),
+        replica_max_lag: float = 5.0,
+        replica_check_interval: float = 5.0,
+    ):
         self.engine: AsyncEngine | None = None
+        self.replicas: ReplicaSet | None = None
         self.session_maker = None
         self.database_url = database_url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.replica_urls = list(replica_urls)
+        self.replica_max_lag = replica_max_lag
+        self.replica_check_interval = replica_check_interval
+
+    def _create_engine(self, url: str) -> AsyncEngine:
+        # Statements are logged through the sqlalchemy.engine logger (DB_ECHO), not
+        # with echo=True, which would add a synchronous handler of its own.
+        return create_async_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+        )
 
     def init_db(self):
-        """Initialize the database engine and session maker."""
+        """Initialize the database engines and session maker."""
+
+        self.engine = self._create_engine(self.database_url)
+        instrument_engine(self.engine)
 
-        self.engine = create_async_engine(self.database_url, echo=True)
+        if self.replica_urls:
+            engines = [self._create_engine(url) for url in self.replica_urls]
+            for engine in engines:
+                instrument_engine(engine, pool_metrics=False)
+            self.replicas = ReplicaSet(
+                engines, self.replica_max_lag, self.replica_check_interval
+            )
 
         self.session_maker = async_sessionmaker(
-            bind=self.engine, autoflush=True, expire_on_commit=False
+            bind=self.engine,
+            autoflush=True,
+            expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            replicas=self.replicas,
         )
 
+    def start_replica_checks(self) -> None:
+        """Check the replication lag of the replicas periodically, if any."""
+        if self.replicas is not None:
+            self.replicas.start()
+
     async def close(self):
         """Close the database engine."""
 
         if self.engine is None:
             raise Exception("DatabaseSessionManager is not initialized.")
+        if self.replicas is not None:
+            await self.replicas.dispose()
         await self.engine.dispose()
 
         self.engine = None
+        self.replicas = None
         self.session_maker = None
 
     @contextlib.asynccontextmanager
@@ -74,7 +217,7 @@ class DatabaseSessionManager:
                 yield conn
             except Exception as e:
                 await conn.rollback()
-                logger.error(f"Database connection failed: {e}")
+                logger.error("Database connection failed: %s", e)
                 raise
 
     @contextlib.asynccontextmanager
@@ -104,13 +247,22 @@ class DatabaseSessionManager:
             yield session
         except Exception as e:
             await session.rollback()
-            logger.error(f"Database connection failed: {e}")
+            logger.error("Database connection failed: %s", e)
             raise
         finally:
             await session.close()
 
 
-sessionmanager = DatabaseSessionManager(settings.get_database_url())
+sessionmanager = DatabaseSessionManager(
+    settings.get_database_url(),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    replica_urls=settings.DB_REPLICA_URLS,
+    replica_max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    replica_check_interval=settings.DB_REPLICA_CHECK_INTERVAL_SECONDS,
+)
 
 
 async def get_async_session():
@@ -128,3 +280,21 @@ async def get_async_session():
 
     async with sessionmanager.session() as session:
         yield session
+
+
+async def release_connection(session: AsyncSession) -> None:
+    """
+    End the transaction of ``session`` so that its connection goes back to the pool.
+
+    A session only checks a connection out on its first statement, and keeps it
+    until its transaction ends. Call this once the database part of a request is
+    done, before slow work such as an LLM call; the session stays usable and
+    checks a connection out again on its next statement.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        The session of the request.
+    """
+    if session.in_transaction():
+        await session.commit()
@@ -1,26 +1,46 @@
+import contextlib
 import os
+from functools import lru_cache, partial
+from typing import AsyncIterator
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.domain.services.auth_service import AuthService
-from app.auth.infrastructure.repositories.user_repository import UserRepository
+from app.auth.infrastructure.repositories.user_repository import (
+    SessionFactoryUserRepository,
+    UserRepository,
+)
 from app.character.application.use_cases.create_character import CreateCharacterUseCase
+from app.character.application.use_cases.get_characters import GetCharactersUseCase
 from app.character.infrastructure.repositories.character_repository import (
     CharacterRepository,
 )
-from app.core.database import get_async_session
+from app.core.admission import AdmissionController
+from app.core.catalog import CatalogVersions
+from app.core.database import get_async_session, release_connection, sessionmanager
+from app.core.infrastructure.ai.clients.llama_client import LlamaClient
+from app.core.infrastructure.repositories.catalog_version_repository import (
+    CatalogVersionRepository,
+)
+from app.core.profiler import SamplingProfiler, profiler
+from app.core.settings.config import settings
 from app.scenario.application.use_cases.create_scenario import CreateScenarioUseCase
 from app.scenario.application.use_cases.get_scenario import GetScenarioUseCase
 from app.scenario.application.use_cases.get_scenarios import GetScenariosUseCase
 from app.scenario.infrastructure.repositories.scenario_repository import (
     ScenarioRepository,
 )
+from app.story.application.use_cases.generate_stories_batch import (
+    GenerateStoriesBatchUseCase,
+)
 from app.story.application.use_cases.generate_story import GenerateStoryUseCase
 from app.story.domain.interfaces.story_generator import BaseStoryGenerator
 from app.story.infrastructure.ai.chatgpt_story_generator import ChatGPTStoryGenerator
 from app.story.infrastructure.ai.llama_story_generator import LlamaStoryGenerator
 from app.story.infrastructure.ai.local_story_generator import LocalStoryGenerator
+from app.usage.application.services.usage_aggregator import UsageAggregator
+from app.usage.infrastructure.repositories.usage_repository import UsageRepository
 
 
 def get_auth_service(
@@ -43,6 +63,21 @@ def get_auth_service(
     return AuthService(user_repository)
 
 
+def get_shared_auth_service() -> AuthService:
+    """
+    Provides the AuthService kept in ``app.state`` for the authenticated routes.
+
+    It is shared by every request, so its repository opens a session per lookup
+    instead of holding one session (and its connection) for the whole process.
+
+    Returns
+    -------
+    AuthService
+        AuthService instance.
+    """
+    return AuthService(SessionFactoryUserRepository(sessionmanager.session))
+
+
 def get_character_repository(
     db: AsyncSession = Depends(get_async_session),
 ) -> CharacterRepository:
@@ -68,6 +103,23 @@ def get_create_character_use_case(
     return CreateCharacterUseCase(character_repository)
 
 
+def get_characters_use_case(
+    character_repository: CharacterRepository = Depends(get_character_repository),
+) -> GetCharactersUseCase:
+    """
+    Provides a GetCharactersUseCase instance, limited by the
+    CHARACTERS_MAX_IDS_PER_REQUEST setting.
+
+    Returns
+    -------
+    GetCharactersUseCase
+        An instance of GetCharactersUseCase.
+    """
+    return GetCharactersUseCase(
+        character_repository, max_ids=settings.CHARACTERS_MAX_IDS_PER_REQUEST
+    )
+
+
 def get_scenario_repository(
     db: AsyncSession = Depends(get_async_session),
 ) -> ScenarioRepository:
@@ -148,14 +200,58 @@ def get_create_scenario_use_case(
     return CreateScenarioUseCase(scenario_repository)
 
 
+admission_controller = AdmissionController(
+    default_limit=settings.ADMISSION_CONCURRENCY_LIMIT,
+    max_queue_size=settings.ADMISSION_MAX_QUEUE_SIZE,
+    max_queue_time=settings.ADMISSION_MAX_QUEUE_TIME_SECONDS,
+    backend_limits=settings.ADMISSION_BACKEND_LIMITS,
+    mode=settings.ADMISSION_MODE,
+    max_limit=settings.ADMISSION_MAX_CONCURRENCY_LIMIT,
+    target_latency=settings.ADMISSION_TARGET_LATENCY_SECONDS,
+)
+
+
+def get_story_generator_type() -> str:
+    """
+    Returns the configured story generator backend name (llama, chatgpt or local).
+    """
+    return os.getenv("STORY_GENERATOR", "local").lower()
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Provides the process-wide AdmissionController guarding story generation.
+
+    Returns
+    -------
+    AdmissionController
+        The shared admission controller.
+    """
+    return admission_controller
+
+
 def get_story_generator() -> BaseStoryGenerator:  # pragma: no cover
     """
     Returns the appropriate story generator based on configuration.
     """
-    generator_type = os.getenv("STORY_GENERATOR", "local").lower()
+    return _build_story_generator(get_story_generator_type())
 
+
+@lru_cache  # pragma: no cover
+def _build_story_generator(generator_type: str) -> BaseStoryGenerator:
+    """
+    Builds a story generator once per backend, so its client (and any request
+    batching it does) is shared by all requests.
+    """
     if generator_type == "llama":
-        return LlamaStoryGenerator()
+        return LlamaStoryGenerator(
+            llama_client=LlamaClient(
+                batch_max_size=settings.LLAMA_BATCH_MAX_SIZE,
+                batch_linger_ms=settings.LLAMA_BATCH_LINGER_MS,
+                cache_prompt=settings.LLAMA_CACHE_PROMPT,
+                slot_count=settings.LLAMA_SLOT_COUNT,
+            )
+        )
     elif generator_type == "chatgpt":
         return ChatGPTStoryGenerator()
 
@@ -166,6 +262,9 @@ def get_generate_story_use_case(
     story_generator=Depends(get_story_generator),
     character_repository=Depends(get_character_repository),
     scenario_repository=Depends(get_scenario_repository),
+    admission_controller=Depends(get_admission_controller),
+    backend=Depends(get_story_generator_type),
+    db: AsyncSession = Depends(get_async_session),
 ) -> GenerateStoryUseCase:
     """
     Provides an instance of GenerateStoryUseCase with its dependencies.
@@ -178,6 +277,13 @@ def get_generate_story_use_case(
         The character repository dependency, by default Depends(get_character_repository).
     scenario_repository : ScenarioRepository, optional
         The scenario repository dependency, by default Depends(get_scenario_repository).
+    admission_controller : AdmissionController, optional
+        Limits the concurrent calls to the story generator, by default
+        Depends(get_admission_controller).
+    backend : str, optional
+        The story generator backend, by default Depends(get_story_generator_type).
+    db : AsyncSession, optional
+        The session of the repositories, released before the story is generated.
 
     Returns
     -------
@@ -185,5 +291,111 @@ def get_generate_story_use_case(
         An instance of GenerateStoryUseCase initialized with the provided dependencies.
     """
     return GenerateStoryUseCase(
-        story_generator, character_repository, scenario_repository
+        story_generator,
+        character_repository,
+        scenario_repository,
+        release_connections=partial(release_connection, db),
+        admission_controller=admission_controller,
+        backend=backend,
     )
+
+
+def get_generate_stories_batch_use_case(
+    story_generator=Depends(get_story_generator),
+    character_repository=Depends(get_character_repository),
+    scenario_repository=Depends(get_scenario_repository),
+    admission_controller=Depends(get_admission_controller),
+    backend=Depends(get_story_generator_type),
+    db: AsyncSession = Depends(get_async_session),
+) -> GenerateStoriesBatchUseCase:
+    """
+    Provides an instance of GenerateStoriesBatchUseCase with its dependencies.
+
+    Returns
+    -------
+    GenerateStoriesBatchUseCase
+        An instance of GenerateStoriesBatchUseCase limited by the
+        STORY_BATCH_MAX_SIZE and STORY_BATCH_MAX_CONCURRENCY settings.
+    """
+    return GenerateStoriesBatchUseCase(
+        story_generator,
+        character_repository,
+        scenario_repository,
+        admission_controller,
+        backend,
+        max_concurrency=settings.STORY_BATCH_MAX_CONCURRENCY,
+        max_stories=settings.STORY_BATCH_MAX_SIZE,
+        release_connections=partial(release_connection, db),
+    )
+
+
+@contextlib.asynccontextmanager
+async def _usage_repository() -> AsyncIterator[UsageRepository]:
+    async with sessionmanager.session() as session:
+        yield UsageRepository(session)
+
+
+usage_aggregator = UsageAggregator(
+    _usage_repository, flush_interval=settings.USAGE_FLUSH_INTERVAL_SECONDS
+)
+
+
+def get_usage_aggregator() -> UsageAggregator:
+    """
+    Provides the process-wide UsageAggregator collecting token usage per user.
+
+    Returns
+    -------
+    UsageAggregator
+        The shared usage aggregator, flushed periodically by the application.
+    """
+    return usage_aggregator
+
+
+def get_profiler() -> SamplingProfiler:
+    """
+    Provides the process-wide SamplingProfiler.
+
+    Returns
+    -------
+    SamplingProfiler
+        The shared profiler, which runs one profile at a time.
+    """
+    return profiler
+
+
+catalog_versions = CatalogVersions(ttl=settings.CATALOG_VERSION_TTL_SECONDS)
+
+
+def get_catalog_versions() -> CatalogVersions:
+    """
+    Provides the process-wide cache of the catalog versions used for ETags.
+
+    Returns
+    -------
+    CatalogVersions
+        The shared catalog versions.
+    """
+    return catalog_versions
+
+
+def get_catalog_version_repository(
+    db: AsyncSession = Depends(get_async_session),
+) -> CatalogVersionRepository:
+    """
+    Provides the repository reading the catalog versions of an ETag.
+
+    It shares the session of the request, so the version an ETag is built from
+    is read from the same replica as the body it tags.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        The session of the request, by default Depends(get_async_session).
+
+    Returns
+    -------
+    CatalogVersionRepository
+        The catalog version repository.
+    """
+    return CatalogVersionRepository(db)
@@ -0,0 +1,11 @@
+class AdmissionRejectedError(Exception):
+    """Raised when a request cannot be admitted to a saturated backend."""
+
+    def __init__(self, backend: str, reason: str, retry_after: int) -> None:
+        super().__init__(
+            f"Backend '{backend}' is overloaded ({reason}). "
+            f"Retry after {retry_after} seconds."
+        )
+        self.backend = backend
+        self.reason = reason
+        self.retry_after = retry_after
@@ -0,0 +1,7 @@
+class InvalidFieldSelectionError(Exception):
+    """Raised when ``fields`` or ``expand`` name something the response lacks."""
+
+    def __init__(self, parameter: str, names: list[str]) -> None:
+        super().__init__(f"Unknown {parameter}: {', '.join(names)}.")
+        self.parameter = parameter
+        self.names = names
@@ -0,0 +1,5 @@
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one is running."""
+
+    def __init__(self) -> None:
+        super().__init__("A profile is already running, try again when it is done.")
@@ -0,0 +1,214 @@
+"""
+Sparse fieldsets.
+
+Endpoints taking a ``fields`` query parameter return only the fields listed:
+``fields=title,content`` selects top level fields and ``characters.name`` a
+field of a related entity. Related entities are ``{"id": ...}`` references
+unless they are listed in ``expand`` (selecting one of their fields expands
+them too). The selection becomes a pydantic ``include`` spec, so the fields
+left out are never serialized. :func:`selection_tag` tells the selections
+apart in an ETag, so that two representations never share a validator.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Set, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+from app.core.exceptions.fieldset_exceptions import InvalidFieldSelectionError
+from app.core.responses import response_fields
+
+
+def _split(value: str | None) -> Tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(sorted({part.strip() for part in value.split(",") if part.strip()}))
+
+
+def _unwrap(spec: Any) -> Tuple[Mapping[str, Any], bool]:
+    if "__all__" in spec:
+        return spec["__all__"], True
+    return spec, False
+
+
+def _parse_fields(
+    available: Mapping[str, Any], fields: Tuple[str, ...], relations: Tuple[str, ...]
+) -> Tuple[List[str], Dict[str, Set[str]]]:
+    """
+    Validate the field paths of a ``fields`` parameter.
+
+    Returns
+    -------
+    tuple[list[str], dict[str, set[str]]]
+        The top level fields selected, ``id`` first, and the fields selected in
+        each relation.
+
+    Raises
+    ------
+    InvalidFieldSelectionError
+        If a field is not part of the response.
+    """
+    selected = ["id"] if "id" in available else []
+    nested: Dict[str, Set[str]] = {}
+    unknown = []
+    for path in fields:
+        name, _, child = path.partition(".")
+        if name not in available or (
+            child
+            and (name not in relations or child not in _unwrap(available[name])[0])
+        ):
+            unknown.append(path)
+            continue
+        if child:
+            nested.setdefault(name, {"id"}).add(child)
+        if name not in selected:
+            selected.append(name)
+    if unknown:
+        raise InvalidFieldSelectionError("fields", unknown)
+    return selected, nested
+
+
+@lru_cache(maxsize=256)
+def select_fields(
+    response_model: Type[BaseModel],
+    fields: Tuple[str, ...] | None = None,
+    expand: Tuple[str, ...] = (),
+    relations: Tuple[str, ...] = (),
+) -> Mapping[str, Any]:
+    """
+    Build the ``include`` spec of a field selection.
+
+    Parameters
+    ----------
+    response_model : type[BaseModel]
+        The model describing the full response.
+    fields : tuple[str, ...], optional
+        Field paths to return, every field when None. ``id`` is always returned.
+    expand : tuple[str, ...]
+        Relations returned in full rather than as references.
+    relations : tuple[str, ...]
+        The fields of ``response_model`` holding related entities.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        e.g. ``{"title": True, "characters": {"__all__": {"id": True}}}``
+
+    Raises
+    ------
+    InvalidFieldSelectionError
+        If a field or a relation is not part of the response.
+    """
+    available = response_fields(response_model)
+
+    unknown = [name for name in expand if name not in relations]
+    if unknown:
+        raise InvalidFieldSelectionError("expand", unknown)
+
+    if fields is None:
+        selected, nested = list(available), {}
+    else:
+        selected, nested = _parse_fields(available, fields, relations)
+    # Selecting a field of a relation expands it.
+    expanded = set(expand) | set(nested)
+
+    include: Dict[str, Any] = {}
+    for name in selected:
+        spec = available[name]
+        if name in relations:
+            related, many = _unwrap(spec)
+            if name not in expanded:
+                related = {"id": True}
+            elif name in nested:
+                related = {
+                    key: value for key, value in related.items() if key in nested[name]
+                }
+            spec = {"__all__": related} if many else related
+        include[name] = spec
+    return include
+
+
+def selection_tag(
+    response_model: Type[BaseModel], include: Mapping[str, Any]
+) -> str | None:
+    """
+    Identify a field selection in an ETag.
+
+    Parameters
+    ----------
+    response_model : type[BaseModel]
+        The model describing the full response.
+    include : Mapping[str, Any]
+        The ``include`` spec of the selection.
+
+    Returns
+    -------
+    str or None
+        A short digest of the selection, None for the full response.
+    """
+    if include == response_fields(response_model):
+        return None
+    spec = json.dumps(include, sort_keys=True).encode()
+    return hashlib.blake2s(spec, digest_size=4).hexdigest()
+
+
+def field_selection(
+    response_model: Type[BaseModel], relations: Sequence[str] = ()
+) -> Callable[..., Mapping[str, Any]]:
+    """
+    Create the dependency reading the ``fields`` (and, with relations,
+    ``expand``) query parameters of an endpoint.
+
+    Parameters
+    ----------
+    response_model : type[BaseModel]
+        The model describing the full response.
+    relations : Sequence[str]
+        The fields holding related entities, references unless expanded.
+
+    Returns
+    -------
+    Callable
+        A dependency returning the ``include`` spec, or raising a 422 for an
+        unknown field or relation.
+    """
+    relations = tuple(relations)
+
+    def select(fields: str | None, expand: str | None) -> Mapping[str, Any]:
+        try:
+            return select_fields(
+                response_model, _split(fields) or None, _split(expand), relations
+            )
+        except InvalidFieldSelectionError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+            )
+
+    fields_query = Query(
+        None,
+        description="Comma separated fields to return, e.g. ``id,name``.",
+    )
+
+    if not relations:
+
+        def selection(fields: str | None = fields_query) -> Mapping[str, Any]:
+            return select(fields, None)
+
+        return selection
+
+    def selection_with_relations(
+        fields: str | None = fields_query,
+        expand: str | None = Query(
+            None,
+            description=(
+                "Comma separated related entities to return in full instead of "
+                f"their id: {', '.join(relations)}."
+            ),
+        ),
+    ) -> Mapping[str, Any]:
+        return select(fields, expand)
+
+    return selection_with_relations
@@ -0,0 +1,65 @@
+"""
+HTTP validation caching: ETags, ``If-None-Match`` and ``Cache-Control``.
+"""
+
+from fastapi import Request, Response
+from starlette import status
+
+
+def make_etag(
+    catalog: str, version: int, *parts: object, variant: str | None = None
+) -> str:
+    """
+    Build a strong ETag from a catalog version and what identifies the resource.
+
+    Parameters
+    ----------
+    catalog : str
+        The catalog the resource belongs to.
+    version : int
+        The current version of the catalog.
+    *parts : object
+        Identify the resource within the catalog (e.g. its id).
+    variant : str, optional
+        Identifies the representation, e.g. a field selection
+        (:func:`app.core.fieldsets.selection_tag`).
+
+    Returns
+    -------
+    str
+        e.g. ``"scenarios-v3"`` or ``"scenarios-1c2...-v3-9f86d081"``, quoted.
+    """
+    tag = "-".join(str(part) for part in (catalog, *parts, f"v{version}"))
+    if variant:
+        tag = f"{tag}-{variant}"
+    return f'"{tag}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether the ``If-None-Match`` header of the request matches ``etag``.
+
+    Uses the weak comparison mandated for ``If-None-Match`` (RFC 9110 13.1.2), so
+    a ``W/`` prefix added by a proxy does not prevent a match.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def cache_headers(etag: str, max_age: int) -> dict:
+    """The validation and freshness headers of a cacheable response."""
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+
+def not_modified(etag: str, max_age: int) -> Response:
+    """A ``304 Not Modified`` response carrying the cache headers again."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, max_age)
+    )
@@ -0,0 +1,250 @@
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Tuple
+
+import requests
+
+from app.core.metrics import LLM_BATCH_MAX_SIZE, LLM_BATCH_SIZE, LLM_BATCHING_SUPPORTED
+
+logger = logging.getLogger(__name__)
+
+BatchKey = Tuple[float, int]
+
+
+class BatchingUnsupportedError(Exception):
+    """Raised when the completion server rejects multi-prompt requests."""
+
+
+# Fields of a completion response that count the whole batch.
+SHARED_FIELDS = ("usage", "tokens_cached")
+SHARED_TIMINGS = ("prompt_n", "prompt_ms", "predicted_n", "predicted_ms")
+
+
+def _part(value: Any, index: int, size: int) -> Any:
+    """
+    The part of a count reported for a whole batch that goes to its ``index``-th
+    prompt: integers are split so that the parts add up to the total, floats
+    evenly and dicts key by key.
+    """
+    if isinstance(value, dict):
+        return {key: _part(item, index, size) for key, item in value.items()}
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value // size + (index < value % size)
+    if isinstance(value, float):
+        return value / size
+    return value
+
+
+def _share(body: dict, index: int, size: int) -> dict:
+    """Return the response body of the ``index``-th prompt of a batch."""
+    shared = dict(body)
+    for field in SHARED_FIELDS:
+        if field in body:
+            shared[field] = _part(body[field], index, size)
+
+    timings = body.get("timings")
+    if isinstance(timings, dict):
+        shared["timings"] = {
+            key: _part(value, index, size) if key in SHARED_TIMINGS else value
+            for key, value in timings.items()
+        }
+    return shared
+
+
+class _Batch:
+    """Prompts sharing the same sampling parameters, sent in one request."""
+
+    def __init__(self, key: BatchKey) -> None:
+        self.key = key
+        self.prompts: List[str] = []
+        self.futures: List[Future] = []
+        self.closed = threading.Event()
+
+    def add(self, prompt: str) -> Future:
+        future: Future = Future()
+        self.prompts.append(prompt)
+        self.futures.append(future)
+        return future
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+
+class LlamaBatcher:
+    """
+    Collects concurrent completion calls into multi-prompt requests.
+
+    The first caller of a batch becomes its leader: it waits up to ``linger_ms``
+    for other callers with the same sampling parameters (or until ``max_batch_size``
+    prompts are collected), sends one completion request with a list of prompts and
+    fans the choices back out to every waiting caller. ``options`` are extra fields
+    added to every request payload.
+
+    Every caller gets a response body of its own, shaped like the answer to a
+    single-prompt request. Token counts and timings the server only reports for
+    the whole batch are shared among its prompts.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        model: str,
+        max_batch_size: int,
+        linger_ms: float,
+        post: Callable[..., requests.Response] | None = None,
+        options: Dict[str, object] | None = None,
+    ) -> None:
+        self.api_url = api_url
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.linger = linger_ms / 1000
+        self.supported = True
+        self.options = options or {}
+        self._post = post
+        self._lock = threading.Lock()
+        self._open: Dict[BatchKey, _Batch] = {}
+        self._batches_total = 0
+        self._prompts_total = 0
+        self._batch_sizes: Counter = Counter()
+        LLM_BATCH_MAX_SIZE.set(max_batch_size)
+        LLM_BATCHING_SUPPORTED.set(1)
+
+    def submit(self, prompt: str, temperature: float, max_tokens: int) -> dict:
+        """
+        Queue a prompt and block until its completion is available.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt text.
+        temperature : float
+            Sampling temperature, only prompts with equal parameters share a batch.
+        max_tokens : int
+            Maximum number of tokens to generate.
+
+        Returns
+        -------
+        dict
+            The completion response for this prompt, with a single choice.
+
+        Raises
+        ------
+        BatchingUnsupportedError
+            If the server does not accept multi-prompt requests; the caller should
+            fall back to a single-prompt request.
+        """
+        key = (temperature, max_tokens)
+
+        with self._lock:
+            batch = self._open.get(key)
+            leader = batch is None
+            if batch is None:
+                batch = self._open[key] = _Batch(key)
+            future = batch.add(prompt)
+            if len(batch) >= self.max_batch_size:
+                self._close(batch)
+
+        if leader:
+            batch.closed.wait(self.linger)
+            with self._lock:
+                self._close(batch)
+            self._dispatch(batch)
+
+        return future.result()
+
+    def stats(self) -> dict:
+        """
+        Return batch fill statistics.
+
+        Returns
+        -------
+        dict
+            Number of batches and prompts sent, average batch size, fill ratio
+            against ``max_batch_size`` and the distribution of batch sizes.
+        """
+        with self._lock:
+            batches = self._batches_total
+            prompts = self._prompts_total
+            sizes = dict(sorted(self._batch_sizes.items()))
+
+        average = prompts / batches if batches else 0.0
+        return {
+            "supported": self.supported,
+            "max_batch_size": self.max_batch_size,
+            "linger_ms": self.linger * 1000,
+            "batches_total": batches,
+            "prompts_total": prompts,
+            "average_batch_size": round(average, 3),
+            "fill_ratio": round(average / self.max_batch_size, 3),
+            "batch_sizes": sizes,
+        }
+
+    def _close(self, batch: _Batch) -> None:
+        if self._open.get(batch.key) is batch:
+            del self._open[batch.key]
+        batch.closed.set()
+
+    def _dispatch(self, batch: _Batch) -> None:
+        temperature, max_tokens = batch.key
+        payload = {
+            "model": self.model,
+            "prompt": batch.prompts if len(batch) > 1 else batch.prompts[0],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            **self.options,
+        }
+
+        try:
+            bodies = self._send(payload, len(batch))
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+
+        with self._lock:
+            self._batches_total += 1
+            self._prompts_total += len(batch)
+            self._batch_sizes[len(batch)] += 1
+        LLM_BATCH_SIZE.observe(len(batch))
+
+        logger.debug(
+            "Sent LLaMA batch of %d/%d prompts", len(batch), self.max_batch_size
+        )
+
+        for future, body in zip(batch.futures, bodies):
+            future.set_result(body)
+
+    def _send(self, payload: dict, size: int) -> List[dict]:
+        post = self._post or requests.post
+        response = post(self.api_url, json=payload)
+
+        if size > 1 and response.status_code in (400, 404, 422):
+            self._disable(f"HTTP {response.status_code}")
+            raise BatchingUnsupportedError(self.api_url)
+
+        response.raise_for_status()
+        body = response.json()
+        choices = body.get("choices", [{}])
+
+        if size > 1 and len(choices) != size:
+            self._disable(f"{len(choices)} choices for {size} prompts")
+            raise BatchingUnsupportedError(self.api_url)
+
+        choices = sorted(choices, key=lambda choice: choice.get("index", 0))
+        return [
+            {
+                **_share(body, index, size),
+                "choices": [{**choice, "index": 0}],
+            }
+            for index, choice in enumerate(choices)
+        ]
+
+    def _disable(self, reason: str) -> None:
+        if self.supported:
+            logger.warning(
+                "Disabling LLaMA request batching for %s: %s", self.api_url, reason
+            )
+        self.supported = False
+        LLM_BATCHING_SUPPORTED.set(0)
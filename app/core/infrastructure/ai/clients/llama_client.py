@@ -1,19 +1,96 @@
+import logging
 import os
 
 import requests
 
+from app.core.infrastructure.ai.clients.llama_batcher import (
+    BatchingUnsupportedError,
+    LlamaBatcher,
+)
+from app.core.infrastructure.ai.clients.llama_prompt_cache import (
+    PromptCacheStats,
+    SlotScheduler,
+)
+from app.core.metrics import record_llm_usage, track_llm_call
+
+logger = logging.getLogger(__name__)
+
 
 class LlamaClient:
     """Client for interacting with a locally hosted LLaMA API."""
 
-    def __init__(self, model: str | None = None, api_url: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        api_url: str | None = None,
+        batch_max_size: int | None = None,
+        batch_linger_ms: float | None = None,
+        cache_prompt: bool | None = None,
+        slot_count: int | None = None,
+    ):
+        """
+        Initializes the LLaMA client.
+
+        Parameters
+        ----------
+        model : str, optional
+            The model to use (defaults to the LLM_MODEL environment variable).
+        api_url : str, optional
+            The completions endpoint (defaults to the LLAMA_API_URL environment
+            variable).
+        batch_max_size : int, optional
+            Maximum prompts sent in one completion request. Values above 1 enable
+            micro-batching of concurrent calls (defaults to LLAMA_BATCH_MAX_SIZE).
+        batch_linger_ms : float, optional
+            How long the first prompt of a batch waits for others (defaults to
+            LLAMA_BATCH_LINGER_MS).
+        cache_prompt : bool, optional
+            Ask the server to reuse the KV cache of the longest matching prompt
+            prefix (defaults to LLAMA_CACHE_PROMPT).
+        slot_count : int, optional
+            Number of server slots. When positive, requests are spread over the
+            slots, preferring an idle one whose cache holds their static prefix
+            (defaults to LLAMA_SLOT_COUNT, 0 lets the server choose).
+        """
         self.model = model or os.getenv("LLM_MODEL", "llama3")
         self.api_url = api_url or os.getenv(
             "LLAMA_API_URL", "http://localhost:11434/v1/completions"
         )
 
+        if batch_max_size is None:
+            batch_max_size = int(os.getenv("LLAMA_BATCH_MAX_SIZE", "1"))
+        if batch_linger_ms is None:
+            batch_linger_ms = float(os.getenv("LLAMA_BATCH_LINGER_MS", "10"))
+
+        self.cache_prompt = (
+            cache_prompt
+            if cache_prompt is not None
+            else os.getenv("LLAMA_CACHE_PROMPT", "true").lower() in ("1", "true")
+        )
+        self.slots = SlotScheduler(
+            slot_count
+            if slot_count is not None
+            else int(os.getenv("LLAMA_SLOT_COUNT", "0"))
+        )
+        self.prompt_cache = PromptCacheStats()
+
+        self.batcher: LlamaBatcher | None = None
+        if batch_max_size > 1:
+            self.batcher = LlamaBatcher(
+                api_url=self.api_url,
+                model=self.model,
+                max_batch_size=batch_max_size,
+                linger_ms=batch_linger_ms,
+                options={"cache_prompt": self.cache_prompt},
+            )
+
+    @track_llm_call("llama")
     def generate_text(
-        self, prompt: str, temperature: float = 0.7, max_tokens: int = 1000
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        prefix: str | None = None,
     ) -> str:
         """
         Generates text using a LLaMA-based model.
@@ -26,6 +103,9 @@ class LlamaClient:
             Controls randomness (0 = deterministic, 1 = highly random).
         max_tokens : int
             Maximum number of tokens to generate.
+        prefix : str, optional
+            The static start of ``prompt`` shared with other requests, used to
+            prefer a server slot that already cached it.
 
         Returns:
         -------
@@ -33,14 +113,43 @@ class LlamaClient:
             Generated text.
         """
 
+        body = None
+        if self.batcher is not None and self.batcher.supported:
+            try:
+                body = self.batcher.submit(prompt, temperature, max_tokens)
+            except BatchingUnsupportedError:
+                pass
+
+        slot = None
+        if body is None:
+            with self.slots.slot(prefix) as slot:
+                body = self._complete(prompt, temperature, max_tokens, slot)
+
+        self.prompt_cache.record(body)
+        record_llm_usage("llama", body.get("usage"), body.get("tokens_cached"))
+        logger.debug(
+            "LLaMA prompt evaluated in %s ms (slot %s, %s tokens cached)",
+            (body.get("timings") or {}).get("prompt_ms"),
+            slot,
+            body.get("tokens_cached"),
+        )
+
+        return body.get("choices", [{}])[0].get("text", "").strip()
+
+    def _complete(
+        self, prompt: str, temperature: float, max_tokens: int, slot: int | None
+    ) -> dict:
+        """Send a single-prompt completion request and return its response body."""
         payload = {
             "model": self.model,
             "prompt": prompt,
             "temperature": temperature,
             "max_tokens": max_tokens,
+            "cache_prompt": self.cache_prompt,
         }
+        if slot is not None:
+            payload["id_slot"] = slot
 
         response = requests.post(self.api_url, json=payload)
         response.raise_for_status()
-
-        return response.json().get("choices", [{}])[0].get("text", "").strip()
+        return response.json()
@@ -0,0 +1,166 @@
+import contextlib
+import itertools
+import threading
+from typing import Iterator, List
+
+from app.core.metrics import (
+    LLM_PROMPT_CACHE_TOKENS,
+    LLM_PROMPT_EVAL_SAVED_SECONDS,
+    LLM_PROMPT_EVAL_SECONDS,
+)
+
+
+class SlotScheduler:
+    """
+    Picks the server slot of each request, so that requests sharing a prompt
+    prefix reuse a slot whose KV cache holds it without queueing behind each
+    other on that slot.
+
+    A request goes to the slot with the fewest requests in flight from this
+    client; among those, to one that last served the same prefix, then to the
+    least recently used one.
+
+    Parameters
+    ----------
+    slot_count : int
+        Number of slots of the inference server, 0 or less lets it choose.
+    """
+
+    def __init__(self, slot_count: int) -> None:
+        self.slot_count = max(0, slot_count)
+        self._lock = threading.Lock()
+        self._in_flight = [0] * self.slot_count
+        self._prefixes: List[str | None] = [None] * self.slot_count
+        self._last_used = [0] * self.slot_count
+        self._ticks = itertools.count(1)
+
+    @contextlib.contextmanager
+    def slot(self, prefix: str | None) -> Iterator[int | None]:
+        """
+        Hold a slot for a request with the prompt prefix ``prefix``.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            The static part of the prompt.
+
+        Yields
+        ------
+        int or None
+            The slot id, or None when the server should choose.
+        """
+        if not self.slot_count or not prefix:
+            yield None
+            return
+
+        with self._lock:
+            slot = min(
+                range(self.slot_count),
+                key=lambda i: (
+                    self._in_flight[i],
+                    self._prefixes[i] != prefix,
+                    self._last_used[i],
+                ),
+            )
+            self._in_flight[slot] += 1
+            self._prefixes[slot] = prefix
+            self._last_used[slot] = next(self._ticks)
+
+        try:
+            yield slot
+        finally:
+            with self._lock:
+                self._in_flight[slot] -= 1
+
+
+class PromptCacheStats:
+    """
+    Accumulates prompt evaluation timings reported by a llama.cpp compatible server.
+
+    The server reports how many prompt tokens it evaluated and how long that took;
+    tokens served from its KV cache are skipped. The time saved is estimated from
+    the average evaluation cost per token.
+
+    Every recorded response is also added to the ``llm_prompt_cache_tokens_total``,
+    ``llm_prompt_eval_seconds_total`` and ``llm_prompt_eval_saved_seconds_total``
+    metrics.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.evaluated_tokens = 0
+        self.prompt_eval_ms = 0.0
+
+    def record(self, body: dict) -> None:
+        """
+        Record the timings of one completion response, if it has any.
+
+        Parameters
+        ----------
+        body : dict
+            The decoded JSON response of the completion endpoint.
+        """
+        timings = body.get("timings") or {}
+        usage = body.get("usage") or {}
+
+        evaluated = timings.get("prompt_n")
+        if evaluated is None:
+            return
+
+        prompt_tokens = usage.get("prompt_tokens")
+        cached = body.get("tokens_cached")
+        if cached is None:
+            cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached is None and prompt_tokens is not None:
+            cached = max(0, prompt_tokens - evaluated)
+        cached = cached or 0
+        prompt_ms = timings.get("prompt_ms", 0.0)
+
+        with self._lock:
+            self.requests += 1
+            self.evaluated_tokens += evaluated
+            self.cached_tokens += cached
+            self.prompt_tokens += prompt_tokens or evaluated + cached
+            self.prompt_eval_ms += prompt_ms
+            per_token_ms = (
+                self.prompt_eval_ms / self.evaluated_tokens
+                if self.evaluated_tokens
+                else 0.0
+            )
+
+        LLM_PROMPT_CACHE_TOKENS.labels("cached").inc(cached)
+        LLM_PROMPT_CACHE_TOKENS.labels("evaluated").inc(evaluated)
+        LLM_PROMPT_EVAL_SECONDS.inc(prompt_ms / 1000)
+        LLM_PROMPT_EVAL_SAVED_SECONDS.inc(cached * per_token_ms / 1000)
+
+    def snapshot(self) -> dict:
+        """
+        Return the accumulated statistics.
+
+        Returns
+        -------
+        dict
+            Token counts, cache hit ratio, prompt evaluation time and the estimated
+            evaluation time saved by the cache, in milliseconds.
+        """
+        with self._lock:
+            per_token_ms = (
+                self.prompt_eval_ms / self.evaluated_tokens
+                if self.evaluated_tokens
+                else 0.0
+            )
+            return {
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_tokens": self.cached_tokens,
+                "hit_ratio": (
+                    round(self.cached_tokens / self.prompt_tokens, 3)
+                    if self.prompt_tokens
+                    else 0.0
+                ),
+                "prompt_eval_ms": round(self.prompt_eval_ms, 3),
+                "saved_ms_estimate": round(self.cached_tokens * per_token_ms, 3),
+            }
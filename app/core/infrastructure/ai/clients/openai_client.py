@@ -3,13 +3,20 @@ import os
 
 from openai import OpenAI, OpenAIError
 
+from app.core.metrics import record_llm_usage, track_llm_call
+
 logger = logging.getLogger(__name__)
 
 
 class OpenAIClient:
     """Client for interacting with OpenAI's API."""
 
-    def __init__(self, model: str | None = None, api_key: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        api_key: str | None = None,
+        base_url: str | None = None,
+    ):
         """
         Initializes the OpenAI client.
 
@@ -19,9 +26,13 @@ class OpenAIClient:
             The OpenAI model to use (default: "gpt-4").
         api_key : Optional[str]
             The API key for OpenAI (defaults to environment variable).
+        base_url : Optional[str]
+            An OpenAI compatible endpoint, e.g. a local fake server for load tests
+            (defaults to the OPENAI_BASE_URL environment variable, then OpenAI).
         """
         self.model = model or os.getenv("LLM_MODEL", "gpt-4")
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
 
         if not self.api_key:
             raise ValueError(
@@ -29,7 +40,7 @@ class OpenAIClient:
                 explicitly."""
             )
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
 
     def generate_text(
         self, prompt: str, temperature: float = 0.7, max_tokens: int = 500
@@ -53,12 +64,16 @@ class OpenAIClient:
         """
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            with track_llm_call("chatgpt"):
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+
+            if response.usage is not None:
+                record_llm_usage("chatgpt", response.usage.model_dump())
 
             content = response.choices[0].message.content
             if not content:
@@ -67,5 +82,5 @@ class OpenAIClient:
             return content.strip()
 
         except OpenAIError as e:
-            logger.error(f"OpenAI API Error: {e}")
+            logger.error("OpenAI API Error: %s", e)
             return "An error occurred while generating the story."
@@ -1,10 +1,12 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from app.core.ids import uuid7
+
 
 class BaseModel(DeclarativeBase):
     """Base model for all models in the application."""
 
     __abstract__ = True
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
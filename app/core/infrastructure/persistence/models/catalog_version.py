@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.infrastructure.persistence.models.base import BaseModel
+
+
+class CatalogVersion(BaseModel):
+    """Version counter of a catalog (scenarios, characters), bumped on every change."""
+
+    __tablename__ = "catalog_versions"
+
+    name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,87 @@
+"""
+Row to entity mapping for the read queries of the repositories.
+
+``select_entities(Model, Entity)`` selects the columns of the entity fields
+only, so the rows come back as plain tuples: no ORM instance is built nor
+tracked in the identity map. ``to_entity(Entity, row)`` then builds the entity
+without validating the values again; they come from typed columns written
+through the same entities.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel as Entity
+from sqlalchemy import Select, select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.infrastructure.persistence.models.base import BaseModel
+
+E = TypeVar("E", bound=Entity)
+
+
+@lru_cache(maxsize=None)
+def entity_columns(
+    model: Type[BaseModel], entity: Type[Entity]
+) -> Tuple[InstrumentedAttribute, ...]:
+    """
+    Return the column attributes of ``model`` holding the fields of ``entity``,
+    in the order of the fields.
+
+    Selecting the mapped attributes rather than the table columns keeps the
+    statement an ORM one, so the session still autoflushes before running it.
+
+    Raises
+    ------
+    ValueError
+        If a field of the entity has no column.
+    """
+    columns = model.__mapper__.column_attrs
+    missing = [name for name in entity.model_fields if name not in columns]
+    if missing:
+        raise ValueError(
+            f"{model.__name__} has no column for the {entity.__name__} fields: "
+            f"{', '.join(missing)}"
+        )
+    return tuple(getattr(model, name) for name in entity.model_fields)
+
+
+def select_entities(model: Type[BaseModel], entity: Type[Entity]) -> Select:
+    """Select the columns of the ``entity`` fields from the table of ``model``."""
+    return select(*entity_columns(model, entity))
+
+
+@lru_cache(maxsize=None)
+def _constructor(entity: Type[E]) -> Callable[[Sequence[Any]], E]:
+    fields = tuple(entity.model_fields)
+    if entity.__private_attributes__ or entity.model_config.get("extra") == "allow":
+        return lambda row: entity.model_construct(**dict(zip(fields, row)))
+
+    # What model_construct does for a complete set of fields, minus the defaults
+    # and aliases handling.
+    new = entity.__new__
+    set_attribute = object.__setattr__
+
+    def construct(row: Sequence[Any]) -> E:
+        instance = new(entity)
+        set_attribute(instance, "__dict__", dict(zip(fields, row)))
+        set_attribute(instance, "__pydantic_fields_set__", set(fields))
+        set_attribute(instance, "__pydantic_extra__", None)
+        set_attribute(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+def to_entity(entity: Type[E], row: Sequence[Any]) -> E:
+    """
+    Build an ``entity`` from a row of :func:`select_entities`, without validation.
+
+    Parameters
+    ----------
+    entity : type[Entity]
+        The entity class.
+    row : Sequence[Any]
+        The values of every field of the entity, in the order of its fields.
+    """
+    return _constructor(entity)(row)
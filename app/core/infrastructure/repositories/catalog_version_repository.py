@@ -0,0 +1,75 @@
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.ids import uuid7
+from app.core.infrastructure.persistence.models.catalog_version import (
+    CatalogVersion as CatalogVersionModel,
+)
+from app.core.replicas import read_only
+
+
+class CatalogVersionRepository:
+    """Reads and bumps the catalog version counters."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    @read_only
+    async def get(self, name: str) -> int:
+        """
+        Retrieve the version of a catalog.
+
+        Parameters
+        ----------
+        name : str
+            The catalog name.
+
+        Returns
+        -------
+        int
+            The version, 0 for a catalog that never changed.
+        """
+        result = await self.session.execute(
+            select(CatalogVersionModel.version).where(CatalogVersionModel.name == name)
+        )
+
+        return result.scalar_one_or_none() or 0
+
+    @read_only
+    async def get_all(self) -> Dict[str, int]:
+        """
+        Retrieve the version of every catalog.
+
+        Returns
+        -------
+        Dict[str, int]
+            The version by catalog name; catalogs never changed are missing.
+        """
+        result = await self.session.execute(
+            select(CatalogVersionModel.name, CatalogVersionModel.version)
+        )
+
+        return dict(result.all())
+
+    async def bump(self, name: str) -> None:
+        """
+        Increment the version of a catalog, creating its counter if needed.
+
+        The change is not committed, so that it is part of the transaction
+        changing the catalog.
+
+        Parameters
+        ----------
+        name : str
+            The catalog name.
+        """
+        statement = insert(CatalogVersionModel).values(id=uuid7(), name=name, version=1)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CatalogVersionModel.name],
+            set_={"version": CatalogVersionModel.__table__.c.version + 1},
+        )
+
+        await self.session.execute(statement)
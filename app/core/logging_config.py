@@ -0,0 +1,179 @@
+"""
+Non-blocking logging.
+
+Loggers only put records on a queue; a ``QueueListener`` thread formats them
+(as JSON lines by default) and writes them, so log I/O never runs on the event
+loop. High-volume loggers can be sampled and each logger can get its own level.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import traceback
+from datetime import UTC, datetime
+from typing import Any, Dict, Mapping
+
+from app.core.tracing import current_span
+
+# Attributes of every LogRecord; anything else was passed with ``extra``.
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "asctime",
+    "color_message",  # uvicorn's ANSI colored copy of the message
+}
+
+# Loggers that configure their own synchronous handlers.
+_THIRD_PARTY_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+# The running listener, None once stopped.
+_listener: logging.handlers.QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, ``extra`` fields included."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only a fraction of the records of the given loggers (and their
+    children). Warnings and errors are always kept.
+
+    Parameters
+    ----------
+    rates : Mapping[str, float]
+        Fraction of the records kept, by logger name.
+    """
+
+    def __init__(self, rates: Mapping[str, float]) -> None:
+        super().__init__()
+        self.rates = dict(rates)
+
+    def _rate(self, name: str) -> float:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        return random.random() < self._rate(record.name)
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps the record's arguments, exception and ``extra``
+    fields apart for the formatter, and tags the record with the current trace.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now: they may not be safe to format in another thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = "".join(traceback.format_exception(*record.exc_info))
+            record.exc_info = None
+
+        span = current_span()
+        if span is not None and span.sampled:
+            record.trace_id = f"{span.trace_id:032x}"
+        return record
+
+
+def configure_logging(
+    level: str = "INFO",
+    levels: Mapping[str, str] | None = None,
+    log_format: str = "json",
+    sample_rates: Mapping[str, float] | None = None,
+) -> logging.handlers.QueueListener:
+    """
+    Route every log record through a queue to a background writer thread.
+
+    Replaces the handlers of the root logger (and uvicorn's), so calling it again
+    reconfigures logging.
+
+    Parameters
+    ----------
+    level : str
+        Level of the root logger.
+    levels : Mapping[str, str], optional
+        Level by logger name, e.g. ``{"sqlalchemy.engine": "INFO"}``.
+    log_format : str
+        ``json`` for JSON lines or ``text`` for the classic format.
+    sample_rates : Mapping[str, float], optional
+        Fraction of the records below WARNING kept, by logger name.
+
+    Returns
+    -------
+    QueueListener
+        The started listener. Stop it with :func:`stop_logging`, which also runs
+        at exit.
+    """
+    global _listener
+    stop_logging()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if log_format == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sample_rates or {}))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level.upper())
+
+    for name in _THIRD_PARTY_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = True
+
+    for name, logger_level in (levels or {}).items():
+        logging.getLogger(name).setLevel(logger_level.upper())
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    _listener = listener
+    return listener
+
+
+@atexit.register
+def stop_logging() -> None:
+    """Write the records still queued and stop the writer thread, if running."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
@@ -0,0 +1,490 @@
+"""
+In-process metrics exposed in the Prometheus text format.
+
+Writers never take a lock: each thread (the event loop and every
+``asyncio.to_thread`` worker running a story generator) updates its own shard of
+a series, and a scrape sums the shards. A scrape may miss an update that is in
+progress, never a completed one.
+"""
+
+import bisect
+import contextlib
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+from app.core.tracing import set_span_attributes, tracer
+from app.core.usage import record_call, record_tokens
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LLM_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+DB_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isfinite(value) and value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+class _Shards:
+    """Per-thread ``[float] * size`` slots of a single labelled series."""
+
+    __slots__ = ("_size", "_shards")
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._shards: Dict[int, List[float]] = {}
+
+    def local(self) -> List[float]:
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            shard = self._shards.setdefault(ident, [0.0] * self._size)
+        return shard
+
+    def totals(self) -> List[float]:
+        totals = [0.0] * self._size
+        for shard in list(self._shards.values()):
+            for index, value in enumerate(shard):
+                totals[index] += value
+        return totals
+
+
+class CounterChild:
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented.")
+        self._shards.local()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.totals()[0]
+
+
+class GaugeChild:
+    __slots__ = ("_value", "_function")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from ``function`` at scrape time instead."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._value
+
+
+class HistogramChild:
+    __slots__ = ("buckets", "_shards")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # One slot per bucket, one for +Inf and the sum of observations.
+        self._shards = _Shards(len(buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        shard = self._shards.local()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    @contextlib.contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the ``with`` block, in seconds."""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at)
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """Return the cumulative bucket counts, the count and the sum."""
+        totals = self._shards.totals()
+        cumulative, running = [], 0.0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, running, totals[-1]
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: object):
+        """Return the series of the given label values, creating it if needed."""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {key}."
+                )
+            child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _series(self) -> List[Tuple[Tuple[Tuple[str, str], ...], object]]:
+        return [
+            (tuple(zip(self.labelnames, key)), child)
+            for key, child in list(self._children.items())
+        ]
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for labels, child in self._series():
+            lines.extend(self._render_child(labels, child))
+        return lines
+
+    def _render_child(self, labels, child) -> List[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(child.value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def _render_child(self, labels, child) -> List[str]:
+        cumulative, count, total = child.snapshot()
+        lines = []
+        for bound, value in zip(self.buckets + (math.inf,), cumulative):
+            bucket_labels = labels + (("le", _format_value(bound)),)
+            lines.append(
+                f"{self.name}_bucket{_format_labels(bucket_labels)} "
+                f"{_format_value(value)}"
+            )
+        lines.append(
+            f"{self.name}_count{_format_labels(labels)} {_format_value(count)}"
+        )
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+        return lines
+
+
+class MetricsRegistry:
+    """A named collection of metrics rendered together on scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format (0.0.4).
+
+        Returns
+        -------
+        str
+            The scrape body.
+        """
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+HTTP_COMPRESSION_INPUT_BYTES = REGISTRY.counter(
+    "http_compression_input_bytes_total",
+    "Response bytes handed to the compressor, by content encoding.",
+    ("encoding",),
+)
+HTTP_COMPRESSION_OUTPUT_BYTES = REGISTRY.counter(
+    "http_compression_output_bytes_total",
+    "Compressed response bytes sent, by content encoding.",
+    ("encoding",),
+)
+HTTP_COMPRESSION_SECONDS = REGISTRY.counter(
+    "http_compression_seconds_total",
+    "Time spent compressing responses, by content encoding.",
+    ("encoding",),
+)
+
+LLM_REQUEST_DURATION = REGISTRY.histogram(
+    "llm_request_duration_seconds",
+    "Latency of the calls to the LLM backing each story generator.",
+    ("generator",),
+    buckets=LLM_BUCKETS,
+)
+LLM_TOKENS = REGISTRY.counter(
+    "llm_tokens_total",
+    "Tokens reported by the LLM, by kind (prompt, cached or completion).",
+    ("generator", "kind"),
+)
+LLM_PROMPT_TOKENS = REGISTRY.histogram(
+    "llm_prompt_tokens",
+    "Prompt size of each LLM call, to catch prompts growing over time.",
+    ("generator",),
+    buckets=(64, 128, 256, 512, 1024, 2048, 4096, 8192),
+)
+LLM_ERRORS = REGISTRY.counter(
+    "llm_errors_total",
+    "Failed calls to the LLM backing each story generator.",
+    ("generator",),
+)
+LLM_BATCH_SIZE = REGISTRY.histogram(
+    "llm_batch_size",
+    "Prompts sent in each LLaMA completion request when micro-batching.",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+LLM_BATCH_MAX_SIZE = REGISTRY.gauge(
+    "llm_batch_max_size",
+    "Prompts a LLaMA batch may hold, the fill ratio is the mean batch size over it.",
+)
+LLM_BATCHING_SUPPORTED = REGISTRY.gauge(
+    "llm_batching_supported",
+    "1 while LLaMA calls are batched, 0 once the server rejected a batch.",
+)
+LLM_PROMPT_CACHE_TOKENS = REGISTRY.counter(
+    "llm_prompt_cache_tokens_total",
+    "Prompt tokens the LLaMA server took from its KV cache (cached) or evaluated.",
+    ("kind",),
+)
+LLM_PROMPT_EVAL_SECONDS = REGISTRY.counter(
+    "llm_prompt_eval_seconds_total",
+    "Time the LLaMA server spent evaluating prompts.",
+)
+LLM_PROMPT_EVAL_SAVED_SECONDS = REGISTRY.counter(
+    "llm_prompt_eval_saved_seconds_total",
+    "Estimated prompt evaluation time saved by the LLaMA KV cache.",
+)
+
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time by operation.",
+    ("operation",),
+    buckets=DB_BUCKETS,
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool.",
+    buckets=DB_BUCKETS,
+)
+DB_POOL_CONNECTIONS = REGISTRY.gauge(
+    "db_pool_connections",
+    "Connections of the pool by state (checked_out, idle or overflow).",
+    ("state",),
+)
+DB_REPLICA_LAG = REGISTRY.gauge(
+    "db_replica_lag_seconds",
+    "Replay lag of each read replica at its last check.",
+    ("replica",),
+)
+DB_REPLICA_HEALTHY = REGISTRY.gauge(
+    "db_replica_healthy",
+    "1 while a read replica is in rotation, 0 while it is lagging or unreachable.",
+    ("replica",),
+)
+
+PASSWORD_HASH_DURATION = REGISTRY.histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying passwords with bcrypt.",
+    ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+
+@contextlib.contextmanager
+def track_llm_call(generator: str) -> Iterator[None]:
+    """
+    Record the latency of an LLM call and count it as an error if it raises.
+
+    The call is also added to the token usage collected for the current request,
+    and traced as an ``llm.call`` span.
+
+    Parameters
+    ----------
+    generator : str
+        The story generator backend (llama, chatgpt).
+    """
+    with tracer.span("llm.call", {"llm.backend": generator}, kind="CLIENT"):
+        started_at = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            LLM_ERRORS.labels(generator).inc()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            LLM_REQUEST_DURATION.labels(generator).observe(elapsed)
+            record_call(elapsed)
+
+
+def record_llm_usage(
+    generator: str, usage: object, cached_tokens: int | None = None
+) -> None:
+    """
+    Count the tokens of an OpenAI style ``usage`` object, if the server sent one,
+    and add them to the token usage collected for the current request.
+
+    Parameters
+    ----------
+    generator : str
+        The story generator backend (llama, chatgpt).
+    usage : dict
+        ``prompt_tokens``, ``completion_tokens`` and optionally
+        ``prompt_tokens_details.cached_tokens``.
+    cached_tokens : int, optional
+        Cached prompt tokens reported outside of ``usage`` (llama.cpp sends
+        ``tokens_cached``).
+    """
+    if not isinstance(usage, dict):
+        return
+
+    details = usage.get("prompt_tokens_details")
+    if cached_tokens is None and isinstance(details, dict):
+        cached_tokens = details.get("cached_tokens")
+
+    prompt = int(usage.get("prompt_tokens") or 0)
+    cached = int(cached_tokens or 0)
+    completion = int(usage.get("completion_tokens") or 0)
+
+    for kind, count in (
+        ("prompt", prompt),
+        ("cached", cached),
+        ("completion", completion),
+    ):
+        if count:
+            LLM_TOKENS.labels(generator, kind).inc(count)
+    if prompt:
+        LLM_PROMPT_TOKENS.labels(generator).observe(prompt)
+
+    record_tokens(prompt, cached, completion)
+    set_span_attributes(
+        {
+            "llm.usage.prompt_tokens": prompt,
+            "llm.usage.cached_tokens": cached,
+            "llm.usage.completion_tokens": completion,
+        }
+    )
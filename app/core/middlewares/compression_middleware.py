@@ -0,0 +1,161 @@
+import logging
+from typing import Mapping, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import (
+    MeteredCompressor,
+    negotiate_encoding,
+    supported_encodings,
+)
+
+logger = logging.getLogger(__name__)
+
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+
+def _is_compressible(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class CompressionMiddleware:
+    """
+    Compresses text and JSON responses with the best encoding the client accepts
+    (``Accept-Encoding`` q-values, then the server preference).
+
+    Bodies smaller than ``minimum_size`` are sent as is. Streamed bodies are
+    always compressed, and every chunk sent by the application is flushed, so a
+    client reading an NDJSON or event stream gets each line as soon as it is
+    produced. Compressed responses get a weak ``ETag``, since the bytes differ
+    from the identity representation.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("zstd", "br", "gzip"),
+        minimum_size: int = 1024,
+        levels: Mapping[str, int] | None = None,
+    ) -> None:
+        self.app = app
+        supported = supported_encodings()
+        missing = [encoding for encoding in encodings if encoding not in supported]
+        if missing:
+            logger.info(
+                "Content encodings %s are disabled: their package is not installed",
+                ", ".join(missing),
+            )
+        self.encodings = [encoding for encoding in encodings if encoding in supported]
+        self.minimum_size = minimum_size
+        self.levels = dict(levels or {})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        responder = _CompressionResponder(
+            send, encoding, self.minimum_size, self.levels.get(encoding or "")
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Holds the response start until the first body chunk shows its size."""
+
+    def __init__(
+        self, send: Send, encoding: str | None, minimum_size: int, level: int | None
+    ) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._level = level
+        self._start: Message | None = None
+        self._compressor: MeteredCompressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            self._start = message
+        elif self._compressor is not None:
+            await self._send_compressed(message)
+        elif message["type"] == "http.response.body" and self._start is not None:
+            await self._send_first_body(self._start, message)
+        else:
+            self._passthrough = True
+            if self._start is not None:
+                await self._send(self._start)
+            await self._send(message)
+
+    async def _send_first_body(self, start: Message, message: Message) -> None:
+        headers = MutableHeaders(scope=start)
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        compressible = "content-encoding" not in headers and _is_compressible(
+            headers.get("content-type")
+        )
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+
+        if (
+            not compressible
+            or self._encoding is None
+            or (not more_body and len(body) < max(self._minimum_size, 1))
+        ):
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+
+        self._compressor = MeteredCompressor(self._encoding, self._level)
+        headers["Content-Encoding"] = self._encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        compressed = self._compressor.compress(
+            body, flush=more_body, finish=not more_body
+        )
+        if more_body:
+            if "content-length" in headers:
+                del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(compressed))
+
+        await self._send(start)
+        await self._send(
+            {"type": "http.response.body", "body": compressed, "more_body": more_body}
+        )
+
+    async def _send_compressed(self, message: Message) -> None:
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        compressed = self._compressor.compress(
+            message.get("body", b""), flush=more_body, finish=not more_body
+        )
+        await self._send(
+            {"type": "http.response.body", "body": compressed, "more_body": more_body}
+        )
@@ -0,0 +1,60 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.timing import time_request
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """
+    Times every request, adds the recorded phases as a ``Server-Timing`` header
+    and logs the requests slower than ``slow_request_ms``.
+
+    The header is written when the response starts, so the phases of a streamed
+    body only show up in the slow request log.
+    """
+
+    def __init__(self, app: ASGIApp, slow_request_ms: float = 1000.0) -> None:
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        with time_request() as timer:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timer.server_timing())
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                elapsed_ms = timer.elapsed * 1000
+                if elapsed_ms >= self.slow_request_ms:
+                    route = getattr(scope.get("route"), "path", scope["path"])
+                    logger.warning(
+                        "Slow request %s %s took %.1f ms: %s",
+                        scope["method"],
+                        route,
+                        elapsed_ms,
+                        timer.as_dict(),
+                        extra={
+                            "method": scope["method"],
+                            "route": route,
+                            "status": status_code,
+                            "duration_ms": round(elapsed_ms, 1),
+                            "phases_ms": timer.as_dict(),
+                        },
+                    )
@@ -0,0 +1,45 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.tracing import tracer
+
+
+class TracingMiddleware:
+    """
+    Opens a server span around every request, continuing the trace of an incoming
+    W3C ``traceparent`` header, and returns the trace in a ``traceparent`` header.
+
+    The span is named after the route template once the router has matched it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = Headers(scope=scope).get("traceparent")
+        attributes = {"http.method": scope["method"], "http.target": scope["path"]}
+
+        with tracer.span(
+            scope["method"], attributes, kind="SERVER", traceparent=traceparent
+        ) as span:
+
+            async def send_with_trace(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    message.setdefault("headers", [])
+                    message["headers"].append(
+                        (b"traceparent", span.traceparent.encode("latin-1"))
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    span.name = f"{scope['method']} {route}"
+                    span.set_attribute("http.route", route)
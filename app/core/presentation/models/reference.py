@@ -0,0 +1,9 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class EntityReference(BaseModel):
+    """A related entity that was not expanded, only its id."""
+
+    id: UUID
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Query, Request, status
+
+from app.auth.application.decorators.auth_decorator import require_admin
+from app.core.query_stats import OrderBy, QueryStatsReport, query_stats
+
+router = APIRouter()
+
+ADMIN_RESPONSES = {
+    401: {"description": "Unauthorized - Invalid or missing token"},
+    403: {"description": "Forbidden - Not an administrator"},
+}
+
+
+@router.get(
+    "/queries",
+    response_model=QueryStatsReport,
+    responses=ADMIN_RESPONSES,
+    openapi_extra={"security": [{"bearerAuth": []}]},
+)
+@require_admin
+async def get_query_stats(
+    request: Request,
+    limit: int = Query(20, ge=1, le=500),
+    order_by: OrderBy = Query("total"),
+):
+    """
+    Return the statements with the highest total (or mean, max...) execution time
+    since startup or the last reset.
+
+    Parameters
+    ----------
+    request : Request
+        The FastAPI request object containing user state
+    limit : int
+        Number of statements returned.
+    order_by : {"total", "mean", "max", "calls", "rows"}
+        The statistic to sort by.
+
+    Returns
+    -------
+    QueryStatsReport
+        The statement fingerprints with their calls, total, mean and max time in
+        milliseconds and rows.
+    """
+    return QueryStatsReport(
+        statements=query_stats.top(limit, order_by), dropped=query_stats.dropped
+    )
+
+
+@router.delete(
+    "/queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses=ADMIN_RESPONSES,
+    openapi_extra={"security": [{"bearerAuth": []}]},
+)
+@require_admin
+async def reset_query_stats(request: Request):
+    """Clear the query statistics, e.g. before a load test."""
+    query_stats.reset()
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import REGISTRY
+
+router = APIRouter()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """
+    Expose the application metrics in the Prometheus text format.
+
+    Returns
+    -------
+    PlainTextResponse
+        Request latency per route, LLM latency, tokens and errors per generator,
+        database query and pool metrics and password hashing time.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
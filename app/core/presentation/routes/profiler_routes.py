@@ -0,0 +1,74 @@
+import asyncio
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.auth.application.decorators.auth_decorator import require_admin
+from app.core.dependencies import get_profiler
+from app.core.exceptions.profiler_exceptions import ProfilerBusyError
+from app.core.profiler import SamplingProfiler
+
+router = APIRouter()
+
+
+@router.get(
+    "/profile",
+    responses={
+        200: {"description": "Collapsed stacks or a speedscope document"},
+        401: {"description": "Unauthorized - Invalid or missing token"},
+        403: {"description": "Forbidden - Not an administrator"},
+        409: {"description": "Conflict - A profile is already running"},
+    },
+    openapi_extra={"security": [{"bearerAuth": []}]},
+)
+@require_admin
+async def profile(
+    request: Request,
+    seconds: float = Query(10.0, gt=0),
+    interval_ms: float = Query(10.0, ge=1),
+    format: Literal["collapsed", "speedscope"] = Query("collapsed"),
+    sampling_profiler: SamplingProfiler = Depends(get_profiler),
+):
+    """
+    Sample the stacks of every thread of this worker for ``seconds`` and return
+    them as a flame graph profile.
+
+    Parameters
+    ----------
+    request : Request
+        The FastAPI request object containing user state
+    seconds : float
+        Duration of the profile, capped at PROFILER_MAX_SECONDS.
+    interval_ms : float
+        Milliseconds between two samples.
+    format : {"collapsed", "speedscope"}
+        Collapsed stacks (``flamegraph.pl``, speedscope) or a speedscope document.
+    sampling_profiler : SamplingProfiler
+        The process-wide profiler, injected via dependency
+
+    Returns
+    -------
+    PlainTextResponse or JSONResponse
+        The profile.
+
+    Raises
+    ------
+    HTTPException
+        409 if another profile is running
+    """
+    try:
+        # The sampler sleeps between samples; running it in a worker thread keeps
+        # the event loop (and the requests being profiled) going.
+        result = await asyncio.to_thread(
+            sampling_profiler.profile, seconds, interval_ms / 1000
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    if format == "speedscope":
+        return JSONResponse(
+            result.to_speedscope(),
+            headers={"Content-Disposition": 'attachment; filename="profile.json"'},
+        )
+    return PlainTextResponse(result.to_collapsed())
@@ -0,0 +1,182 @@
+"""
+Sampling profiler for the live process.
+
+A sampler thread reads the stack of every other thread (the event loop, the
+``asyncio.to_thread`` workers running the story generators...) every
+``interval`` seconds with ``sys._current_frames``. Nothing is hooked into the
+interpreter, so the overhead is bounded by the sampling rate and stops with the
+profile. Only one profile runs at a time.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, List, Tuple
+
+from app.core.exceptions.profiler_exceptions import ProfilerBusyError
+from app.core.settings.config import settings
+
+Frame = Tuple[str, str, int]
+Stack = Tuple[Frame, ...]
+
+
+class Profile:
+    """The stacks sampled during one profile and how many times each was seen."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.duration = 0.0
+        self.samples = 0
+        self.stacks: Counter[Tuple[str, Stack]] = Counter()
+
+    def to_collapsed(self) -> str:
+        """
+        Render the profile in the collapsed stack format used by ``flamegraph.pl``,
+        speedscope and most flame graph viewers.
+
+        Returns
+        -------
+        str
+            One ``thread;outer;...;inner count`` line per distinct stack.
+        """
+        lines = []
+        for (thread, stack), count in self.stacks.most_common():
+            frames = ";".join(f"{name} ({path}:{line})" for name, path, line in stack)
+            lines.append(f"{thread};{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def to_speedscope(self) -> dict:
+        """
+        Render the profile in the speedscope file format, one sampled profile per
+        thread.
+
+        Returns
+        -------
+        dict
+            The speedscope JSON document.
+        """
+        frame_index: Dict[Frame, int] = {}
+        frames: List[dict] = []
+        by_thread: Dict[str, Tuple[List[List[int]], List[int]]] = {}
+
+        for (thread, stack), count in self.stacks.items():
+            indexes = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    name, path, line = frame
+                    frames.append({"name": name, "file": path, "line": line})
+                indexes.append(frame_index[frame])
+
+            samples, weights = by_thread.setdefault(thread, ([], []))
+            samples.append(indexes)
+            weights.append(count)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": thread,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights) * self.interval,
+                    "samples": samples,
+                    "weights": [weight * self.interval for weight in weights],
+                }
+                for thread, (samples, weights) in by_thread.items()
+            ],
+            "name": f"{self.samples} samples over {self.duration:.1f}s",
+            "exporter": "story-narrator-api",
+        }
+
+
+def _stack(frame: FrameType | None) -> Stack:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_qualname, code.co_filename, frame.f_lineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of every thread of the process.
+
+    Parameters
+    ----------
+    max_seconds : float
+        Longest profile allowed.
+    min_interval : float
+        Shortest sampling interval allowed, bounding the overhead.
+    """
+
+    def __init__(self, max_seconds: float = 60.0, min_interval: float = 0.001) -> None:
+        self.max_seconds = max_seconds
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def profile(self, seconds: float, interval: float = 0.01) -> Profile:
+        """
+        Sample the process for ``seconds``, blocking the calling thread.
+
+        Parameters
+        ----------
+        seconds : float
+            Duration of the profile, capped at ``max_seconds``.
+        interval : float
+            Seconds between two samples, at least ``min_interval``.
+
+        Returns
+        -------
+        Profile
+            The sampled stacks.
+
+        Raises
+        ------
+        ProfilerBusyError
+            If a profile is already running.
+        """
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError()
+
+        try:
+            return self._sample(
+                min(seconds, self.max_seconds), max(interval, self.min_interval)
+            )
+        finally:
+            self._lock.release()
+
+    def _sample(self, seconds: float, interval: float) -> Profile:
+        profile = Profile(interval)
+        sampler = threading.get_ident()
+        started_at = time.perf_counter()
+        deadline = started_at + seconds
+
+        while True:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == sampler:
+                    continue
+                thread = names.get(ident, f"thread-{ident}")
+                profile.stacks[(thread, _stack(frame))] += 1
+            profile.samples += 1
+
+            if time.perf_counter() + interval > deadline:
+                break
+            time.sleep(interval)
+
+        profile.duration = time.perf_counter() - started_at
+        return profile
+
+
+profiler = SamplingProfiler(max_seconds=settings.PROFILER_MAX_SECONDS)
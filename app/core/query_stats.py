@@ -0,0 +1,173 @@
+"""
+Per-statement database statistics and the slow query log.
+
+Statements are grouped by fingerprint: the SQL with its literals and bind
+placeholders replaced by ``?`` and its ``IN`` lists collapsed, so the same query
+issued with different values (or a different number of ids) is counted once.
+Neither the parameters nor the literals are ever logged.
+"""
+
+import logging
+import re
+import threading
+from typing import Dict, List, Literal
+
+from pydantic import BaseModel, Field, computed_field
+
+from app.core.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+OrderBy = Literal["total", "mean", "max", "calls", "rows"]
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so that its executions with different values match.
+
+    Parameters
+    ----------
+    statement : str
+        The statement as sent to the driver.
+
+    Returns
+    -------
+    str
+        e.g. ``SELECT ... WHERE characters.id IN (?)`` for any number of ids.
+    """
+    statement = _STRING.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _LIST.sub("(?)", statement)
+    return _SPACE.sub(" ", statement).strip()
+
+
+class StatementStats(BaseModel):
+    """Aggregated executions of one statement fingerprint."""
+
+    fingerprint: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = Field(0, description="Rows returned or affected, when reported.")
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class QueryStats:
+    """
+    Collects the statistics of every statement and logs the slow ones.
+
+    Parameters
+    ----------
+    slow_query_ms : float
+        Statements slower than this are logged with a warning; 0 disables it.
+    max_statements : int
+        Distinct fingerprints kept; executions of new ones are only counted in
+        :attr:`dropped` once the limit is reached.
+    """
+
+    def __init__(self, slow_query_ms: float = 0.0, max_statements: int = 500) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.max_statements = max_statements
+        self.dropped = 0
+        self._statements: Dict[str, StatementStats] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float, rowcount: int = -1) -> None:
+        """
+        Add one execution of ``statement``.
+
+        Parameters
+        ----------
+        statement : str
+            The statement as sent to the driver.
+        seconds : float
+            Its execution time.
+        rowcount : int
+            Rows returned or affected, -1 when the driver does not know.
+        """
+        key = self._fingerprints.get(statement)
+        if key is None:
+            key = fingerprint(statement)
+            if len(self._fingerprints) < self.max_statements * 4:
+                self._fingerprints[statement] = key
+
+        elapsed_ms = seconds * 1000
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None and len(self._statements) >= self.max_statements:
+                self.dropped += 1
+            elif stats is None:
+                stats = self._statements[key] = StatementStats(fingerprint=key)
+
+            if stats is not None:
+                stats.calls += 1
+                stats.total_ms += elapsed_ms
+                stats.max_ms = max(stats.max_ms, elapsed_ms)
+                if rowcount > 0:
+                    stats.rows += rowcount
+
+        if self.slow_query_ms and elapsed_ms >= self.slow_query_ms:
+            logger.warning(
+                "Slow query took %.1f ms (%d rows): %s",
+                elapsed_ms,
+                rowcount,
+                key,
+                extra={
+                    "duration_ms": round(elapsed_ms, 1),
+                    "rowcount": rowcount,
+                    "fingerprint": key,
+                },
+            )
+
+    def top(self, limit: int = 20, order_by: OrderBy = "total") -> List[StatementStats]:
+        """
+        Return the ``limit`` statements with the highest ``order_by``.
+
+        Parameters
+        ----------
+        limit : int
+            Number of statements returned.
+        order_by : {"total", "mean", "max", "calls", "rows"}
+            The statistic to sort by, in descending order.
+        """
+        attribute = {
+            "total": "total_ms",
+            "mean": "mean_ms",
+            "max": "max_ms",
+            "calls": "calls",
+            "rows": "rows",
+        }[order_by]
+        with self._lock:
+            statements = [stats.model_copy() for stats in self._statements.values()]
+        statements.sort(key=lambda stats: getattr(stats, attribute), reverse=True)
+        return statements[:limit]
+
+    def reset(self) -> None:
+        """Forget every statement recorded so far."""
+        with self._lock:
+            self._statements.clear()
+            self.dropped = 0
+
+
+class QueryStatsReport(BaseModel):
+    """The top statements and the executions left out of the statistics."""
+
+    statements: List[StatementStats]
+    dropped: int = Field(
+        0, description="Executions not counted because too many statements are tracked."
+    )
+
+
+query_stats = QueryStats(slow_query_ms=settings.SLOW_QUERY_THRESHOLD_MS)
@@ -0,0 +1,202 @@
+"""
+Read replicas.
+
+Repository methods marked with :func:`read_only` run their queries on a
+replica, picked round-robin among the healthy ones when the session first
+reads, and kept until it closes, so the reads of a request see a single
+replica and agree with each other (a list and its count, a body and its
+version) even when replicas lag differently. Once a session writes
+(a flush or an INSERT/UPDATE/DELETE), it stays on the primary until it is
+closed, so a request always reads its own writes. A background check
+measures the replay lag of every replica and takes the ones lagging more than
+``max_lag`` out of rotation until they catch up; reads fall back to the primary
+when no replica is healthy.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+from functools import wraps
+from typing import Any, Awaitable, Callable, List, Sequence, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.metrics import DB_REPLICA_HEALTHY, DB_REPLICA_LAG
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds since the last replayed transaction, 0 when everything received is
+# replayed (an idle primary sends nothing) and on a server that is no replica.
+LAG_QUERY = text(
+    "SELECT COALESCE(CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+    "THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+    "END, 0)"
+)
+
+# Session.info keys.
+READ_ONLY = "read_only"
+WROTE = "wrote"
+
+
+class Replica:
+    """A replica engine and its last known health."""
+
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.healthy = True
+        self.lag: float | None = None
+
+
+class ReplicaSet:
+    """
+    The read replicas of the database, with their replay lag checked every
+    ``check_interval`` seconds.
+
+    Parameters
+    ----------
+    engines : Sequence[AsyncEngine]
+        One engine per replica.
+    max_lag : float
+        Seconds of replay lag above which a replica leaves the rotation.
+    check_interval : float
+        Seconds between two lag checks, also the timeout of a check.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        self.replicas: List[Replica] = [
+            Replica(str(index), engine) for index, engine in enumerate(engines)
+        ]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._next = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    def pick(self) -> AsyncEngine | None:
+        """Return the next healthy replica, or None when there is none."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._next) % len(healthy)].engine
+
+    async def lag(self, replica: Replica) -> float:
+        """Measure the replay lag of ``replica``, in seconds."""
+        async with replica.engine.connect() as conn:
+            return float((await conn.execute(LAG_QUERY)).scalar_one())
+
+    async def check(self) -> None:
+        """Measure every replica and update the rotation."""
+        for replica in self.replicas:
+            try:
+                lag = await asyncio.wait_for(self.lag(replica), self.check_interval)
+            except Exception as e:
+                lag = None
+                logger.warning("Replica %s lag check failed: %s", replica.name, e)
+
+            healthy = lag is not None and lag <= self.max_lag
+            if healthy != replica.healthy:
+                logger.warning(
+                    "Replica %s %s the rotation (lag: %s seconds)",
+                    replica.name,
+                    "back in" if healthy else "taken out of",
+                    "unknown" if lag is None else f"{lag:.1f}",
+                )
+            replica.healthy, replica.lag = healthy, lag
+
+            DB_REPLICA_HEALTHY.labels(replica.name).set(int(healthy))
+            if lag is not None:
+                DB_REPLICA_LAG.labels(replica.name).set(lag)
+
+    def start(self) -> None:
+        """Start checking the replicas periodically in the background."""
+        if self._task is None and self.replicas:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic checks."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def dispose(self) -> None:
+        """Stop the checks and close the replica engines."""
+        await self.stop()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+
+class RoutingSession(Session):
+    """
+    Session sending the SELECTs of :func:`read_only` methods to a replica, and
+    everything else, including every statement after a write, to the primary.
+
+    The replica is picked on the first read and kept until the session closes.
+
+    Parameters
+    ----------
+    replicas : ReplicaSet, optional
+        The replicas; without them every statement goes to the primary.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet | None = None, **kw: Any):
+        super().__init__(*args, **kw)
+        self.replicas = replicas
+        self.replica: AsyncEngine | None = None
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if self._flushing or (clause is not None and clause.is_dml):
+            self.info[WROTE] = True
+        elif (
+            self.replicas is not None
+            and self.info.get(READ_ONLY)
+            and not self.info.get(WROTE)
+            and isinstance(clause, Select)
+        ):
+            if self.replica is None:
+                self.replica = self.replicas.pick()
+            if self.replica is not None:
+                return self.replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def close(self) -> None:
+        super().close()
+        self.replica = None
+
+
+def read_only(
+    method: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """
+    Mark a repository method as read-only, so that its queries may run on a
+    replica. The repository must keep its session in ``self.session``.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> T:
+        info = self.session.info
+        previous = info.get(READ_ONLY, False)
+        info[READ_ONLY] = True
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            info[READ_ONLY] = previous
+
+    return wrapper
@@ -0,0 +1,131 @@
+"""
+Fast JSON responses.
+
+``default_response_class`` picks ``ORJSONResponse`` when orjson is installed,
+falling back to Starlette's ``JSONResponse``. ``EntityJSONResponse`` goes one step
+further for entities that are already validated: pydantic-core serializes them
+straight to JSON, restricted to the fields of the response model, instead of
+FastAPI validating them into the response model, converting that to Python
+primitives and encoding the result.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Sequence, Type, Union, get_args, get_origin
+
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+IncludeSpec = Dict[str, Union[bool, "IncludeSpec"]]
+
+
+def default_response_class(fast: bool = True) -> Type[JSONResponse]:
+    """
+    Return the response class used by the routes that don't choose one.
+
+    Parameters
+    ----------
+    fast : bool
+        Use orjson when it is installed.
+
+    Returns
+    -------
+    type
+        ``ORJSONResponse`` or ``JSONResponse``.
+    """
+    if fast and orjson is not None:
+        return ORJSONResponse
+    return JSONResponse
+
+
+def json_dumps(content: Any) -> bytes:
+    """Encode JSON compatible ``content`` with orjson, or the stdlib without it."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _model_of(annotation: Any) -> Type[BaseModel] | None:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for argument in get_args(annotation):
+        model = _model_of(argument)
+        if model is not None:
+            return model
+    return None
+
+
+@lru_cache(maxsize=None)
+def response_fields(response_model: Type[BaseModel]) -> Mapping[str, Any]:
+    """
+    Build the pydantic ``include`` spec selecting the fields of ``response_model``,
+    nested models and lists of models included.
+
+    Parameters
+    ----------
+    response_model : type[BaseModel]
+        The model describing the response.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        e.g. ``{"title": True, "characters": {"__all__": {"id": True, ...}}}``
+    """
+    include: IncludeSpec = {}
+    for name, field in response_model.model_fields.items():
+        model = _model_of(field.annotation)
+        if model is None:
+            include[name] = True
+        elif get_origin(field.annotation) in (list, tuple, set, frozenset):
+            include[name] = {"__all__": dict(response_fields(model))}
+        else:
+            include[name] = dict(response_fields(model))
+    return include
+
+
+class EntityJSONResponse(Response):
+    """
+    Serializes a validated entity with the fields of a response model, skipping
+    the re-validation FastAPI does when a route returns a model.
+
+    The entity must have every field of the response model, with compatible
+    types; the route keeps declaring ``response_model`` for the OpenAPI schema.
+    A list of entities is rendered as a JSON array. ``include`` narrows the
+    fields further (see :mod:`app.core.fieldsets`); fields left out are never
+    serialized.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel | Sequence[BaseModel],
+        response_model: Type[BaseModel],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        include: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.response_model = response_model
+        self.include = include
+        super().__init__(content, status_code, headers)
+
+    def render(self, content: BaseModel | Sequence[BaseModel]) -> bytes:
+        include = self.include
+        if include is None:
+            include = response_fields(self.response_model)
+
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, include=include)
+        return (
+            b"["
+            + b",".join(
+                item.__pydantic_serializer__.to_json(item, include=include)
+                for item in content
+            )
+            + b"]"
+        )
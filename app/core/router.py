@@ -4,6 +4,10 @@ from app.auth.presentation.routes.auth_routes import router as auth_router
 from app.character.presentation.routes.character_routes import (
     router as character_router,
 )
+from app.core.presentation.routes.debug_routes import router as debug_router
+from app.core.presentation.routes.metrics_routes import router as metrics_router
+from app.core.presentation.routes.profiler_routes import router as profiler_router
+from app.core.settings.config import settings
 from app.scenario.presentation.routes.scenario_routes import router as scenario_router
 from app.story.presentation.routes.story_routes import router as story_router
 
@@ -13,3 +17,12 @@ def include_routers(app: FastAPI) -> None:
     app.include_router(character_router, prefix="/characters", tags=["Character"])
     app.include_router(scenario_router, prefix="/scenarios", tags=["Scenarios"])
     app.include_router(story_router, prefix="/stories", tags=["Story"])
+
+    if settings.METRICS_ENABLED:
+        app.include_router(metrics_router, tags=["Monitoring"])
+
+    if settings.PROFILER_ENABLED:
+        app.include_router(profiler_router, prefix="/admin", tags=["Monitoring"])
+
+    if settings.QUERY_STATS_ENABLED:
+        app.include_router(debug_router, prefix="/debug", tags=["Monitoring"])
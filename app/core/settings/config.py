@@ -1,7 +1,7 @@
 import os
 from enum import Enum
 from functools import lru_cache
-from typing import no_type_check
+from typing import Dict, List, no_type_check
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -17,6 +17,7 @@ class BaseSettingsConfig(BaseSettings):
     APP_VERSION: str = "1.0.0"
     ENV: str = "development"
     DEBUG: bool = False
+    FAST_JSON_RESPONSES: bool = True  # Encodes responses with orjson when installed
 
     # Database settings
     DB_HOST: str = "localhost"
@@ -24,6 +25,14 @@ class BaseSettingsConfig(BaseSettings):
     DB_NAME: str = "story_narrator"
     DB_USER: str = "user"
     DB_PASSWORD: str = "password"
+    DB_ECHO: bool = False  # Logs every statement through sqlalchemy.engine
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_REPLICA_URLS: List[str] = []  # Full SQLAlchemy URLs of the read replicas
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: float = 5.0
 
     # JWT settings
     JWT_SECRET_KEY: str = "your_jwt_secret_key"
@@ -35,8 +44,63 @@ class BaseSettingsConfig(BaseSettings):
 
     # AI
     OPENAI_API_KEY: str = "your_openai_api_key"
+    OPENAI_BASE_URL: str | None = None
     LLAMA_API_URL: str = "http://localhost:8000"
     LLM_MODEL: str = "default_model"
+    LLAMA_BATCH_MAX_SIZE: int = 1  # Values above 1 enable micro-batching
+    LLAMA_BATCH_LINGER_MS: float = 10.0
+    LLAMA_CACHE_PROMPT: bool = True
+    LLAMA_SLOT_COUNT: int = 0  # Spreads requests over warm slots when positive
+    PROMPT_LOCALE: str = "en"  # Options: en, pt-BR
+    PROMPT_TONE: str = "default"  # Options: default, religious
+
+    # Admission control
+    ADMISSION_MODE: str = "static"  # Options: static, aimd
+    ADMISSION_CONCURRENCY_LIMIT: int = 4
+    ADMISSION_BACKEND_LIMITS: Dict[str, int] = {}
+    ADMISSION_MAX_CONCURRENCY_LIMIT: int = 32
+    ADMISSION_MAX_QUEUE_SIZE: int = 16
+    ADMISSION_MAX_QUEUE_TIME_SECONDS: float = 10.0
+    ADMISSION_TARGET_LATENCY_SECONDS: float = 30.0
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # Options: json, text
+    LOG_LEVELS: Dict[str, str] = {}
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+
+    # Observability
+    METRICS_ENABLED: bool = True
+    USAGE_FLUSH_INTERVAL_SECONDS: float = 60.0
+    SERVER_TIMING_ENABLED: bool = True
+    SLOW_REQUEST_THRESHOLD_MS: float = 2000.0
+    TRACING_EXPORTER: str = "none"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_SAMPLE_RATIO: float = 1.0
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    QUERY_STATS_ENABLED: bool = True
+    PROFILER_ENABLED: bool = True
+    PROFILER_MAX_SECONDS: float = 60.0
+    ADMIN_EMAILS: List[str] = []
+
+    # HTTP caching of the scenarios and characters
+    CATALOG_CACHE_MAX_AGE_SECONDS: int = 60
+    CATALOG_VERSION_TTL_SECONDS: float = 5.0
+
+    # Response compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: List[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Characters
+    CHARACTERS_MAX_IDS_PER_REQUEST: int = 100
+
+    # Batch story generation
+    STORY_BATCH_MAX_SIZE: int = 30
+    STORY_BATCH_MAX_CONCURRENCY: int = 4
 
     def get_database_url(self) -> str:
         return (
@@ -0,0 +1,102 @@
+"""
+Per-phase timing of a request (auth, database fetches, prompt build, LLM call).
+
+Like the token usage, the timer of the current request lives in a context
+variable, so the code being timed only needs ``with phase("name"):`` and works
+the same from the event loop or a generator running in ``asyncio.to_thread``.
+"""
+
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Dict, Iterator, List
+
+
+class RequestTimer:
+    """Accumulates the duration of the named phases of one request."""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add ``seconds`` to phase ``name``; repeated phases are summed."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self) -> str:
+        """
+        Render the phases and the total so far as a ``Server-Timing`` header value.
+
+        Returns
+        -------
+        str
+            e.g. ``auth;dur=3.1, llm;dur=812.4, total;dur=830.2``
+        """
+        metrics: List[str] = [
+            f"{name};dur={seconds * 1000:.1f}" for name, seconds in self.phases.items()
+        ]
+        metrics.append(f"total;dur={self.elapsed * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Phase durations in milliseconds, for logs."""
+        return {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()}
+
+
+_current_timer: ContextVar[RequestTimer | None] = ContextVar(
+    "request_timer", default=None
+)
+
+
+def current_timer() -> RequestTimer | None:
+    """Return the timer of the request being handled, if any."""
+    return _current_timer.get()
+
+
+@contextlib.contextmanager
+def time_request() -> Iterator[RequestTimer]:
+    """
+    Start timing a request; phases recorded inside the block go to this timer.
+
+    Yields
+    ------
+    RequestTimer
+        The timer of the request.
+    """
+    timer = RequestTimer()
+    token = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(token)
+
+
+def record_phase(name: str, seconds: float) -> None:
+    """Add a duration measured elsewhere to the current request, if any."""
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.record(name, seconds)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Time the ``with`` block as phase ``name`` of the current request.
+
+    Outside of a timed request this only costs a context variable lookup.
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.record(name, time.perf_counter() - started_at)
@@ -0,0 +1,304 @@
+"""
+Minimal in-process tracing that needs no collector.
+
+Spans follow the OpenTelemetry data model (128-bit trace ids, 64-bit span ids,
+W3C ``traceparent`` propagation, parent based ratio sampling) and are exported
+as one JSON object per line, in the shape of the OpenTelemetry console
+exporter, to stderr or to a file.
+
+The current span lives in a context variable, so spans opened in a generator
+running in ``asyncio.to_thread`` are children of the request span.
+"""
+
+import contextlib
+import json
+import random
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import IO, Any, Dict, Iterator, Optional
+
+TRACEPARENT_VERSION = "00"
+
+
+class Span:
+    """A timed operation of a trace."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "kind",
+        "sampled",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "status",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: int,
+        parent_id: Optional[int],
+        sampled: bool,
+        kind: str = "INTERNAL",
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.sampled = sampled
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = "UNSET"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        if self.sampled:
+            self.attributes.update(attributes)
+
+    @property
+    def traceparent(self) -> str:
+        """The W3C ``traceparent`` header of this span."""
+        flags = "01" if self.sampled else "00"
+        return f"{TRACEPARENT_VERSION}-{self.trace_id:032x}-{self.span_id:016x}-{flags}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "context": {
+                "trace_id": f"0x{self.trace_id:032x}",
+                "span_id": f"0x{self.span_id:016x}",
+            },
+            "kind": f"SpanKind.{self.kind}",
+            "parent_id": (
+                f"0x{self.parent_id:016x}" if self.parent_id is not None else None
+            ),
+            "start_time": self.start_ns,
+            "end_time": self.end_ns,
+            "status": {"status_code": self.status},
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporter:
+    """
+    Writes finished spans as JSON lines to a stream.
+
+    Parameters
+    ----------
+    stream : IO[str]
+        The stream written to.
+    close_stream : bool
+        Close the stream with the exporter, for files opened for it.
+    """
+
+    def __init__(self, stream: IO[str], close_stream: bool = False) -> None:
+        self.stream = stream
+        self.close_stream = close_stream
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+    def close(self) -> None:
+        if self.close_stream:
+            self.stream.close()
+
+
+def parse_traceparent(header: str | None) -> tuple[int, int, bool] | None:
+    """
+    Parse a W3C ``traceparent`` header.
+
+    Returns
+    -------
+    tuple[int, int, bool] or None
+        The trace id, the parent span id and the sampled flag, or None when the
+        header is missing or malformed.
+    """
+    if not header:
+        return None
+
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+
+    try:
+        trace_id, span_id, flags = (int(part, 16) for part in parts[1:])
+    except ValueError:
+        return None
+
+    if not trace_id or not span_id:
+        return None
+    return trace_id, span_id, bool(flags & 0x01)
+
+
+class Tracer:
+    """
+    Creates spans and exports the sampled ones.
+
+    Parameters
+    ----------
+    exporter : SpanExporter, optional
+        Where finished spans go; without one tracing is disabled and
+        :meth:`span` costs a single attribute check.
+    sample_ratio : float
+        Fraction of the new traces that are recorded. Child spans follow the
+        decision of their parent, and so do requests carrying a ``traceparent``.
+    """
+
+    def __init__(
+        self, exporter: SpanExporter | None = None, sample_ratio: float = 1.0
+    ) -> None:
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(
+        self, exporter: SpanExporter | None, sample_ratio: float = 1.0
+    ) -> None:
+        if self.exporter is not None and self.exporter is not exporter:
+            self.exporter.close()
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def _should_sample(self, trace_id: int) -> bool:
+        # Same rule as the OpenTelemetry TraceIdRatioBased sampler.
+        bound = int(self.sample_ratio * (1 << 64))
+        return (trace_id & 0xFFFFFFFFFFFFFFFF) < bound
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "INTERNAL",
+        traceparent: str | None = None,
+    ) -> Span | None:
+        """
+        Create a child of the current span, or of ``traceparent``, without making
+        it current; it must be passed to :meth:`end_span`.
+
+        Returns
+        -------
+        Span or None
+            The span, or None when tracing is disabled.
+        """
+        if self.exporter is None:
+            return None
+
+        parent = _current_span.get()
+        remote = parse_traceparent(traceparent) if parent is None else None
+
+        if parent is not None:
+            span = Span(name, parent.trace_id, parent.span_id, parent.sampled, kind)
+        elif remote is not None:
+            trace_id, parent_id, sampled = remote
+            span = Span(name, trace_id, parent_id, sampled, kind)
+        else:
+            trace_id = random.getrandbits(128) or 1
+            span = Span(name, trace_id, None, self._should_sample(trace_id), kind)
+
+        span.set_attributes(attributes or {})
+        return span
+
+    def end_span(self, span: Span | None, error: BaseException | None = None) -> None:
+        """End ``span`` and export it if it is sampled."""
+        if span is None:
+            return
+
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.status = "ERROR"
+            span.set_attribute("exception.type", type(error).__name__)
+        if span.sampled and self.exporter is not None:
+            self.exporter.export(span)
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "INTERNAL",
+        traceparent: str | None = None,
+    ) -> Iterator[Span | None]:
+        """
+        Trace the ``with`` block as the current span.
+
+        Yields
+        ------
+        Span or None
+            The span, or None when tracing is disabled.
+        """
+        span = self.start_span(name, attributes, kind, traceparent)
+        if span is None:
+            yield None
+            return
+
+        token = _current_span.set(span)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span, error)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+tracer = Tracer()
+
+
+def current_span() -> Span | None:
+    """Return the span being recorded in this context, if any."""
+    return _current_span.get()
+
+
+def set_span_attributes(attributes: Dict[str, Any]) -> None:
+    """Add attributes to the current span, if any."""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attributes(attributes)
+
+
+def configure_tracing(exporter: str, file_path: str, sample_ratio: float) -> None:
+    """
+    Configure the process-wide tracer from the settings.
+
+    Parameters
+    ----------
+    exporter : str
+        ``none``, ``console`` (stderr) or ``file``.
+    file_path : str
+        JSON lines file used by the ``file`` exporter.
+    sample_ratio : float
+        Fraction of the traces recorded, between 0 and 1.
+    """
+    exporter = exporter.lower()
+    if exporter == "console":
+        tracer.configure(SpanExporter(sys.stderr), sample_ratio)
+    elif exporter == "file":
+        tracer.configure(
+            SpanExporter(open(file_path, "a"), close_stream=True), sample_ratio
+        )
+    elif exporter == "none":
+        tracer.configure(None)
+    else:
+        raise ValueError(f"Unknown tracing exporter: {exporter}")
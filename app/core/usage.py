@@ -0,0 +1,84 @@
+"""
+Token usage of the LLM calls made while handling a request.
+
+The usage being collected lives in a context variable, so the clients can add
+to it without it being passed around: ``asyncio.to_thread`` copies the context,
+and the copy still points at the same ``TokenUsage`` object.
+"""
+
+import contextlib
+from contextvars import ContextVar
+from typing import Iterator
+
+from pydantic import BaseModel, Field
+
+
+class TokenUsage(BaseModel):
+    """Tokens and time spent on the LLM for one story (or one request)."""
+
+    prompt_tokens: int = Field(0, description="Tokens of the prompts sent.")
+    cached_tokens: int = Field(0, description="Prompt tokens served from cache.")
+    completion_tokens: int = Field(0, description="Tokens generated.")
+    generation_seconds: float = Field(0.0, description="Time spent in LLM calls.")
+    llm_calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, other: "TokenUsage") -> None:
+        """Accumulate ``other`` into this usage."""
+        self.prompt_tokens += other.prompt_tokens
+        self.cached_tokens += other.cached_tokens
+        self.completion_tokens += other.completion_tokens
+        self.generation_seconds += other.generation_seconds
+        self.llm_calls += other.llm_calls
+
+
+_current_usage: ContextVar[TokenUsage | None] = ContextVar("token_usage", default=None)
+
+
+def current_usage() -> TokenUsage | None:
+    """Return the usage being collected in this context, if any."""
+    return _current_usage.get()
+
+
+@contextlib.contextmanager
+def collect_usage() -> Iterator[TokenUsage]:
+    """
+    Collect the usage of the LLM calls made inside the ``with`` block.
+
+    Nested collections also add their usage to the enclosing one, so a request
+    level collection sees the total of every story it generated.
+
+    Yields
+    ------
+    TokenUsage
+        Filled in as the LLM calls complete.
+    """
+    usage = TokenUsage()
+    parent = _current_usage.get()
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+        if parent is not None:
+            parent.add(usage)
+
+
+def record_tokens(prompt: int, cached: int, completion: int) -> None:
+    """Add token counts to the usage being collected, if any."""
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.prompt_tokens += prompt
+        usage.cached_tokens += cached
+        usage.completion_tokens += completion
+
+
+def record_call(seconds: float) -> None:
+    """Add one LLM call of ``seconds`` to the usage being collected, if any."""
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.generation_seconds += seconds
+        usage.llm_calls += 1
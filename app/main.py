@@ -5,12 +5,24 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.database import sessionmanager
-from app.core.dependencies import get_auth_service
+from app.core.dependencies import get_shared_auth_service, usage_aggregator
 from app.core.docs.openapi import custom_openapi
+from app.core.logging_config import configure_logging
+from app.core.middlewares.compression_middleware import CompressionMiddleware
+from app.core.middlewares.metrics_middleware import MetricsMiddleware
+from app.core.middlewares.timing_middleware import ServerTimingMiddleware
+from app.core.middlewares.tracing_middleware import TracingMiddleware
+from app.core.responses import default_response_class
 from app.core.router import include_routers
 from app.core.settings.config import settings
+from app.core.tracing import configure_tracing
 
-logging.basicConfig(level=logging.INFO)
+log_levels = dict(settings.LOG_LEVELS)
+if settings.DB_ECHO:
+    log_levels.setdefault("sqlalchemy.engine", "INFO")
+configure_logging(
+    settings.LOG_LEVEL, log_levels, settings.LOG_FORMAT, settings.LOG_SAMPLE_RATES
+)
 logger = logging.getLogger(__name__)
 
 
@@ -18,18 +30,22 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Initialize database session manager
     sessionmanager.init_db()
+    sessionmanager.start_replica_checks()
 
     # Initialize auth service
-    async with sessionmanager.session() as session:
-        app.state.auth_service = get_auth_service(session)
+    app.state.auth_service = get_shared_auth_service()
+
+    usage_aggregator.start()
 
     yield
+    await usage_aggregator.stop()
     if sessionmanager.engine is not None:
         await sessionmanager.close()
 
 
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=default_response_class(settings.FAST_JSON_RESPONSES),
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="API for generating stories with characters and scenarios",
@@ -52,6 +68,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.COMPRESSION_ENCODINGS,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        levels={
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+        },
+    )
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(
+        ServerTimingMiddleware, slow_request_ms=settings.SLOW_REQUEST_THRESHOLD_MS
+    )
+
+if settings.TRACING_EXPORTER != "none":
+    configure_tracing(
+        settings.TRACING_EXPORTER,
+        settings.TRACING_FILE_PATH,
+        settings.TRACING_SAMPLE_RATIO,
+    )
+    app.add_middleware(TracingMiddleware)
+
 app.openapi = lambda: custom_openapi(app)
 
 include_routers(app)
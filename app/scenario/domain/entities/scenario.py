@@ -1,13 +1,15 @@
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.core.ids import uuid7
+
 
 class Scenario(BaseModel):
     """Domain entity representing a story scenario."""
 
-    id: Optional[UUID] = Field(default_factory=uuid4)
+    id: Optional[UUID] = Field(default_factory=uuid7)
     name: str = Field(..., min_length=1)
     description: str = Field(..., min_length=1)
     available: bool = True
@@ -35,10 +35,26 @@ class BaseScenarioRepository(ABC):
             The scenario entity if found, otherwise None.
         """
 
+    @abstractmethod
+    async def get_by_ids(self, scenario_ids: List[UUID]) -> List[ScenarioEntity]:
+        """
+        Retrieve several scenarios in a single query.
+
+        Parameters
+        ----------
+        scenario_ids : List[UUID]
+            The unique identifiers of the scenarios to retrieve.
+
+        Returns
+        -------
+        List[ScenarioEntity]
+            The scenarios found, in no particular order. Unknown IDs are skipped.
+        """
+
     @abstractmethod
     async def get_by_name(self, name: str) -> ScenarioEntity | None:
         """
-        Retrieve a scenario by its Name.
+        Retrieve a scenario by its name, ignoring the case.
 
         Parameters
         ----------
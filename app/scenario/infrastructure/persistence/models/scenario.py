@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.infrastructure.persistence.models.base import BaseModel
@@ -8,7 +8,11 @@ class Scenario(BaseModel):
     """Model representing a story scenario."""
 
     __tablename__ = "scenarios"
+    __table_args__ = (
+        # Names are unique and looked up ignoring the case.
+        Index("ix_scenarios_lower_name", func.lower(text("name")), unique=True),
+    )
 
-    name: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=False)
     available: Mapped[bool] = mapped_column(Boolean, default=True)
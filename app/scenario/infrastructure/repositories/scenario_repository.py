@@ -1,9 +1,15 @@
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.catalog import SCENARIOS
+from app.core.infrastructure.persistence.rows import select_entities, to_entity
+from app.core.infrastructure.repositories.catalog_version_repository import (
+    CatalogVersionRepository,
+)
+from app.core.replicas import read_only
 from app.scenario.domain.entities.scenario import Scenario as ScenarioEntity
 from app.scenario.domain.interfaces.scenario_repository import BaseScenarioRepository
 from app.scenario.infrastructure.persistence.models.scenario import (
@@ -17,6 +23,7 @@ class ScenarioRepository(BaseScenarioRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    @read_only
     async def get_all(self) -> List[ScenarioEntity]:
         """
         Retrieve all available scenarios.
@@ -27,13 +34,14 @@ class ScenarioRepository(BaseScenarioRepository):
             A list of Scenario objects representing all available scenarios.
         """
         result = await self.session.execute(
-            select(ScenarioModel).filter_by(available=True)
+            select_entities(ScenarioModel, ScenarioEntity).where(
+                ScenarioModel.available
+            )
         )
 
-        scenarios = result.scalars().all()
-
-        return [ScenarioEntity.model_validate(scenario) for scenario in scenarios]
+        return [to_entity(ScenarioEntity, row) for row in result]
 
+    @read_only
     async def get_by_id(self, scenario_id: UUID) -> ScenarioEntity | None:
         """
         Retrieve a scenario by its ID.
@@ -49,15 +57,44 @@ class ScenarioRepository(BaseScenarioRepository):
             The Scenario object if found, otherwise None.
         """
         result = await self.session.execute(
-            select(ScenarioModel).filter_by(id=scenario_id)
+            select_entities(ScenarioModel, ScenarioEntity).where(
+                ScenarioModel.id == scenario_id
+            )
+        )
+        row = result.one_or_none()
+
+        return to_entity(ScenarioEntity, row) if row else None
+
+    @read_only
+    async def get_by_ids(self, scenario_ids: List[UUID]) -> List[ScenarioEntity]:
+        """
+        Retrieve several scenarios in a single query.
+
+        Parameters
+        ----------
+        scenario_ids : List[UUID]
+            The unique identifiers of the scenarios to retrieve.
+
+        Returns
+        -------
+        List[ScenarioEntity]
+            The Scenario objects found, in no particular order.
+        """
+        if not scenario_ids:
+            return []
+
+        result = await self.session.execute(
+            select_entities(ScenarioModel, ScenarioEntity).where(
+                ScenarioModel.id.in_(set(scenario_ids))
+            )
         )
-        scenario = result.scalar_one_or_none()
 
-        return ScenarioEntity.model_validate(scenario) if scenario else None
+        return [to_entity(ScenarioEntity, row) for row in result]
 
+    @read_only
     async def get_by_name(self, name: str) -> ScenarioEntity | None:
         """
-        Retrieve a scenario by its Name.
+        Retrieve a scenario by its name, ignoring the case.
 
         Parameters
         ----------
@@ -69,10 +106,14 @@ class ScenarioRepository(BaseScenarioRepository):
         ScenarioEntity or None
             The Scenario object if found, otherwise None.
         """
-        result = await self.session.execute(select(ScenarioModel).filter_by(name=name))
-        scenario = result.scalar_one_or_none()
+        result = await self.session.execute(
+            select_entities(ScenarioModel, ScenarioEntity).where(
+                func.lower(ScenarioModel.name) == func.lower(name)
+            )
+        )
+        row = result.one_or_none()
 
-        return ScenarioEntity.model_validate(scenario) if scenario else None
+        return to_entity(ScenarioEntity, row) if row else None
 
     async def save(self, scenario: ScenarioEntity) -> ScenarioEntity:
         """
@@ -91,6 +132,7 @@ class ScenarioRepository(BaseScenarioRepository):
         scenario_model = ScenarioModel(**scenario.model_dump())
 
         self.session.add(scenario_model)
+        await CatalogVersionRepository(self.session).bump(SCENARIOS)
         await self.session.commit()
         await self.session.refresh(scenario_model)
 
@@ -1,14 +1,24 @@
-from typing import List
+from typing import Any, List, Mapping
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from starlette import status
 
+from app.core.catalog import SCENARIOS, CatalogVersions
 from app.core.dependencies import (
+    get_catalog_version_repository,
+    get_catalog_versions,
     get_create_scenario_use_case,
     get_scenario_use_case,
     get_scenarios_use_case,
 )
+from app.core.fieldsets import field_selection, selection_tag
+from app.core.http_cache import cache_headers, etag_matches, make_etag, not_modified
+from app.core.infrastructure.repositories.catalog_version_repository import (
+    CatalogVersionRepository,
+)
+from app.core.responses import EntityJSONResponse
+from app.core.settings.config import settings
 from app.scenario.application.use_cases.create_scenario import CreateScenarioUseCase
 from app.scenario.application.use_cases.get_scenario import GetScenarioUseCase
 from app.scenario.application.use_cases.get_scenarios import GetScenariosUseCase
@@ -20,54 +30,120 @@ from app.scenario.presentation.models.scenario import ScenarioRequest, ScenarioR
 
 router = APIRouter()
 
+scenario_fields = field_selection(ScenarioResponse)
+
 
-@router.get("/", response_model=List[ScenarioResponse])
+@router.get(
+    "/",
+    response_model=List[ScenarioResponse],
+    responses={304: {"description": "Not Modified - The cached list is current"}},
+)
 async def get_scenarios(
+    request: Request,
     use_case: GetScenariosUseCase = Depends(get_scenarios_use_case),
+    catalog_versions: CatalogVersions = Depends(get_catalog_versions),
+    catalog_repository: CatalogVersionRepository = Depends(
+        get_catalog_version_repository
+    ),
+    include: Mapping[str, Any] = Depends(scenario_fields),
 ):
     """
     Fetches a list of scenarios using the provided use case.
 
+    The response carries an ETag derived from the scenarios catalog version; a
+    request whose ``If-None-Match`` is still current gets a 304 without the
+    scenarios being read. ``fields`` limits the scenarios to the fields listed.
+
     Returns
     -------
     list
         A list of scenarios fetched by the use case.
     """
+    max_age = settings.CATALOG_CACHE_MAX_AGE_SECONDS
+    variant = selection_tag(ScenarioResponse, include)
+    etag = make_etag(
+        SCENARIOS,
+        await catalog_versions.get(SCENARIOS, catalog_repository),
+        variant=variant,
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag, max_age)
+
+    # Tag the body with the version of the replica it is read from.
+    version = await catalog_repository.get(SCENARIOS)
     scenarios = await use_case.execute()
+    etag = make_etag(SCENARIOS, version, variant=variant)
 
-    return scenarios
+    return EntityJSONResponse(
+        scenarios,
+        ScenarioResponse,
+        headers=cache_headers(etag, max_age),
+        include=include,
+    )
 
 
-@router.get("/{scenario_id}", response_model=ScenarioResponse)
+@router.get(
+    "/{scenario_id}",
+    response_model=ScenarioResponse,
+    responses={304: {"description": "Not Modified - The cached scenario is current"}},
+)
 async def get_scenario(
+    request: Request,
     scenario_id: UUID,
     use_case: GetScenarioUseCase = Depends(get_scenario_use_case),
+    catalog_versions: CatalogVersions = Depends(get_catalog_versions),
+    catalog_repository: CatalogVersionRepository = Depends(
+        get_catalog_version_repository
+    ),
+    include: Mapping[str, Any] = Depends(scenario_fields),
 ):
     """
-    Retrieve a scenario using the provided use case.
+    Retrieve a scenario using the provided use case, limited to the ``fields``
+    listed.
 
     Returns
     -------
     ScenarioResponse
-        The retrieved scenario object.
+        The retrieved scenario object, with an ETag (or a 304 when the
+        ``If-None-Match`` of the request is current).
 
     Raises
     ------
     HTTPException
         If the scenario cannot be retrieved.
     """
+    max_age = settings.CATALOG_CACHE_MAX_AGE_SECONDS
+    variant = selection_tag(ScenarioResponse, include)
+    etag = make_etag(
+        SCENARIOS,
+        await catalog_versions.get(SCENARIOS, catalog_repository),
+        scenario_id,
+        variant=variant,
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag, max_age)
+
+    # Tag the body with the version of the replica it is read from.
+    version = await catalog_repository.get(SCENARIOS)
     scenario = await use_case.execute(scenario_id=scenario_id)
+    etag = make_etag(SCENARIOS, version, scenario_id, variant=variant)
 
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    return scenario
+    return EntityJSONResponse(
+        scenario,
+        ScenarioResponse,
+        headers=cache_headers(etag, max_age),
+        include=include,
+    )
 
 
 @router.post("/", response_model=ScenarioResponse, status_code=status.HTTP_201_CREATED)
 async def create_scenario(
     scenario: ScenarioRequest,
     use_case: CreateScenarioUseCase = Depends(get_create_scenario_use_case),
+    catalog_versions: CatalogVersions = Depends(get_catalog_versions),
 ):
     """
     Create a scenario using the provided use case.
@@ -91,6 +167,8 @@ async def create_scenario(
         created_scenario = await use_case.execute(
             name=scenario.name, description=scenario.description
         )
+        # The repository bumped the catalog version, don't serve the old one.
+        catalog_versions.invalidate()
 
         return created_scenario
     except (InvalidScenarioDataError, ScenarioAlreadyExistsError) as e:
@@ -0,0 +1,211 @@
+import asyncio
+import contextlib
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Tuple
+from uuid import UUID
+
+from app.character.domain.entities.character import Character
+from app.character.domain.interfaces.character_repository import BaseCharacterRepository
+from app.core.admission import AdmissionController
+from app.core.timing import phase
+from app.scenario.domain.entities.scenario import Scenario
+from app.scenario.domain.interfaces.scenario_repository import BaseScenarioRepository
+from app.story.application.use_cases.generate_story import GenerateStoryUseCase
+from app.story.domain.entities.story import Story
+from app.story.domain.exceptions.story_exceptions import (
+    StoryValidationError,
+    TooManyStoriesError,
+)
+from app.story.domain.interfaces.story_generator import BaseStoryGenerator
+
+
+class StorySpec(NamedTuple):
+    """Parameters of one story of a batch."""
+
+    character_ids: List[UUID]
+    scenario_id: UUID
+    narrative_style: str
+
+
+class PreparedStory(NamedTuple):
+    """A batch item after validation, ready to be generated or reported as failed."""
+
+    index: int
+    characters: List[Character]
+    scenario: Scenario | None
+    narrative_style: str
+    error: Exception | None = None
+
+
+BatchResult = Tuple[int, Story | Exception]
+
+
+class GenerateStoriesBatchUseCase(GenerateStoryUseCase):
+    """Use case for generating many stories concurrently from a list of specs."""
+
+    def __init__(
+        self,
+        story_generator: BaseStoryGenerator,
+        character_repository: BaseCharacterRepository,
+        scenario_repository: BaseScenarioRepository,
+        admission_controller: AdmissionController,
+        backend: str,
+        max_concurrency: int = 4,
+        max_stories: int = 30,
+        release_connections: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        """
+        Initializes the use case.
+
+        Parameters:
+        ----------
+        story_generator : BaseStoryGenerator
+            The AI-based story generator (e.g., ChatGPT, Llama, Local).
+        character_repository : BaseCharacterRepository
+            The repository to fetch characters.
+        scenario_repository : BaseScenarioRepository
+            The repository to fetch scenarios.
+        admission_controller : AdmissionController
+            Limits concurrent generations per backend, shared with single requests.
+        backend : str
+            Name of the configured story generator backend.
+        max_concurrency : int
+            Maximum number of stories of one batch generated at the same time.
+        max_stories : int
+            Maximum number of stories accepted in one batch.
+        release_connections : Callable[[], Awaitable[None]], optional
+            Gives the database connections back to the pool once the batch is
+            prepared.
+        """
+        super().__init__(
+            story_generator,
+            character_repository,
+            scenario_repository,
+            release_connections,
+            admission_controller,
+            backend,
+        )
+        self.max_concurrency = max_concurrency
+        self.max_stories = max_stories
+
+    async def prepare(self, specs: List[StorySpec]) -> List[PreparedStory]:
+        """
+        Loads every character and scenario of the batch with one query each and
+        validates each spec.
+
+        This is the only step touching the database, so it can run before the
+        response starts streaming.
+
+        Parameters
+        ----------
+        specs : List[StorySpec]
+            The stories to generate.
+
+        Returns
+        -------
+        List[PreparedStory]
+            One item per spec, in order; invalid specs carry their error.
+
+        Raises
+        ------
+        TooManyStoriesError
+            If the batch is larger than ``max_stories``.
+        """
+        if len(specs) > self.max_stories:
+            raise TooManyStoriesError(self.max_stories)
+
+        character_ids = [cid for spec in specs for cid in spec.character_ids]
+        scenario_ids = [spec.scenario_id for spec in specs]
+
+        try:
+            with phase("characters"):
+                characters: Dict[UUID, Character] = {
+                    char.id: char  # type: ignore[misc]
+                    for char in await self.character_repository.get_by_ids(
+                        character_ids
+                    )
+                }
+            with phase("scenario"):
+                scenarios: Dict[UUID, Scenario] = {
+                    scenario.id: scenario  # type: ignore[misc]
+                    for scenario in await self.scenario_repository.get_by_ids(
+                        scenario_ids
+                    )
+                }
+        finally:
+            await self._release_connections()
+
+        prepared = []
+        for index, spec in enumerate(specs):
+            story_characters = [
+                characters[cid] for cid in spec.character_ids if cid in characters
+            ]
+            scenario = scenarios.get(spec.scenario_id)
+            error = None
+
+            try:
+                self._check_characters(story_characters)
+                self._check_scenario_and_style(scenario, spec.narrative_style)
+            except StoryValidationError as e:
+                error = e
+
+            prepared.append(
+                PreparedStory(
+                    index, story_characters, scenario, spec.narrative_style, error
+                )
+            )
+
+        return prepared
+
+    async def stream(self, prepared: List[PreparedStory]) -> AsyncIterator[BatchResult]:
+        """
+        Generates the valid stories concurrently and yields each result as soon as
+        it is ready.
+
+        At most ``max_concurrency`` stories of the batch run at the same time and
+        each of them goes through the admission controller of the backend, so a
+        batch competes fairly with single generation requests.
+
+        Parameters
+        ----------
+        prepared : List[PreparedStory]
+            The output of :meth:`prepare`.
+
+        Yields
+        ------
+        Tuple[int, Story | Exception]
+            The index of the spec and either the generated story or the error that
+            prevented it. Validation errors are yielded first.
+        """
+        for item in prepared:
+            if item.error is not None:
+                yield item.index, item.error
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.create_task(self._generate(item, semaphore))
+            for item in prepared
+            if item.error is None
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _generate(
+        self, item: PreparedStory, semaphore: asyncio.Semaphore
+    ) -> BatchResult:
+        async with semaphore:
+            try:
+                async with self.admission_controller.admit(self.backend):
+                    story = await self._generate_story(
+                        item.characters, item.scenario, item.narrative_style
+                    )
+            except Exception as e:
+                return item.index, e
+
+        return item.index, story
@@ -1,8 +1,14 @@
-from typing import Final, List, Tuple
+import asyncio
+import contextlib
+from typing import AsyncIterator, Awaitable, Callable, Final, List, Tuple
 from uuid import UUID
 
 from app.character.domain.entities.character import Character
 from app.character.domain.interfaces.character_repository import BaseCharacterRepository
+from app.core.admission import AdmissionController
+from app.core.timing import phase, record_phase
+from app.core.tracing import tracer
+from app.core.usage import collect_usage
 from app.scenario.domain.entities.scenario import Scenario
 from app.scenario.domain.interfaces.scenario_repository import BaseScenarioRepository
 from app.story.domain.entities.story import Story
@@ -25,6 +31,9 @@ class GenerateStoryUseCase:
         story_generator: BaseStoryGenerator,
         character_repository: BaseCharacterRepository,
         scenario_repository: BaseScenarioRepository,
+        release_connections: Callable[[], Awaitable[None]] | None = None,
+        admission_controller: AdmissionController | None = None,
+        backend: str | None = None,
     ) -> None:
         """
         Initializes the use case with repositories and a story generator.
@@ -37,10 +46,23 @@ class GenerateStoryUseCase:
             The repository to fetch characters.
         scenario_repository : BaseScenarioRepository
             The repository to fetch scenarios.
+        release_connections : Callable[[], Awaitable[None]], optional
+            Gives the database connections of the repositories back to the pool,
+            called once everything is loaded so that none is held while the
+            story is generated.
+        admission_controller : AdmissionController, optional
+            Limits concurrent generations per backend. Only the call to the story
+            generator holds a slot, so invalid requests neither wait in the
+            queue nor count as backend failures.
+        backend : str, optional
+            Name of the story generator backend, the admission controller key.
         """
         self.story_generator = story_generator
         self.character_repository = character_repository
         self.scenario_repository = scenario_repository
+        self.release_connections = release_connections
+        self.admission_controller = admission_controller
+        self.backend = backend
 
     async def execute(
         self, character_ids: List[UUID], scenario_id: UUID, narrative_style: str
@@ -61,17 +83,89 @@ class GenerateStoryUseCase:
         -------
         Story
             The generated story object.
+
+        Raises
+        ------
+        StoryValidationError
+            If the characters, the scenario or the narrative style are invalid.
+        AdmissionRejectedError
+            If the backend is saturated.
         """
 
-        characters = [
-            char
-            for cid in character_ids
-            if (char := await self.character_repository.get_by_id(cid)) is not None
-        ]
+        with tracer.span(
+            "GenerateStoryUseCase.execute",
+            {
+                "story.scenario_id": str(scenario_id),
+                "story.character_ids": [str(cid) for cid in character_ids],
+            },
+        ):
+            with phase("characters"):
+                characters = [
+                    char
+                    for cid in character_ids
+                    if (char := await self.character_repository.get_by_id(cid))
+                    is not None
+                ]
+
+            try:
+                _, scenario, _ = await self._validate(
+                    characters, scenario_id, narrative_style
+                )
+            finally:
+                await self._release_connections()
+
+            async with self._admit():
+                return await self._generate_story(characters, scenario, narrative_style)
+
+    async def _release_connections(self) -> None:
+        """Ends the database part of the use case."""
+        if self.release_connections is not None:
+            await self.release_connections()
+
+    @contextlib.asynccontextmanager
+    async def _admit(self) -> AsyncIterator[None]:
+        """
+        Holds a slot of the backend, if there is an admission controller, and
+        records the time spent waiting for it as the ``queue`` phase.
+        """
+        if self.admission_controller is None:
+            yield
+            return
 
-        _, scenario, _ = await self._validate(characters, scenario_id, narrative_style)
+        async with self.admission_controller.admit(self.backend) as waited:
+            record_phase("queue", waited)
+            yield
 
-        return self.story_generator.generate(characters, scenario, narrative_style)
+    async def _generate_story(
+        self, characters: List[Character], scenario: Scenario, narrative_style: str
+    ) -> Story:
+        """
+        Runs the story generator and attaches the LLM token usage to the story.
+        """
+        with (
+            tracer.span(
+                "story.generate",
+                {"story.backend": type(self.story_generator).__name__},
+            ) as span,
+            collect_usage() as usage,
+        ):
+            # Generators block on network I/O, keep them off the event loop.
+            story = await asyncio.to_thread(
+                self.story_generator.generate, characters, scenario, narrative_style
+            )
+
+            if span is not None:
+                span.set_attributes(
+                    {
+                        "story.id": str(story.id),
+                        "llm.usage.prompt_tokens": usage.prompt_tokens,
+                        "llm.usage.completion_tokens": usage.completion_tokens,
+                        "llm.calls": usage.llm_calls,
+                    }
+                )
+
+        story.usage = usage
+        return story
 
     async def _validate(
         self,
@@ -101,17 +195,42 @@ class GenerateStoryUseCase:
         StoryValidationError
             If any validation rule is not met.
         """
+        self._check_characters(characters)
+
+        with phase("scenario"):
+            scenario = await self.scenario_repository.get_by_id(scenario_id)
+        self._check_scenario_and_style(scenario, narrative_style)
+
+        return characters, scenario, narrative_style  # type: ignore
+
+    def _check_characters(self, characters: List[Character]) -> None:
+        """
+        Ensures the story has at least one and at most ``MAX_CHARACTERS`` characters.
+
+        Raises
+        ------
+        StoryValidationError
+            If the number of characters is out of bounds.
+        """
         if not characters:
             raise CharactersEmptyError()
 
         if len(characters) > self.MAX_CHARACTERS:
             raise TooManyCharactersError(self.MAX_CHARACTERS)
 
-        scenario = await self.scenario_repository.get_by_id(scenario_id)
+    def _check_scenario_and_style(
+        self, scenario: Scenario | None, narrative_style: str
+    ) -> None:
+        """
+        Ensures the scenario exists and the narrative style is not blank.
+
+        Raises
+        ------
+        StoryValidationError
+            If the scenario is missing or the narrative style is invalid.
+        """
         if not scenario:
             raise InvalidScenarioError()
 
         if not isinstance(narrative_style, str) or not narrative_style.strip():
             raise InvalidNarrativeStyleError()
-
-        return characters, scenario, narrative_style
@@ -1,16 +1,18 @@
 from typing import List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from app.character.domain.entities.character import Character
+from app.core.ids import uuid7
+from app.core.usage import TokenUsage
 from app.scenario.domain.entities.scenario import Scenario
 
 
 class Story(BaseModel):
     """Entity representing a generated story."""
 
-    id: Optional[UUID] = Field(default_factory=uuid4)
+    id: Optional[UUID] = Field(default_factory=uuid7)
     title: str = Field(..., examples=["The Adventures of Luna and the Magic Forest"])
     content: str = Field(..., examples=["Once upon a time in a magical forest..."])
     characters: List[Character]
@@ -18,3 +20,6 @@ class Story(BaseModel):
     narrative_style: str = Field(
         ..., examples=["adventurous", "action", "comedy", "fantasy"]
     )
+    usage: Optional[TokenUsage] = Field(
+        None, description="LLM tokens and time spent generating the story."
+    )
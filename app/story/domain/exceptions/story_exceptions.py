@@ -30,3 +30,10 @@ class InvalidScenarioError(StoryValidationError):
 
     def __init__(self):
         super().__init__("Scenario not found.")
+
+
+class TooManyStoriesError(StoryValidationError):
+    """Raised when a batch asks for more stories than allowed."""
+
+    def __init__(self, max_stories=30):
+        super().__init__(f"A batch cannot have more than {max_stories} stories.")
@@ -2,24 +2,34 @@ from typing import List
 
 from app.character.domain.entities.character import Character
 from app.core.infrastructure.ai.clients.llama_client import LlamaClient
+from app.core.timing import phase
 from app.scenario.domain.entities.scenario import Scenario
 from app.story.domain.entities.story import Story
 from app.story.domain.interfaces.story_generator import BaseStoryGenerator
+from app.story.infrastructure.ai.prompts.prompt_builder import PromptBuilder
 
 
 class LlamaStoryGenerator(BaseStoryGenerator):
     """Story generator using LLaMA API."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        prompt_builder: PromptBuilder | None = None,
+        llama_client: LlamaClient | None = None,
+    ) -> None:
         """
         Initializes the LLaMA story generator.
 
         Parameters
         ----------
+        prompt_builder : PromptBuilder, optional
+            Builds the story prompts (defaults to the configured locale and tone).
         llama_client : LlamaClient, optional
-            The client for interacting with the LLaMA API.
+            The completion client (defaults to one configured from the
+            environment).
         """
-        self.llama_client = LlamaClient()
+        self.llama_client = llama_client or LlamaClient()
+        self.prompt_builder = prompt_builder or PromptBuilder()
 
     def generate(
         self, characters: List[Character], scenario: Scenario, narrative_style: str
@@ -42,16 +52,13 @@ class LlamaStoryGenerator(BaseStoryGenerator):
             A generated Story object.
         """
 
-        main_character = characters[0]
-        supporting_characters = characters[1:]
-
-        prompt = self._create_prompt(
-            main_character, supporting_characters, scenario, narrative_style
-        )
+        with phase("prompt"):
+            prompt = self.prompt_builder.build(characters, scenario, narrative_style)
 
-        story_text = self.llama_client.generate_text(
-            prompt, max_tokens=1000, temperature=0.5
-        )
+        with phase("llm"):
+            story_text = self.llama_client.generate_text(
+                prompt.text, max_tokens=1000, temperature=0.5, prefix=prompt.prefix
+            )
 
         return Story(
             title=f"The Journey of {characters[0].name}",
@@ -60,51 +67,3 @@ class LlamaStoryGenerator(BaseStoryGenerator):
             scenario=scenario,
             narrative_style=narrative_style,
         )
-
-    def _create_prompt(
-        self,
-        main_character: Character,
-        supporting_characters: List[Character],
-        scenario: Scenario,
-        narrative_style: str,
-    ) -> str:
-        """
-        Generates a structured prompt for the LLaMA API.
-
-        Parameters
-        ----------
-        main_character : Character
-            The main character of the story.
-        supporting_characters : List[Character]
-            List of supporting characters.
-        scenario : Scenario
-            The story scenario.
-        narrative_style : str
-            The selected narrative style.
-
-        Returns
-        -------
-        str
-            A structured prompt for the story generation.
-        """
-
-        supporting_text = ""
-        if supporting_characters:
-            supporting_text = " They are joined by "
-            supporting_text += (
-                ", ".join(
-                    f"{char.name} (a {char.personality} friend with {char.superpower})"
-                    for char in supporting_characters
-                )
-                + "."
-            )
-
-        return (
-            f"Write a {narrative_style} story for kids aged 3-8 featuring {main_character.name}."
-            f"{main_character.name} loves {main_character.favorite_color}, has an animal friend {main_character.animal_friend}, "
-            f"and has the superpower of {main_character.superpower}. Their favorite hobby is {main_character.hobby}. "
-            f"They are {main_character.personality}.{supporting_text} "
-            f"The story takes place in {scenario.name}, described as {scenario.description}. "
-            f"Make it in portuguese language, fun, religious, educative (telling about God), engaging, "
-            f"child-friendly, with a happy ending and a teaching moral!"
-        )
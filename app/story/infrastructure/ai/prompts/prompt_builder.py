@@ -0,0 +1,185 @@
+import os
+from string import Formatter
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from app.character.domain.entities.character import Character
+from app.scenario.domain.entities.scenario import Scenario
+from app.story.infrastructure.ai.prompts import templates
+
+
+class Prompt(NamedTuple):
+    """A rendered prompt, split into a static prefix and a per-request suffix."""
+
+    prefix: str
+    suffix: str
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.suffix
+
+
+class PromptTemplate:
+    """
+    A prompt template parsed once and rendered many times.
+
+    The placeholders of every format string are checked when the template is
+    created, so a broken template fails at startup instead of on the first
+    request.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        story: str,
+        supporting_character: str,
+        no_supporting_characters: str,
+    ) -> None:
+        self.prefix = prefix
+        self.no_supporting_characters = no_supporting_characters
+        self._story = self._compile(
+            story,
+            {
+                "narrative_style",
+                "name",
+                "favorite_color",
+                "animal_friend",
+                "superpower",
+                "hobby",
+                "personality",
+                "supporting_characters",
+                "scenario_name",
+                "scenario_description",
+            },
+        )
+        self._supporting_character = self._compile(
+            supporting_character, {"name", "personality", "superpower"}
+        )
+
+    def render(
+        self, characters: List[Character], scenario: Scenario, narrative_style: str
+    ) -> Prompt:
+        """
+        Render the prompt of a story.
+
+        Parameters
+        ----------
+        characters : List[Character]
+            Characters of the story, the first one is the main character.
+        scenario : Scenario
+            The setting of the story.
+        narrative_style : str
+            The storytelling style.
+
+        Returns
+        -------
+        Prompt
+            The static prefix and the rendered suffix.
+        """
+        main_character = characters[0]
+        supporting = characters[1:]
+
+        supporting_text = (
+            ", ".join(
+                self._supporting_character(
+                    name=char.name,
+                    personality=char.personality,
+                    superpower=char.superpower,
+                )
+                for char in supporting
+            )
+            or self.no_supporting_characters
+        )
+
+        suffix = self._story(
+            narrative_style=narrative_style,
+            name=main_character.name,
+            favorite_color=main_character.favorite_color,
+            animal_friend=main_character.animal_friend,
+            superpower=main_character.superpower,
+            hobby=main_character.hobby,
+            personality=main_character.personality,
+            supporting_characters=supporting_text,
+            scenario_name=scenario.name,
+            scenario_description=scenario.description,
+        )
+
+        return Prompt(self.prefix, suffix)
+
+    @staticmethod
+    def _compile(template: str, fields: set) -> Callable[..., str]:
+        used = {name for _, name, _, _ in Formatter().parse(template) if name}
+        unknown = used - fields
+        if unknown:
+            raise ValueError(f"Unknown prompt placeholders: {sorted(unknown)}")
+        return template.format
+
+
+def _build_templates() -> Dict[Tuple[str, str], PromptTemplate]:
+    return {
+        (locale, tone): PromptTemplate(
+            prefix=templates.ROLE + language + tone_text,
+            story=templates.STORY,
+            supporting_character=templates.SUPPORTING_CHARACTER,
+            no_supporting_characters=templates.NO_SUPPORTING_CHARACTERS,
+        )
+        for locale, language in templates.LANGUAGES.items()
+        for tone, tone_text in templates.TONES.items()
+    }
+
+
+TEMPLATES: Dict[Tuple[str, str], PromptTemplate] = _build_templates()
+
+
+class PromptBuilder:
+    """Builds story prompts from the template of a locale and tone."""
+
+    def __init__(self, locale: str | None = None, tone: str | None = None) -> None:
+        """
+        Initializes the prompt builder.
+
+        Parameters
+        ----------
+        locale : str, optional
+            Language of the generated stories, e.g. "en" or "pt-BR" (defaults to
+            the PROMPT_LOCALE environment variable).
+        tone : str, optional
+            Tone of the generated stories, e.g. "default" or "religious" (defaults
+            to the PROMPT_TONE environment variable).
+
+        Raises
+        ------
+        ValueError
+            If there is no template for the locale and tone.
+        """
+        self.locale = locale or os.getenv("PROMPT_LOCALE", "en")
+        self.tone = tone or os.getenv("PROMPT_TONE", "default")
+
+        template = TEMPLATES.get((self.locale, self.tone))
+        if template is None:
+            raise ValueError(
+                f"No prompt template for locale '{self.locale}' and tone "
+                f"'{self.tone}'. Available: {sorted(TEMPLATES)}"
+            )
+        self.template = template
+
+    def build(
+        self, characters: List[Character], scenario: Scenario, narrative_style: str
+    ) -> Prompt:
+        """
+        Build the prompt of a story.
+
+        Parameters
+        ----------
+        characters : List[Character]
+            Characters of the story, the first one is the main character.
+        scenario : Scenario
+            The setting of the story.
+        narrative_style : str
+            The storytelling style.
+
+        Returns
+        -------
+        Prompt
+            The static prefix and the rendered suffix.
+        """
+        return self.template.render(characters, scenario, narrative_style)
@@ -0,0 +1,44 @@
+from typing import Dict
+
+# Static instructions, identical for every request of a locale/tone pair. They form
+# the start of the prompt so inference servers can reuse their cached prefix.
+ROLE = (
+    "You are an expert children's story writer. You write stories for kids aged "
+    "3-8.\n"
+    "Make every story engaging, fun and suitable for young children. Use simple "
+    "words and short sentences.\n"
+)
+
+LANGUAGES: Dict[str, str] = {
+    "en": "Write the story in English.\n",
+    "pt-BR": "Write the story in Brazilian Portuguese.\n",
+}
+
+TONES: Dict[str, str] = {
+    "default": "Give the story a happy ending.\n",
+    "religious": (
+        "Make the story religious and educative, telling about God, with a happy "
+        "ending and a teaching moral.\n"
+    ),
+}
+
+# Per-request part of the prompt, appended after the static prefix.
+STORY = (
+    "\n"
+    "Write a {narrative_style} story.\n"
+    "\n"
+    "Main Character: {name}\n"
+    "Favorite Color: {favorite_color}\n"
+    "Animal Friend: {animal_friend}\n"
+    "Superpower: {superpower}\n"
+    "Hobby: {hobby}\n"
+    "Personality: {personality}\n"
+    "\n"
+    "Other Characters: {supporting_characters}.\n"
+    "\n"
+    "Setting: {scenario_name} - {scenario_description}\n"
+)
+
+SUPPORTING_CHARACTER = "{name} (a {personality} friend with {superpower})"
+
+NO_SUPPORTING_CHARACTERS = "none"
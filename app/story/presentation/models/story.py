@@ -1,8 +1,9 @@
-from typing import List
+from typing import Dict, List
 
 from pydantic import BaseModel, Field
 
 from app.character.presentation.models.character import CharacterResponse
+from app.core.presentation.models.reference import EntityReference
 from app.scenario.presentation.models.scenario import ScenarioResponse
 
 
@@ -19,12 +20,52 @@ class GenerateStoryRequest(BaseModel):
 
 
 class GenerateStoryResponse(BaseModel):
-    """Response model for the generated story."""
+    """
+    Response model for the generated story.
+
+    The characters and the scenario are only their ids unless they are
+    expanded with ``expand=characters,scenario``.
+    """
 
     title: str = Field(..., examples=["The Adventures of Luna and the Magic Forest"])
     content: str = Field(..., examples=["Once upon a time in a magical forest..."])
-    characters: List[CharacterResponse]
-    scenario: ScenarioResponse
+    characters: List[CharacterResponse | EntityReference]
+    scenario: ScenarioResponse | EntityReference
     narrative_style: str = Field(
         ..., examples=["adventurous"], description="The storytelling style."
     )
+
+
+class GenerateStoriesBatchRequest(BaseModel):
+    """Request model for generating several stories in one call."""
+
+    stories: List[GenerateStoryRequest] = Field(..., min_length=1)
+
+
+class BatchStoryResult(BaseModel):
+    """One NDJSON line of the batch generation response."""
+
+    index: int = Field(..., description="Position of the story in the request.")
+    status: str = Field(..., examples=["ok", "error"])
+    story: GenerateStoryResponse | None = None
+    error: str | None = Field(None, examples=["Scenario not found."])
+    retry_after: int | None = Field(
+        None, description="Seconds to wait before retrying a rejected story."
+    )
+
+
+class AdmissionStatsResponse(BaseModel):
+    """Response model for the admission statistics of a story backend."""
+
+    backend: str = Field(..., examples=["llama"])
+    mode: str = Field(..., examples=["static", "aimd"])
+    limit: int = Field(..., description="Concurrent generations currently allowed.")
+    in_flight: int = Field(..., description="Generations currently running.")
+    queue_depth: int = Field(..., description="Requests waiting for a slot.")
+    max_queue_size: int
+    admitted_total: int
+    rejected_total: Dict[str, int] = Field(
+        ..., examples=[{"queue_full": 0, "queue_timeout": 0}]
+    )
+    wait_seconds_total: float
+    wait_seconds_max: float
@@ -1,19 +1,47 @@
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from starlette import status
 
-from app.auth.application.decorators.auth_decorator import require_auth
-from app.core.dependencies import get_generate_story_use_case
+from app.auth.application.decorators.auth_decorator import require_admin, require_auth
+from app.core.admission import AdmissionController
+from app.core.dependencies import (
+    get_admission_controller,
+    get_generate_stories_batch_use_case,
+    get_generate_story_use_case,
+    get_story_generator_type,
+    get_usage_aggregator,
+)
+from app.core.exceptions.admission_exceptions import AdmissionRejectedError
+from app.core.fieldsets import field_selection
+from app.core.responses import EntityJSONResponse, json_dumps
+from app.story.application.use_cases.generate_stories_batch import (
+    BatchResult,
+    GenerateStoriesBatchUseCase,
+    PreparedStory,
+    StorySpec,
+)
 from app.story.application.use_cases.generate_story import GenerateStoryUseCase
+from app.story.domain.entities.story import Story
 from app.story.domain.exceptions.story_exceptions import StoryValidationError
 from app.story.presentation.models.story import (
+    AdmissionStatsResponse,
+    BatchStoryResult,
+    GenerateStoriesBatchRequest,
     GenerateStoryRequest,
     GenerateStoryResponse,
 )
+from app.usage.application.services.usage_aggregator import UsageAggregator
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+story_fields = field_selection(GenerateStoryResponse, ("characters", "scenario"))
+
 
 @router.post(
     "/generate",
@@ -24,6 +52,7 @@ router = APIRouter()
         401: {"description": "Unauthorized - Invalid or missing token"},
         403: {"description": "Forbidden - Inactive user"},
         422: {"description": "Validation Error - Invalid story parameters"},
+        503: {"description": "Service Unavailable - Story generation is saturated"},
     },
     openapi_extra={"security": [{"bearerAuth": []}]},
 )
@@ -32,10 +61,16 @@ async def generate_story(
     request: Request,
     story_request: GenerateStoryRequest,
     story_use_case: GenerateStoryUseCase = Depends(get_generate_story_use_case),
+    backend: str = Depends(get_story_generator_type),
+    usage_aggregator: UsageAggregator = Depends(get_usage_aggregator),
+    include: Mapping[str, Any] = Depends(story_fields),
 ):
     """
     Generate a story using the selected characters, scenario, and narrative style.
 
+    The characters and the scenario are returned as ids unless they are listed
+    in ``expand``; ``fields`` limits the response to the fields listed.
+
     Parameters
     ----------
     request : Request
@@ -43,7 +78,14 @@ async def generate_story(
     story_request : GenerateStoryRequest
         The request body containing character IDs, scenario ID, and narrative style
     story_use_case : GenerateStoryUseCase
-        The use case for story generation, injected via dependency
+        The use case for story generation, injected via dependency; it limits
+        the concurrent generations per backend
+    backend : str
+        The configured story generator backend
+    usage_aggregator : UsageAggregator
+        Accumulates the token usage of the user, injected via dependency
+    include : Mapping[str, Any]
+        The fields to serialize, from the ``fields`` and ``expand`` parameters
 
     Returns
     -------
@@ -53,10 +95,11 @@ async def generate_story(
     Raises
     ------
     HTTPException
-        If story validation fails with 422 status code
+        If story validation fails with 422 status code, or 503 with a
+        ``Retry-After`` header when the backend is saturated
     """
     try:
-        return await story_use_case.execute(
+        story = await story_use_case.execute(
             character_ids=[UUID(cid) for cid in story_request.character_ids],
             scenario_id=UUID(story_request.scenario_id),
             narrative_style=story_request.narrative_style,
@@ -65,3 +108,173 @@ async def generate_story(
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
         )
+    except AdmissionRejectedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+    usage_aggregator.record(request.state.user.id, backend, story.usage)
+    # The story is built from validated entities, serialize it as is.
+    return EntityJSONResponse(
+        story,
+        GenerateStoryResponse,
+        status_code=status.HTTP_201_CREATED,
+        include=include,
+    )
+
+
+@router.post(
+    "/generate/batch",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One JSON object per line, in completion order",
+            "content": {"application/x-ndjson": {}},
+        },
+        401: {"description": "Unauthorized - Invalid or missing token"},
+        403: {"description": "Forbidden - Inactive user"},
+        422: {"description": "Validation Error - Invalid batch"},
+    },
+    openapi_extra={"security": [{"bearerAuth": []}]},
+)
+@require_auth
+async def generate_stories_batch(
+    request: Request,
+    batch_request: GenerateStoriesBatchRequest,
+    batch_use_case: GenerateStoriesBatchUseCase = Depends(
+        get_generate_stories_batch_use_case
+    ),
+    usage_aggregator: UsageAggregator = Depends(get_usage_aggregator),
+    include: Mapping[str, Any] = Depends(story_fields),
+):
+    """
+    Generate several stories concurrently, streaming each one as NDJSON as soon
+    as it is ready.
+
+    Every line is a ``BatchStoryResult`` carrying the ``index`` of the story in the
+    request. A story that fails validation or generation is reported on its own
+    line with ``status`` ``error`` (or ``rejected`` when the backend is saturated)
+    without failing the rest of the batch. ``fields`` and ``expand`` shape the
+    stories as in ``/generate``.
+
+    Parameters
+    ----------
+    request : Request
+        The FastAPI request object containing user state
+    batch_request : GenerateStoriesBatchRequest
+        The list of stories to generate
+    batch_use_case : GenerateStoriesBatchUseCase
+        The use case for batch story generation, injected via dependency
+    usage_aggregator : UsageAggregator
+        Accumulates the token usage of the user, injected via dependency
+    include : Mapping[str, Any]
+        The fields of the stories to serialize
+
+    Returns
+    -------
+    StreamingResponse
+        An ``application/x-ndjson`` stream of ``BatchStoryResult`` lines
+
+    Raises
+    ------
+    HTTPException
+        With 422 status code if the batch is too large or holds malformed IDs
+    """
+    try:
+        specs = [
+            StorySpec(
+                character_ids=[UUID(cid) for cid in item.character_ids],
+                scenario_id=UUID(item.scenario_id),
+                narrative_style=item.narrative_style,
+            )
+            for item in batch_request.stories
+        ]
+        # Load everything from the database before streaming starts, the session
+        # is released once the response begins.
+        prepared = await batch_use_case.prepare(specs)
+    except (StoryValidationError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+
+    def record_usage(story: Story) -> None:
+        usage_aggregator.record(
+            request.state.user.id, batch_use_case.backend, story.usage
+        )
+
+    return StreamingResponse(
+        _stream_batch(batch_use_case, prepared, record_usage, include),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _stream_batch(
+    batch_use_case: GenerateStoriesBatchUseCase,
+    prepared: List[PreparedStory],
+    on_story: Callable[[Story], None],
+    include: Mapping[str, Any],
+) -> AsyncIterator[bytes]:
+    async for result in batch_use_case.stream(prepared):
+        if isinstance(result[1], Story):
+            on_story(result[1])
+        yield _to_batch_line(result, include) + b"\n"
+
+
+def _to_batch_line(result: BatchResult, include: Mapping[str, Any]) -> bytes:
+    index, outcome = result
+
+    if isinstance(outcome, StoryValidationError):
+        line = BatchStoryResult(index=index, status="error", error=str(outcome))
+    elif isinstance(outcome, AdmissionRejectedError):
+        line = BatchStoryResult(
+            index=index,
+            status="rejected",
+            error=str(outcome),
+            retry_after=outcome.retry_after,
+        )
+    elif isinstance(outcome, Exception):
+        logger.error("Batch story %d failed", index, exc_info=outcome)
+        line = BatchStoryResult(
+            index=index, status="error", error="Story generation failed."
+        )
+    else:
+        # Same shape as BatchStoryResult, without re-validating the story.
+        story = outcome.model_dump(mode="json", include=include)
+        return json_dumps({"index": index, "status": "ok", "story": story})
+
+    return line.__pydantic_serializer__.to_json(line, exclude_none=True)
+
+
+@router.get(
+    "/admission",
+    response_model=Dict[str, AdmissionStatsResponse],
+    responses={
+        401: {"description": "Unauthorized - Invalid or missing token"},
+        403: {"description": "Forbidden - Not an administrator"},
+    },
+    openapi_extra={"security": [{"bearerAuth": []}]},
+)
+@require_admin
+async def get_admission_stats(
+    request: Request,
+    admission_controller: AdmissionController = Depends(get_admission_controller),
+):
+    """
+    Expose queue depth, wait time and rejection counts of each story backend.
+
+    Parameters
+    ----------
+    request : Request
+        The FastAPI request object containing user state
+    admission_controller : AdmissionController
+        The shared admission controller, injected via dependency
+
+    Returns
+    -------
+    Dict[str, AdmissionStatsResponse]
+        Admission statistics keyed by backend name.
+    """
+    return admission_controller.stats()
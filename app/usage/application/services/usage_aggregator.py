@@ -0,0 +1,132 @@
+import asyncio
+import contextlib
+import logging
+from datetime import UTC, date, datetime
+from typing import AsyncContextManager, Callable, Dict, Tuple
+from uuid import UUID
+
+from app.core.usage import TokenUsage
+from app.usage.domain.entities.usage_rollup import UsageRollup
+from app.usage.domain.interfaces.usage_repository import BaseUsageRepository
+
+logger = logging.getLogger(__name__)
+
+RollupKey = Tuple[date, UUID, str]
+
+
+class UsageAggregator:
+    """
+    Sums the token usage of every story in memory, per day, user and backend, and
+    writes it to the rollup table every ``flush_interval`` seconds with a single
+    upsert, instead of one write per request.
+
+    Usage recorded since the last flush is lost if the process is killed; a
+    graceful shutdown flushes it.
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], AsyncContextManager[BaseUsageRepository]],
+        flush_interval: float = 60.0,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        repository_factory : Callable[[], AsyncContextManager[BaseUsageRepository]]
+            Opens a repository (and its session) for one flush.
+        flush_interval : float
+            Seconds between two flushes.
+        """
+        self.repository_factory = repository_factory
+        self.flush_interval = flush_interval
+        self._pending: Dict[RollupKey, UsageRollup] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of rollups waiting for the next flush."""
+        return len(self._pending)
+
+    def record(self, user_id: UUID, backend: str, usage: TokenUsage | None) -> None:
+        """
+        Add the usage of one story to the pending rollups.
+
+        Parameters
+        ----------
+        user_id : UUID
+            The user who requested the story.
+        backend : str
+            The story generator backend.
+        usage : TokenUsage, optional
+            The usage collected while generating the story; ignored when missing.
+        """
+        if usage is None:
+            return
+
+        rollup = self._rollup((datetime.now(UTC).date(), user_id, backend))
+        rollup.stories += 1
+        rollup.prompt_tokens += usage.prompt_tokens
+        rollup.cached_tokens += usage.cached_tokens
+        rollup.completion_tokens += usage.completion_tokens
+        rollup.generation_seconds += usage.generation_seconds
+
+    async def flush(self) -> int:
+        """
+        Write the pending rollups. On failure they are kept for the next flush.
+
+        Returns
+        -------
+        int
+            Number of rollups written.
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        try:
+            async with self.repository_factory() as repository:
+                await repository.add(list(pending.values()))
+        except Exception:
+            logger.exception("Failed to flush %d usage rollups", len(pending))
+            self._merge_back(pending)
+            return 0
+
+        return len(pending)
+
+    def _rollup(self, key: RollupKey) -> UsageRollup:
+        rollup = self._pending.get(key)
+        if rollup is None:
+            day, user_id, backend = key
+            rollup = self._pending[key] = UsageRollup(
+                day=day, user_id=user_id, backend=backend
+            )
+        return rollup
+
+    def _merge_back(self, pending: Dict[RollupKey, UsageRollup]) -> None:
+        for key, rollup in pending.items():
+            current = self._rollup(key)
+            current.stories += rollup.stories
+            current.prompt_tokens += rollup.prompt_tokens
+            current.cached_tokens += rollup.cached_tokens
+            current.completion_tokens += rollup.completion_tokens
+            current.generation_seconds += rollup.generation_seconds
+
+    def start(self) -> None:
+        """Start flushing periodically in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write what is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
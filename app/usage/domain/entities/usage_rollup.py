@@ -0,0 +1,19 @@
+from datetime import date
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class UsageRollup(BaseModel):
+    """LLM usage of one user on one story backend, summed over a day."""
+
+    day: date
+    user_id: UUID
+    backend: str = Field(..., examples=["llama", "chatgpt", "local"])
+    stories: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+    generation_seconds: float = 0.0
+
+    model_config = ConfigDict(from_attributes=True)
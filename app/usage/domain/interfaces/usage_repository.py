@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+from app.usage.domain.entities.usage_rollup import UsageRollup
+
+
+class BaseUsageRepository(ABC):
+    """Abstract base class for the usage rollup repository."""
+
+    @abstractmethod
+    async def add(self, rollups: List[UsageRollup]) -> None:
+        """
+        Add the given usage to the stored rollups of the same day, user and
+        backend, creating the rollups that do not exist yet.
+
+        Parameters
+        ----------
+        rollups : List[UsageRollup]
+            Usage accumulated since the last call.
+        """
+
+    @abstractmethod
+    async def get_by_user(self, user_id: UUID) -> List[UsageRollup]:
+        """
+        Retrieve the rollups of a user, most recent day first.
+
+        Parameters
+        ----------
+        user_id : UUID
+            The unique identifier of the user.
+
+        Returns
+        -------
+        List[UsageRollup]
+            One rollup per day and backend.
+        """
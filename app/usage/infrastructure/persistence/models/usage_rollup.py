@@ -0,0 +1,29 @@
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import Date, Float, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.infrastructure.persistence.models.base import BaseModel
+
+
+class UsageRollup(BaseModel):
+    """Daily LLM usage per user and story backend."""
+
+    __tablename__ = "usage_rollups"
+    __table_args__ = (
+        UniqueConstraint("day", "user_id", "backend", name="uq_usage_rollups_key"),
+        # get_by_user; the unique key starts with the day.
+        Index("ix_usage_rollups_user_id_day", "user_id", "day"),
+    )
+
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    user_id: Mapped[UUID] = mapped_column(nullable=False)
+    backend: Mapped[str] = mapped_column(String, nullable=False)
+    stories: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    prompt_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cached_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completion_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    generation_seconds: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0
+    )
@@ -0,0 +1,77 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.usage.domain.entities.usage_rollup import UsageRollup as UsageRollupEntity
+from app.usage.domain.interfaces.usage_repository import BaseUsageRepository
+from app.usage.infrastructure.persistence.models.usage_rollup import (
+    UsageRollup as UsageRollupModel,
+)
+
+COUNTERS = (
+    "stories",
+    "prompt_tokens",
+    "cached_tokens",
+    "completion_tokens",
+    "generation_seconds",
+)
+
+
+class UsageRepository(BaseUsageRepository):
+    """Implementation of the usage rollup repository."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, rollups: List[UsageRollupEntity]) -> None:
+        """
+        Upsert the rollups in a single statement, incrementing the counters of the
+        rows that already exist.
+
+        Parameters
+        ----------
+        rollups : List[UsageRollupEntity]
+            Usage accumulated since the last flush.
+        """
+        if not rollups:
+            return
+
+        statement = insert(UsageRollupModel).values(
+            [rollup.model_dump() for rollup in rollups]
+        )
+        table = UsageRollupModel.__table__
+        statement = statement.on_conflict_do_update(
+            constraint="uq_usage_rollups_key",
+            set_={
+                column: table.c[column] + statement.excluded[column]
+                for column in COUNTERS
+            },
+        )
+
+        await self.session.execute(statement)
+        await self.session.commit()
+
+    async def get_by_user(self, user_id: UUID) -> List[UsageRollupEntity]:
+        """
+        Retrieve the rollups of a user, most recent day first.
+
+        Parameters
+        ----------
+        user_id : UUID
+            The unique identifier of the user.
+
+        Returns
+        -------
+        List[UsageRollupEntity]
+            One rollup per day and backend.
+        """
+        result = await self.session.execute(
+            select(UsageRollupModel)
+            .filter_by(user_id=user_id)
+            .order_by(UsageRollupModel.day.desc(), UsageRollupModel.backend)
+        )
+
+        return [UsageRollupEntity.model_validate(r) for r in result.scalars().all()]
@@ -0,0 +1,106 @@
+"""
+Insert throughput and primary key index size with random (v4) and
+time-ordered (v7) UUID keys.
+
+    python -m benchmarks.db.bench_uuid_keys --rows 1000000
+
+Fills a scratch table per key version in the configured database, in batches,
+and reports the insert rate and the size of the table and of its primary key
+index. The tables are dropped afterwards.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, NamedTuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import Column, MetaData, String, Table, Uuid, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.ids import uuid7
+from app.core.settings.config import settings
+
+KEYS: dict[str, Callable[[], UUID]] = {"uuid4": uuid4, "uuid7": uuid7}
+
+
+class KeyResult(NamedTuple):
+    key: str
+    rows: int
+    seconds: float
+    table_bytes: int
+    index_bytes: int
+
+
+def _table(name: str) -> Table:
+    return Table(
+        f"bench_{name}_keys",
+        MetaData(),
+        Column("id", Uuid, primary_key=True),
+        Column("name", String, nullable=False),
+    )
+
+
+async def measure(
+    engine: AsyncEngine, key: str, rows: int, batch_size: int
+) -> KeyResult:
+    table = _table(key)
+    new_id = KEYS[key]
+    async with engine.begin() as conn:
+        await conn.run_sync(table.drop, checkfirst=True)
+        await conn.run_sync(table.create)
+
+    started_at = time.perf_counter()
+    for start in range(0, rows, batch_size):
+        batch = [
+            {"id": new_id(), "name": f"Character {i}"}
+            for i in range(start, min(start + batch_size, rows))
+        ]
+        async with engine.begin() as conn:
+            await conn.execute(table.insert(), batch)
+    seconds = time.perf_counter() - started_at
+
+    async with engine.begin() as conn:
+        sizes = await conn.execute(
+            text("SELECT pg_table_size(:table), pg_relation_size(:index)").bindparams(
+                table=table.name, index=f"{table.name}_pkey"
+            )
+        )
+        table_bytes, index_bytes = sizes.one()
+        await conn.run_sync(table.drop)
+
+    return KeyResult(key, rows, seconds, table_bytes, index_bytes)
+
+
+def report(results: list[KeyResult]) -> str:
+    lines = [
+        f"{'key':<6}  {'rows':>10}  {'rows/s':>10}  {'table':>10}  {'pk index':>10}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.key:<6}  {result.rows:>10}  {result.rows / result.seconds:>10.0f}"
+            f"  {result.table_bytes / 2**20:>7.1f} MB"
+            f"  {result.index_bytes / 2**20:>7.1f} MB"
+        )
+    return "\n".join(lines)
+
+
+async def run(rows: int, batch_size: int) -> list[KeyResult]:
+    engine = create_async_engine(settings.get_database_url())
+    try:
+        return [await measure(engine, key, rows, batch_size) for key in KEYS]
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.db.bench_uuid_keys")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(report(asyncio.run(run(args.rows, args.batch_size))))
+
+
+if __name__ == "__main__":
+    main()
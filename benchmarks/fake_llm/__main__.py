@@ -0,0 +1,47 @@
+import argparse
+
+import uvicorn
+
+from benchmarks.fake_llm.config import FakeLLMConfig
+from benchmarks.fake_llm.server import create_app
+
+
+def _flag(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes")
+
+
+def _argument_type(default):
+    if isinstance(default, bool):
+        return _flag
+    return type(default) if default is not None else str
+
+
+def parse_config() -> tuple[FakeLLMConfig, argparse.Namespace]:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.fake_llm",
+        description="Fake OpenAI / llama.cpp compatible inference server.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+
+    for name, field in FakeLLMConfig.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            type=_argument_type(field.default),
+            default=field.default,
+            help=field.description,
+        )
+
+    args = parser.parse_args()
+    values = {name: getattr(args, name) for name in FakeLLMConfig.model_fields}
+    return FakeLLMConfig(**values), args
+
+
+def main() -> None:
+    config, args = parse_config()
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark ``LlamaClient`` and ``OpenAIClient`` against the fake LLM server.
+
+    python -m benchmarks.fake_llm.bench_clients --requests 200 --concurrency 16
+
+Every request uses a prompt built by the real prompt builder, so the static prefix
+hits the simulated prompt cache the same way it would on a llama.cpp server.
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from app.core.infrastructure.ai.clients.llama_client import LlamaClient
+from app.core.infrastructure.ai.clients.openai_client import OpenAIClient
+from app.story.infrastructure.ai.prompts.prompt_builder import Prompt, PromptBuilder
+from benchmarks.fake_llm.config import FakeLLMConfig
+from benchmarks.fake_llm.runner import running_server
+from benchmarks.stats import summarize
+from tests.utils.fakers import CharacterFactory, ScenarioFactory
+
+
+def build_prompts(count: int) -> List[Prompt]:
+    builder = PromptBuilder(locale="en", tone="default")
+    scenario = ScenarioFactory()
+    return [
+        builder.build([CharacterFactory() for _ in range(2)], scenario, "adventurous")
+        for _ in range(count)
+    ]
+
+
+def run_client(
+    call: Callable[[Prompt], str], prompts: List[Prompt], concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+
+    def timed(prompt: Prompt) -> None:
+        nonlocal errors
+        started_at = time.perf_counter()
+        try:
+            call(prompt)
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, prompts))
+
+    return summarize(latencies, errors, time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--ttft-ms", type=float, default=200.0)
+    parser.add_argument("--tokens-per-second", type=float, default=200.0)
+    parser.add_argument("--output-tokens", type=int, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--llama-batch-size", type=int, default=1)
+    args = parser.parse_args()
+
+    config = FakeLLMConfig(
+        ttft_ms=args.ttft_ms,
+        tokens_per_second=args.tokens_per_second,
+        output_tokens=args.output_tokens,
+        error_rate=args.error_rate,
+    )
+    prompts = build_prompts(args.requests)
+
+    with running_server(config, port=args.port) as base_url:
+        llama = LlamaClient(
+            model="fake-llm",
+            api_url=f"{base_url}/v1/completions",
+            batch_max_size=args.llama_batch_size,
+            slot_count=config.slots,
+        )
+        openai = OpenAIClient(
+            model="fake-llm", api_key="fake", base_url=f"{base_url}/v1"
+        )
+
+        results = {
+            "llama": run_client(
+                lambda prompt: llama.generate_text(
+                    prompt.text, max_tokens=args.output_tokens, prefix=prompt.prefix
+                ),
+                prompts,
+                args.concurrency,
+            ),
+            "openai": run_client(
+                lambda prompt: openai.generate_text(
+                    prompt.text, max_tokens=args.output_tokens
+                ),
+                prompts,
+                args.concurrency,
+            ),
+        }
+        results["llama"]["prompt_cache"] = llama.prompt_cache.snapshot()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+
+
+class FakeLLMConfig(BaseModel):
+    """Latency, failure and output model of the fake inference server."""
+
+    seed: int = Field(42, description="Seeds latency sampling and generated text.")
+    model: str = "fake-llm"
+
+    ttft_ms: float = Field(
+        300.0, ge=0, description="Median time to first token, excluding prompt eval."
+    )
+    ttft_sigma: float = Field(
+        0.25, ge=0, description="Log-normal spread of the time to first token."
+    )
+    prompt_ms_per_token: float = Field(
+        0.5, ge=0, description="Cost of evaluating one uncached prompt token."
+    )
+    tokens_per_second: float = Field(40.0, gt=0)
+    tokens_per_second_jitter: float = Field(
+        0.1, ge=0, description="Relative standard deviation of the generation speed."
+    )
+    output_tokens: int = Field(
+        200, ge=1, description="Tokens generated when max_tokens allows it."
+    )
+
+    error_rate: float = Field(0.0, ge=0, le=1)
+    error_status: int = 500
+    stall_rate: float = Field(
+        0.0, ge=0, le=1, description="Share of requests pausing once mid-generation."
+    )
+    stall_ms: float = Field(2000.0, ge=0)
+
+    slots: int = Field(4, ge=1, description="Simulated KV cache slots.")
+    batching: bool = Field(True, description="Accept a list of prompts.")
+
+    @classmethod
+    def instant(cls, **overrides) -> "FakeLLMConfig":
+        """A configuration without any latency, for tests."""
+        values = {
+            "ttft_ms": 0.0,
+            "ttft_sigma": 0.0,
+            "prompt_ms_per_token": 0.0,
+            "tokens_per_second": 1e9,
+            "tokens_per_second_jitter": 0.0,
+        }
+        values.update(overrides)
+        return cls(**values)
@@ -0,0 +1,40 @@
+import contextlib
+import threading
+import time
+from typing import Iterator
+
+import uvicorn
+
+from benchmarks.fake_llm.config import FakeLLMConfig
+from benchmarks.fake_llm.server import create_app
+
+
+@contextlib.contextmanager
+def running_server(
+    config: FakeLLMConfig | None = None, host: str = "127.0.0.1", port: int = 8089
+) -> Iterator[str]:
+    """
+    Serve the fake LLM from a background thread for the duration of the block.
+
+    Yields
+    ------
+    str
+        Base URL of the server, e.g. ``http://127.0.0.1:8089``.
+    """
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(config), host=host, port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError(f"Fake LLM server did not start on {host}:{port}")
+        time.sleep(0.01)
+
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
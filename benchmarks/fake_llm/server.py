@@ -0,0 +1,376 @@
+"""
+Fake inference server speaking the OpenAI chat-completions and the llama.cpp
+``/v1/completions`` protocols, with seeded latency and deterministic output.
+
+Run it with ``python -m benchmarks.fake_llm --help``.
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from typing import AsyncIterator, Dict, List, NamedTuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.fake_llm.config import FakeLLMConfig
+
+VOCABULARY = (
+    "once upon a time there was a brave little fox who loved the moon and the "
+    "stars every night she climbed the tallest hill in the magic forest to sing "
+    "with her friends the owl the rabbit and the old wise turtle until the sun "
+    "came back"
+).split()
+
+
+def tokenize(text: str) -> List[str]:
+    """Whitespace tokens, good enough to count and to compare prefixes."""
+    return text.split()
+
+
+def generate_tokens(seed: int, prompt: str, count: int) -> List[str]:
+    """The same seed and prompt always produce the same tokens."""
+    rng = random.Random(f"{seed}:{prompt}")
+    return [rng.choice(VOCABULARY) for _ in range(count)]
+
+
+def sse(chunk: dict) -> str:
+    return f"data: {json.dumps(chunk)}\n\n"
+
+
+def usage(evaluation: dict, completion_tokens: int) -> dict:
+    return {
+        "prompt_tokens": evaluation["prompt_tokens"],
+        "completion_tokens": completion_tokens,
+        "total_tokens": evaluation["prompt_tokens"] + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": evaluation["cached"]},
+    }
+
+
+def common_prefix_length(a: List[str], b: List[str]) -> int:
+    length = 0
+    for left, right in zip(a, b):
+        if left != right:
+            break
+        length += 1
+    return length
+
+
+class Completion(NamedTuple):
+    """One simulated completion, before its tokens are sent."""
+
+    tokens: List[str]
+    evaluation: dict
+    ttft: float
+    stall: bool
+
+
+class Simulation:
+    """Samples latencies and keeps the simulated prompt cache of each slot."""
+
+    def __init__(self, config: FakeLLMConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.slots: List[List[str]] = [[] for _ in range(config.slots)]
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "errors": 0,
+            "stalls": 0,
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "completion_tokens": 0,
+        }
+
+    def should_fail(self) -> bool:
+        return self.rng.random() < self.config.error_rate
+
+    def should_stall(self) -> bool:
+        return self.rng.random() < self.config.stall_rate
+
+    def ttft(self) -> float:
+        config = self.config
+        if config.ttft_ms <= 0:
+            return 0.0
+        return config.ttft_ms * math.exp(self.rng.gauss(0, config.ttft_sigma)) / 1000
+
+    def token_interval(self) -> float:
+        config = self.config
+        speed = self.rng.gauss(
+            config.tokens_per_second,
+            config.tokens_per_second * config.tokens_per_second_jitter,
+        )
+        return 1 / max(speed, config.tokens_per_second / 10)
+
+    def evaluate_prompt(
+        self, prompt: str, cache_prompt: bool, slot: int | None
+    ) -> Dict[str, float]:
+        """
+        Simulate prompt evaluation, reusing the cached prefix of a slot.
+
+        Without an explicit slot the one sharing the longest prefix is used, like
+        llama.cpp does.
+        """
+        tokens = tokenize(prompt)
+
+        if slot is None or not 0 <= slot < len(self.slots):
+            slot = max(
+                range(len(self.slots)),
+                key=lambda i: common_prefix_length(self.slots[i], tokens),
+            )
+
+        cached = common_prefix_length(self.slots[slot], tokens) if cache_prompt else 0
+        self.slots[slot] = tokens
+
+        evaluated = len(tokens) - cached
+        self.stats["prompt_tokens"] += len(tokens)
+        self.stats["cached_tokens"] += cached
+
+        return {
+            "slot": slot,
+            "prompt_tokens": len(tokens),
+            "cached": cached,
+            "evaluated": evaluated,
+            "prompt_ms": evaluated * self.config.prompt_ms_per_token,
+        }
+
+    def error_response(self) -> JSONResponse:
+        self.stats["errors"] += 1
+        return JSONResponse(
+            status_code=self.config.error_status,
+            content={
+                "error": {
+                    "message": "Simulated inference failure",
+                    "type": "server_error",
+                }
+            },
+        )
+
+    def start(self, body: dict, prompt: str) -> Completion:
+        """Account a new completion of ``prompt`` and sample its latencies."""
+        config = self.config
+        self.stats["requests"] += 1
+        count = min(
+            int(body.get("max_tokens") or config.output_tokens), config.output_tokens
+        )
+        evaluation = self.evaluate_prompt(
+            prompt, bool(body.get("cache_prompt", False)), body.get("id_slot")
+        )
+        stall = self.should_stall()
+        if stall:
+            self.stats["stalls"] += 1
+        self.stats["completion_tokens"] += count
+        ttft = self.ttft() + evaluation["prompt_ms"] / 1000
+        return Completion(
+            generate_tokens(config.seed, prompt, count), evaluation, ttft, stall
+        )
+
+    async def emit(self, completion: Completion) -> AsyncIterator[str]:
+        """Yield tokens paced by the sampled time to first token and speed."""
+        await asyncio.sleep(completion.ttft)
+        interval = self.token_interval()
+        stall_at = len(completion.tokens) // 2 if completion.stall else -1
+
+        for position, token in enumerate(completion.tokens):
+            if position == stall_at:
+                await asyncio.sleep(self.config.stall_ms / 1000)
+            elif position:
+                await asyncio.sleep(interval)
+            yield token if position == 0 else " " + token
+
+    async def wait_full(self, completion: Completion) -> float:
+        """Wait as long as generating the whole completion takes, in ms."""
+        started_at = time.monotonic()
+        delay = completion.ttft + len(completion.tokens) * self.token_interval()
+        if completion.stall:
+            delay += self.config.stall_ms / 1000
+        await asyncio.sleep(delay)
+        return (time.monotonic() - started_at) * 1000
+
+
+async def completion_events(
+    simulation: Simulation, completion: Completion, completion_id: str, model: str
+) -> AsyncIterator[str]:
+    """The server-sent events of a streamed ``/v1/completions`` response."""
+
+    def chunk(text: str, finish_reason: str | None) -> dict:
+        return {
+            "id": completion_id,
+            "object": "text_completion",
+            "model": model,
+            "choices": [{"index": 0, "text": text, "finish_reason": finish_reason}],
+        }
+
+    async for piece in simulation.emit(completion):
+        yield sse(chunk(piece, None))
+    yield sse(
+        {
+            **chunk("", "length"),
+            "usage": usage(completion.evaluation, len(completion.tokens)),
+        }
+    )
+    yield "data: [DONE]\n\n"
+
+
+async def chat_events(
+    simulation: Simulation,
+    completion: Completion,
+    completion_id: str,
+    model: str,
+    created: int,
+) -> AsyncIterator[str]:
+    """The server-sent events of a streamed ``/v1/chat/completions`` response."""
+
+    def chunk(delta: dict, finish_reason: str | None) -> dict:
+        return {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+
+    async for piece in simulation.emit(completion):
+        yield sse(chunk({"content": piece}, None))
+    yield sse(chunk({}, "length"))
+    yield "data: [DONE]\n\n"
+
+
+async def batch_completion(
+    simulation: Simulation,
+    body: dict,
+    prompts: List[str],
+    completion_id: str,
+    model: str,
+) -> dict:
+    """
+    A non streamed ``/v1/completions`` response, one choice per prompt. The
+    usage and timings count the whole batch, like a real server reports them.
+    """
+    completions = [simulation.start(body, prompt) for prompt in prompts]
+    longest = max(completions, key=lambda item: item.ttft + len(item.tokens))
+    predicted_ms = await simulation.wait_full(longest)
+    evaluation = {
+        key: sum(item.evaluation[key] for item in completions)
+        for key in ("prompt_tokens", "cached", "evaluated", "prompt_ms")
+    }
+    completion_tokens = sum(len(item.tokens) for item in completions)
+
+    return {
+        "id": completion_id,
+        "object": "text_completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {"index": index, "text": " ".join(item.tokens), "finish_reason": "length"}
+            for index, item in enumerate(completions)
+        ],
+        "usage": usage(evaluation, completion_tokens),
+        "tokens_cached": evaluation["cached"],
+        "timings": {
+            "prompt_n": evaluation["evaluated"],
+            "prompt_ms": evaluation["prompt_ms"],
+            "predicted_n": completion_tokens,
+            "predicted_ms": predicted_ms,
+        },
+    }
+
+
+def create_app(config: FakeLLMConfig | None = None) -> FastAPI:
+    """
+    Build the fake inference server.
+
+    Parameters
+    ----------
+    config : FakeLLMConfig, optional
+        Latency and failure model, defaults to ``FakeLLMConfig()``.
+
+    Returns
+    -------
+    FastAPI
+        The ASGI application.
+    """
+    config = config or FakeLLMConfig()
+    simulation = Simulation(config)
+    app = FastAPI(title="Fake LLM")
+    app.state.simulation = simulation
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": config.model, "object": "model"}]}
+
+    @app.get("/stats")
+    async def stats():
+        return simulation.stats
+
+    @app.post("/v1/completions")
+    async def completions(request: Request):
+        body = await request.json()
+        prompts = body.get("prompt", "")
+        stream = bool(body.get("stream", False))
+
+        if isinstance(prompts, list) and (not config.batching or stream):
+            return JSONResponse(
+                status_code=400,
+                content={"error": {"message": "List prompts are not supported"}},
+            )
+        if simulation.should_fail():
+            return simulation.error_response()
+
+        completion_id = f"cmpl-{uuid.uuid4().hex}"
+        model = body.get("model", config.model)
+
+        if stream:
+            completion = simulation.start(body, prompts)
+            return StreamingResponse(
+                completion_events(simulation, completion, completion_id, model),
+                media_type="text/event-stream",
+            )
+
+        items = prompts if isinstance(prompts, list) else [prompts]
+        return await batch_completion(simulation, body, items, completion_id, model)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        prompt = "\n".join(
+            str(message.get("content", "")) for message in body.get("messages", [])
+        )
+
+        if simulation.should_fail():
+            return simulation.error_response()
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        model = body.get("model", config.model)
+        created = int(time.time())
+        completion = simulation.start(body, prompt)
+
+        if body.get("stream"):
+            return StreamingResponse(
+                chat_events(simulation, completion, completion_id, model, created),
+                media_type="text/event-stream",
+            )
+
+        await simulation.wait_full(completion)
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {
+                        "role": "assistant",
+                        "content": " ".join(completion.tokens),
+                    },
+                    "finish_reason": "length",
+                }
+            ],
+            "usage": usage(completion.evaluation, len(completion.tokens)),
+        }
+
+    return app
@@ -0,0 +1,184 @@
+"""
+Compare the load benchmark of two git revisions.
+
+    python -m benchmarks.load.compare --base main --head HEAD --requests 100
+
+Each revision is checked out in a temporary git worktree and benchmarked with
+``benchmarks.load.run --spawn`` from the current tree, so older revisions are
+measured with the same harness. ``--head .`` benchmarks the working tree as is.
+Two existing result files can be compared with ``--results base.json head.json``.
+
+Exits with status 1 when an endpoint regressed by more than ``--threshold``.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Metric name and whether a higher value is worse.
+METRICS: List[Tuple[str, bool]] = [
+    ("p50_ms", True),
+    ("p95_ms", True),
+    ("p99_ms", True),
+    ("throughput_rps", False),
+]
+
+# Error rates are compared in absolute terms, a relative threshold means little
+# when the base error rate is zero.
+ERROR_RATE_TOLERANCE = 0.01
+
+
+def compare(base: Dict, head: Dict, threshold: float) -> Tuple[List[Dict], List[str]]:
+    """
+    Compare two benchmark reports.
+
+    Parameters
+    ----------
+    base, head : Dict
+        Reports written by ``benchmarks.load.run``.
+    threshold : float
+        Relative change considered a regression, e.g. 0.1 for 10%.
+
+    Returns
+    -------
+    Tuple[List[Dict], List[str]]
+        One row per endpoint and metric, and a description of each regression.
+    """
+    rows: List[Dict] = []
+    regressions: List[str] = []
+
+    for endpoint, head_result in head["results"].items():
+        base_result = base["results"].get(endpoint)
+        if base_result is None:
+            continue
+
+        for metric, higher_is_worse in METRICS:
+            before, after = base_result[metric], head_result[metric]
+            change = (after - before) / before if before else 0.0
+            worse = change > threshold if higher_is_worse else change < -threshold
+            rows.append(
+                {
+                    "endpoint": endpoint,
+                    "metric": metric,
+                    "base": before,
+                    "head": after,
+                    "change": round(change, 4),
+                    "regression": worse,
+                }
+            )
+            if worse:
+                regressions.append(f"{endpoint} {metric}: {before} -> {after}")
+
+        error_increase = head_result["error_rate"] - base_result["error_rate"]
+        if error_increase > ERROR_RATE_TOLERANCE:
+            regressions.append(
+                f"{endpoint} error_rate: {base_result['error_rate']} -> "
+                f"{head_result['error_rate']}"
+            )
+
+    return rows, regressions
+
+
+def format_table(rows: List[Dict]) -> str:
+    lines = [f"{'endpoint':<18} {'metric':<15} {'base':>12} {'head':>12} {'change':>9}"]
+    for row in rows:
+        flag = "  <-- regression" if row["regression"] else ""
+        lines.append(
+            f"{row['endpoint']:<18} {row['metric']:<15} {row['base']:>12.3f} "
+            f"{row['head']:>12.3f} {row['change']:>+8.1%}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def benchmark_revision(revision: str, run_args: List[str], workdir: Path) -> Dict:
+    """Benchmark ``revision`` in a temporary worktree and return its report."""
+    repo = Path(__file__).resolve().parents[2]
+    output = workdir / f"{revision.replace('/', '_')}.json"
+
+    if revision == ".":
+        app_dir = repo
+    else:
+        app_dir = workdir / f"worktree-{revision.replace('/', '_')}"
+        subprocess.run(
+            ["git", "worktree", "add", "--detach", str(app_dir), revision],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    try:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.load.run",
+                "--spawn",
+                "--app-dir",
+                str(app_dir),
+                "--output",
+                str(output),
+                *run_args,
+            ],
+            cwd=repo,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+    finally:
+        if revision != ".":
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(app_dir)],
+                cwd=repo,
+                capture_output=True,
+            )
+
+    return json.loads(output.read_text())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load.compare",
+        epilog="Other arguments are passed on to benchmarks.load.run.",
+    )
+    parser.add_argument("--base", default="main", help="Base git revision.")
+    parser.add_argument("--head", default=".", help="Head git revision.")
+    parser.add_argument("--results", nargs=2, metavar=("BASE_JSON", "HEAD_JSON"))
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--output", help="Write the comparison as JSON.")
+    args, run_args = parser.parse_known_args()
+
+    if args.results:
+        base, head = (json.loads(Path(path).read_text()) for path in args.results)
+    else:
+        with tempfile.TemporaryDirectory(prefix="story-bench-") as workdir:
+            base = benchmark_revision(args.base, run_args, Path(workdir))
+            head = benchmark_revision(args.head, run_args, Path(workdir))
+
+    rows, regressions = compare(base, head, args.threshold)
+    print(format_table(rows))
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(
+                {
+                    "base": base["meta"],
+                    "head": head["meta"],
+                    "threshold": args.threshold,
+                    "rows": rows,
+                    "regressions": regressions,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+    if regressions:
+        print("\nRegressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.load.scenarios import SCENARIOS, Context, setup
+from benchmarks.stats import summarize
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    context: Context,
+    name: str,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+) -> Dict[str, float]:
+    """
+    Send ``requests`` requests of one scenario with ``concurrency`` workers.
+
+    A request counts as an error when it raises or answers with a 4xx/5xx status;
+    the status codes seen are reported too.
+    """
+    scenario = SCENARIOS[name]
+
+    for _ in range(warmup):
+        await scenario(client, context)
+
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started_at = time.perf_counter()
+            try:
+                response = await scenario(client, context)
+                status = str(response.status_code)
+                failed = response.status_code >= 400
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+                failed = True
+            latencies.append(time.perf_counter() - started_at)
+            statuses[status] = statuses.get(status, 0) + 1
+            errors += failed
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    summary: Dict = summarize(latencies, errors, elapsed)
+    summary["statuses"] = statuses
+    return summary
+
+
+async def run_all(
+    base_url: str,
+    scenarios: List[str],
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    timeout: float = 120.0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Set up the shared context and run every scenario one after the other, so the
+    numbers of an endpoint are not skewed by load on another.
+    """
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=timeout, limits=limits
+    ) as client:
+        context = await setup(client)
+        return {
+            name: await run_scenario(
+                client, context, name, requests, concurrency, warmup
+            )
+            for name in scenarios
+        }
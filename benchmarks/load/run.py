@@ -0,0 +1,134 @@
+"""
+End-to-end load benchmark of the API.
+
+Against a running API::
+
+    python -m benchmarks.load.run --base-url http://localhost:8000
+
+Or let the harness migrate a fresh Postgres database, start the fake LLM and
+serve the API of a checkout with uvicorn::
+
+    python -m benchmarks.load.run --spawn --app-dir . --output results.json
+
+Stories are generated by the LLaMA backend pointed at the fake LLM server, so
+latency comes from a realistic (and configurable) inference model.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import sys
+from datetime import UTC, datetime
+from typing import Dict, Iterator
+
+from benchmarks.fake_llm.config import FakeLLMConfig
+from benchmarks.fake_llm.runner import running_server
+from benchmarks.load.harness import run_all
+from benchmarks.load.scenarios import SCENARIOS
+from benchmarks.load.server import database_env, git_revision, spawned_api
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load.run")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="Benchmark an API that is already up.")
+    target.add_argument(
+        "--spawn", action="store_true", help="Start the API of --app-dir."
+    )
+
+    parser.add_argument("--app-dir", default=".")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma separated subset of {', '.join(SCENARIOS)}.",
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+
+    database = parser.add_argument_group("database (--spawn)")
+    database.add_argument("--db-host", default=os.getenv("DB_HOST", "localhost"))
+    database.add_argument("--db-port", default=os.getenv("DB_PORT", "5432"))
+    database.add_argument("--db-user", default=os.getenv("DB_USER", "story_user"))
+    database.add_argument("--db-password", default=os.getenv("DB_PASSWORD", ""))
+    database.add_argument("--db-name", default="story_narrator_benchmark")
+
+    llm = parser.add_argument_group("fake LLM (--spawn)")
+    llm.add_argument("--llm-port", type=int, default=8089)
+    llm.add_argument("--llm-ttft-ms", type=float, default=300.0)
+    llm.add_argument("--llm-tokens-per-second", type=float, default=60.0)
+    llm.add_argument("--llm-output-tokens", type=int, default=120)
+    llm.add_argument("--llm-error-rate", type=float, default=0.0)
+    llm.add_argument("--llm-seed", type=int, default=42)
+    return parser
+
+
+@contextlib.contextmanager
+def target(args: argparse.Namespace, llm: FakeLLMConfig) -> Iterator[str]:
+    if args.base_url:
+        yield args.base_url
+        return
+
+    with running_server(llm, port=args.llm_port) as llm_url:
+        env = database_env(
+            args.db_host, args.db_port, args.db_user, args.db_password, args.db_name
+        )
+        env.update(
+            {
+                "STORY_GENERATOR": "llama",
+                "LLAMA_API_URL": f"{llm_url}/v1/completions",
+                "LLM_MODEL": llm.model,
+                "JWT_SECRET_KEY": "load-benchmark-secret",
+            }
+        )
+        with spawned_api(os.path.abspath(args.app_dir), args.port, env) as base_url:
+            yield base_url
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        sys.exit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    llm = FakeLLMConfig(
+        seed=args.llm_seed,
+        ttft_ms=args.llm_ttft_ms,
+        tokens_per_second=args.llm_tokens_per_second,
+        output_tokens=args.llm_output_tokens,
+        error_rate=args.llm_error_rate,
+    )
+
+    with target(args, llm) as base_url:
+        results = asyncio.run(
+            run_all(base_url, scenarios, args.requests, args.concurrency, args.warmup)
+        )
+
+    report: Dict = {
+        "meta": {
+            "revision": git_revision(args.app_dir) if args.spawn else None,
+            "base_url": args.base_url,
+            "started_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "fake_llm": llm.model_dump() if args.spawn else None,
+        },
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
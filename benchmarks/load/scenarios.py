@@ -0,0 +1,111 @@
+"""Scripted requests of the load benchmark, one per measured endpoint."""
+
+import itertools
+import uuid
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from tests.utils.fakers import CharacterFactory
+
+PASSWORD = "load-test-password"
+
+
+class Context:
+    """Data shared by the scenarios: a registered user and seeded entities."""
+
+    def __init__(self) -> None:
+        self.email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+        self.token = ""
+        self.character_ids: List[str] = []
+        self.scenario_ids: List[str] = []
+        self._counter = itertools.count()
+
+    @property
+    def auth_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def next_index(self) -> int:
+        return next(self._counter)
+
+
+async def setup(client: httpx.AsyncClient, characters: int = 5) -> Context:
+    """
+    Register a user, log in and create the characters and scenario the story
+    scenario needs.
+    """
+    context = Context()
+
+    response = await client.post(
+        "/auth/register",
+        json={"name": "Load Test", "email": context.email, "password": PASSWORD},
+    )
+    response.raise_for_status()
+
+    response = await client.post(
+        "/auth/login", json={"email": context.email, "password": PASSWORD}
+    )
+    response.raise_for_status()
+    context.token = response.json()["access_token"]
+
+    for _ in range(characters):
+        response = await create_character(client, context)
+        response.raise_for_status()
+        context.character_ids.append(response.json()["id"])
+
+    response = await client.post(
+        "/scenarios/",
+        json={
+            "name": f"Load Test Kingdom {uuid.uuid4().hex[:8]}",
+            "description": "A castle built for benchmarks, with very long halls.",
+        },
+    )
+    response.raise_for_status()
+    context.scenario_ids.append(response.json()["id"])
+
+    return context
+
+
+async def login(client: httpx.AsyncClient, context: Context) -> httpx.Response:
+    return await client.post(
+        "/auth/login", json={"email": context.email, "password": PASSWORD}
+    )
+
+
+async def create_character(
+    client: httpx.AsyncClient, context: Context
+) -> httpx.Response:
+    character = CharacterFactory()
+    return await client.post(
+        "/characters/",
+        json=character.model_dump(exclude={"id"}),
+    )
+
+
+async def list_scenarios(client: httpx.AsyncClient, context: Context) -> httpx.Response:
+    return await client.get("/scenarios/")
+
+
+async def generate_story(client: httpx.AsyncClient, context: Context) -> httpx.Response:
+    index = context.next_index()
+    count = len(context.character_ids)
+    character_ids = [context.character_ids[(index + i) % count] for i in range(2)]
+    return await client.post(
+        "/stories/generate",
+        json={
+            "character_ids": character_ids,
+            "scenario_id": context.scenario_ids[0],
+            "narrative_style": "adventurous",
+        },
+        headers=context.auth_headers,
+    )
+
+
+Scenario = Callable[[httpx.AsyncClient, Context], Awaitable[httpx.Response]]
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login": login,
+    "create_character": create_character,
+    "list_scenarios": list_scenarios,
+    "generate_story": generate_story,
+}
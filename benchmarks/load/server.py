@@ -0,0 +1,127 @@
+import contextlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Iterator
+
+import httpx
+import psycopg2
+from psycopg2 import sql
+
+
+def database_env(
+    host: str, port: str, user: str, password: str, name: str
+) -> Dict[str, str]:
+    return {
+        "DB_HOST": host,
+        "DB_PORT": port,
+        "DB_USER": user,
+        "DB_PASSWORD": password,
+        "DB_NAME": name,
+    }
+
+
+def recreate_database(env: Dict[str, str]) -> None:
+    """Drop and create the benchmark database so every run starts empty."""
+    connection = psycopg2.connect(
+        host=env["DB_HOST"],
+        port=env["DB_PORT"],
+        user=env["DB_USER"],
+        password=env["DB_PASSWORD"],
+        dbname="postgres",
+    )
+    connection.autocommit = True
+    try:
+        with connection.cursor() as cursor:
+            name = sql.Identifier(env["DB_NAME"])
+            cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(name))
+            cursor.execute(sql.SQL("CREATE DATABASE {}").format(name))
+    finally:
+        connection.close()
+
+
+def git_revision(app_dir: str) -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=app_dir,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() or "unknown"
+
+
+@contextlib.contextmanager
+def spawned_api(
+    app_dir: str,
+    port: int,
+    env_overrides: Dict[str, str],
+    startup_timeout: float = 60.0,
+) -> Iterator[str]:
+    """
+    Migrate a fresh database and serve the API of ``app_dir`` with uvicorn.
+
+    ``app_dir`` can be any checkout of the repository, e.g. a git worktree of the
+    revision to measure.
+
+    Yields
+    ------
+    str
+        Base URL of the API.
+    """
+    env = {**os.environ, "ENV": "development", "PYTHONPATH": app_dir, **env_overrides}
+    recreate_database(env)
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=app_dir,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+    log = tempfile.TemporaryFile(mode="w+")
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=app_dir,
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if process.poll() is not None:
+                log.seek(0)
+                raise RuntimeError(
+                    f"API exited with code {process.returncode}:\n{log.read()[-4000:]}"
+                )
+            try:
+                if httpx.get(f"{base_url}/").status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"API did not start on {base_url}")
+            time.sleep(0.2)
+
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        log.close()
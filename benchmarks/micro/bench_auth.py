@@ -0,0 +1,18 @@
+"""JWT issuing and verification, paid on every login and authenticated request."""
+
+from app.auth.domain.services.auth_service import AuthService
+from benchmarks.micro.harness import main
+from tests.utils.fakers import UserFactory
+
+SERVICE = AuthService(user_repository=None)
+USER = UserFactory()
+TOKEN = SERVICE.create_access_token(USER)
+
+BENCHMARKS = {
+    "auth_service.create_access_token": lambda: SERVICE.create_access_token(USER),
+    "auth_service.verify_token": lambda: SERVICE.verify_token(TOKEN),
+}
+
+
+if __name__ == "__main__":
+    main(BENCHMARKS)
@@ -0,0 +1,76 @@
+"""
+Per-request pydantic work: entity validation, ORM to entity mapping as done by
+the repositories, and the serialization of the generated story response, both
+the way FastAPI does it for a ``response_model`` and with the fast path used by
+``/stories/generate``.
+"""
+
+import json
+
+from app.character.domain.entities.character import Character as CharacterEntity
+from app.character.infrastructure.persistence.models.character import (
+    Character as CharacterModel,
+)
+from app.core.responses import EntityJSONResponse, json_dumps
+from app.scenario.domain.entities.scenario import Scenario as ScenarioEntity
+from app.scenario.infrastructure.persistence.models.scenario import (
+    Scenario as ScenarioModel,
+)
+from app.story.presentation.models.story import GenerateStoryResponse
+from benchmarks.micro.harness import main
+from tests.utils.fakers import CharacterFactory, ScenarioFactory, StoryFactory
+
+CHARACTER = CharacterFactory().model_dump()
+SCENARIO = ScenarioFactory().model_dump()
+STORY = StoryFactory(characters=[CharacterFactory() for _ in range(5)])
+
+CHARACTER_MODEL = CharacterModel(**CHARACTER)
+SCENARIO_MODELS = [
+    ScenarioModel(**ScenarioFactory(name=f"Scenario {i}").model_dump())
+    for i in range(20)
+]
+
+
+def _validated_story() -> dict:
+    """What FastAPI does with a ``Story`` returned for a ``response_model``."""
+    response = GenerateStoryResponse.model_validate(STORY.model_dump())
+    return response.model_dump(mode="json")
+
+
+def serialize_story_stdlib() -> bytes:
+    """Validation round trip encoded by the default ``JSONResponse``."""
+    return json.dumps(
+        _validated_story(), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def serialize_story_orjson() -> bytes:
+    """Validation round trip encoded by ``ORJSONResponse``."""
+    return json_dumps(_validated_story())
+
+
+def serialize_story_entity() -> bytes:
+    """The entity serialized as is, as ``/stories/generate`` now does."""
+    return EntityJSONResponse(STORY, GenerateStoryResponse).body
+
+
+BENCHMARKS = {
+    "character.validate": lambda: CharacterEntity(**CHARACTER),
+    "scenario.validate": lambda: ScenarioEntity(**SCENARIO),
+    "character_repository.to_entity": lambda: CharacterEntity(
+        **CHARACTER_MODEL.__dict__
+    ),
+    "scenario_repository.model_validate": lambda: ScenarioEntity.model_validate(
+        SCENARIO_MODELS[0]
+    ),
+    "scenario_repository.get_all[20 rows]": lambda: [
+        ScenarioEntity.model_validate(model) for model in SCENARIO_MODELS
+    ],
+    "generate_story_response.stdlib[5 characters]": serialize_story_stdlib,
+    "generate_story_response.orjson[5 characters]": serialize_story_orjson,
+    "generate_story_response.entity_json[5 characters]": serialize_story_entity,
+}
+
+
+if __name__ == "__main__":
+    main(BENCHMARKS)
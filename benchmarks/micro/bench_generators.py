@@ -0,0 +1,36 @@
+"""Prompt construction as done by the LLaMA and ChatGPT story generators."""
+
+import os
+
+from app.story.infrastructure.ai.chatgpt_story_generator import ChatGPTStoryGenerator
+from app.story.infrastructure.ai.llama_story_generator import LlamaStoryGenerator
+from benchmarks.micro.harness import main
+from tests.utils.fakers import CharacterFactory, ScenarioFactory
+
+# The client is never called, it only needs a key to be built.
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+CHARACTERS = [CharacterFactory() for _ in range(3)]
+SCENARIO = ScenarioFactory()
+
+LLAMA = LlamaStoryGenerator()
+CHATGPT = ChatGPTStoryGenerator()
+
+
+def llama_prompt() -> tuple:
+    prompt = LLAMA.prompt_builder.build(CHARACTERS, SCENARIO, "adventurous")
+    return prompt.text, prompt.prefix
+
+
+def chatgpt_prompt() -> str:
+    return CHATGPT.prompt_builder.build(CHARACTERS, SCENARIO, "adventurous").text
+
+
+BENCHMARKS = {
+    "llama_story_generator.prompt[3 characters]": llama_prompt,
+    "chatgpt_story_generator.prompt[3 characters]": chatgpt_prompt,
+}
+
+
+if __name__ == "__main__":
+    main(BENCHMARKS)
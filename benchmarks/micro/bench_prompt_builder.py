@@ -0,0 +1,30 @@
+"""Prompt rendering cost for one and five characters, per locale/tone template."""
+
+from app.story.infrastructure.ai.prompts.prompt_builder import PromptBuilder
+from benchmarks.micro.harness import main
+from tests.utils.fakers import CharacterFactory, ScenarioFactory
+
+CHARACTERS = [CharacterFactory() for _ in range(5)]
+SCENARIO = ScenarioFactory()
+
+EN = PromptBuilder(locale="en", tone="default")
+PT_BR = PromptBuilder(locale="pt-BR", tone="religious")
+
+BENCHMARKS = {
+    "prompt_builder.build[en,1 character]": lambda: EN.build(
+        CHARACTERS[:1], SCENARIO, "adventurous"
+    ),
+    "prompt_builder.build[en,5 characters]": lambda: EN.build(
+        CHARACTERS, SCENARIO, "adventurous"
+    ),
+    "prompt_builder.build[pt-BR,5 characters]": lambda: PT_BR.build(
+        CHARACTERS, SCENARIO, "adventurous"
+    ),
+    "prompt_builder.build+text[en,5 characters]": lambda: EN.build(
+        CHARACTERS, SCENARIO, "adventurous"
+    ).text,
+}
+
+
+if __name__ == "__main__":
+    main(BENCHMARKS)
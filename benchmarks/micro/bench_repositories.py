@@ -0,0 +1,59 @@
+"""
+Reading 10k characters the way the repositories used to, ORM instances mapped
+with ``Character(**model.__dict__)``, and the way they do now, the entity
+columns only built with :func:`~app.core.infrastructure.persistence.rows.to_entity`.
+
+The rows come from an in-memory SQLite database, so the timings cover the
+SQLAlchemy and pydantic work, not the driver or the network. It is filled on
+first use, so a suite run filtering these benchmarks out does not pay for it.
+"""
+
+from functools import lru_cache
+
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.orm import Session
+
+from app.character.domain.entities.character import Character as CharacterEntity
+from app.character.infrastructure.persistence.models.character import (
+    Character as CharacterModel,
+)
+from app.core.infrastructure.persistence.rows import select_entities, to_entity
+from benchmarks.micro.harness import main
+from tests.utils.fakers import CharacterFactory
+
+ROWS = 10_000
+
+
+@lru_cache(maxsize=None)
+def engine() -> Engine:
+    """The database holding the ``ROWS`` characters."""
+    sqlite = create_engine("sqlite://")
+    CharacterModel.metadata.create_all(sqlite, tables=[CharacterModel.__table__])
+    with Session(sqlite) as session:
+        session.add_all(
+            CharacterModel(**CharacterFactory().model_dump()) for _ in range(ROWS)
+        )
+        session.commit()
+    return sqlite
+
+
+def orm_instances() -> list:
+    with Session(engine()) as session:
+        models = session.execute(select(CharacterModel)).scalars().all()
+        return [CharacterEntity(**model.__dict__) for model in models]
+
+
+def entity_rows() -> list:
+    with Session(engine()) as session:
+        result = session.execute(select_entities(CharacterModel, CharacterEntity))
+        return [to_entity(CharacterEntity, row) for row in result]
+
+
+BENCHMARKS = {
+    f"character_repository.orm_instances[{ROWS} rows]": orm_instances,
+    f"character_repository.entity_rows[{ROWS} rows]": entity_rows,
+}
+
+
+if __name__ == "__main__":
+    main(BENCHMARKS)
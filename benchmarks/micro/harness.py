@@ -0,0 +1,115 @@
+"""
+Tiny ``timeit`` harness shared by the microbenchmarks.
+
+Each benchmark module exposes a ``BENCHMARKS`` mapping of names to zero-argument
+callables and calls :func:`main` so it can be run on its own, e.g.::
+
+    python -m benchmarks.micro.bench_prompt_builder
+
+``python -m benchmarks.micro.suite`` runs all of them against a stored baseline.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import timeit
+from typing import Callable, Dict, List, NamedTuple
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    loops: int
+    best_ns: float
+    median_ns: float
+
+    def as_dict(self) -> dict:
+        return self._asdict()
+
+
+def measure(name: str, func: Callable[[], object], repeat: int = 5) -> BenchmarkResult:
+    """
+    Time ``func`` and return the per-call cost in nanoseconds.
+
+    ``func`` is called once first, so data it builds lazily on first use is
+    neither timed nor counted when picking the loop count. The loop count is
+    picked by ``Timer.autorange`` so each sample takes at least 0.2 seconds; the
+    best and median of ``repeat`` samples are reported.
+    """
+    func()
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    samples = [t / loops * 1e9 for t in timer.repeat(repeat=repeat, number=loops)]
+    return BenchmarkResult(name, loops, min(samples), statistics.median(samples))
+
+
+def run(
+    benchmarks: Dict[str, Callable[[], object]], repeat: int = 5
+) -> List[BenchmarkResult]:
+    return [measure(name, func, repeat) for name, func in benchmarks.items()]
+
+
+def report(results: List[BenchmarkResult]) -> str:
+    width = max(len(result.name) for result in results)
+    lines = [f"{'benchmark':<{width}}  {'best':>12}  {'median':>12}  {'loops':>9}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}}  {result.best_ns:>9.0f} ns"
+            f"  {result.median_ns:>9.0f} ns  {result.loops:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(benchmarks: Dict[str, Callable[[], object]]) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    results = run(benchmarks, args.repeat)
+    if args.json:
+        print(json.dumps([result.as_dict() for result in results], indent=2))
+    else:
+        print(report(results))
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    """Read a baseline written by :func:`save_baseline`, keyed by benchmark name."""
+    with open(path) as file:
+        return {entry["name"]: entry for entry in json.load(file)["results"]}
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]) -> None:
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": [result.as_dict() for result in results],
+            },
+            file,
+            indent=2,
+        )
+        file.write("\n")
+
+
+def regressions(
+    results: List[BenchmarkResult], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """
+    Describe the benchmarks whose median got slower than the baseline by more than
+    ``threshold`` (e.g. 0.2 for 20%). Benchmarks missing from the baseline are
+    ignored.
+    """
+    slower = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        change = result.median_ns / base["median_ns"] - 1
+        if change > threshold:
+            slower.append(
+                f"{result.name}: {base['median_ns']:.0f} ns -> "
+                f"{result.median_ns:.0f} ns ({change:+.1%})"
+            )
+    return slower
@@ -0,0 +1,88 @@
+"""
+Run every microbenchmark and compare it with a stored baseline.
+
+    python -m benchmarks.micro.suite --save-baseline   # on the base revision
+    python -m benchmarks.micro.suite --threshold 0.2   # on the change
+
+Exits with status 1 when a benchmark median is slower than its baseline by more
+than ``--threshold``. Baselines are only comparable on the same machine, so
+they are not committed.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+from typing import Callable, Dict
+
+from benchmarks.micro.harness import (
+    load_baseline,
+    regressions,
+    report,
+    run,
+    save_baseline,
+)
+
+MODULES = [
+    "benchmarks.micro.bench_domain",
+    "benchmarks.micro.bench_auth",
+    "benchmarks.micro.bench_generators",
+    "benchmarks.micro.bench_prompt_builder",
+    "benchmarks.micro.bench_repositories",
+]
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def collect(pattern: str = "") -> Dict[str, Callable[[], object]]:
+    benchmarks: Dict[str, Callable[[], object]] = {}
+    for module in MODULES:
+        benchmarks.update(importlib.import_module(module).BENCHMARKS)
+    return {name: func for name, func in benchmarks.items() if pattern in name}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro.suite")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.getenv("BENCH_MICRO_THRESHOLD", "0.2")),
+        help="Relative slowdown of the median considered a regression.",
+    )
+    parser.add_argument("--filter", default="", help="Only run matching names.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    results = run(collect(args.filter), args.repeat)
+    if args.json:
+        print(json.dumps([result.as_dict() for result in results], indent=2))
+    else:
+        print(report(results))
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}, run with --save-baseline first.")
+        return
+
+    slower = regressions(results, load_baseline(args.baseline), args.threshold)
+    if slower:
+        print(f"\nSlower than the baseline by more than {args.threshold:.0%}:")
+        print("  " + "\n  ".join(slower))
+        sys.exit(1)
+    print(f"\nNo regression beyond {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Latency summaries shared by the benchmark scripts."""
+
+import math
+from typing import Dict, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile, ``q`` in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(
+    latencies: Sequence[float], errors: int, elapsed: float
+) -> Dict[str, float]:
+    """
+    Summarize one run.
+
+    Parameters
+    ----------
+    latencies : Sequence[float]
+        Seconds taken by every request, failed ones included.
+    errors : int
+        Number of failed requests.
+    elapsed : float
+        Wall clock seconds of the whole run.
+
+    Returns
+    -------
+    Dict[str, float]
+        Request count, throughput, error rate and latency percentiles in ms.
+    """
+    count = len(latencies)
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "throughput_rps": round(count / elapsed, 3) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 3),
+    }
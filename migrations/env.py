@@ -10,9 +10,15 @@ from app.character.infrastructure.persistence.models.character import (  # noqa:
     Character,
 )
 from app.core.infrastructure.persistence.models.base import BaseModel
+from app.core.infrastructure.persistence.models.catalog_version import (  # noqa: F401
+    CatalogVersion,
+)
 from app.core.settings.config import settings
-from app.scenario.infrastructure.persistence.models.scenario import (
-    Scenario,  # noqa: F401
+from app.scenario.infrastructure.persistence.models.scenario import (  # noqa: F401
+    Scenario,
+)
+from app.usage.infrastructure.persistence.models.usage_rollup import (  # noqa: F401
+    UsageRollup,
 )
 
 print(settings.DB_NAME)
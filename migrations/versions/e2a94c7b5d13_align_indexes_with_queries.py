@@ -0,0 +1,53 @@
+"""Align Indexes With Queries
+
+Revision ID: e2a94c7b5d13
+Revises: 7c3e5d0f9a61
+Create Date: 2026-10-19 21:36:08.514927
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a94c7b5d13"
+down_revision: Union[str, None] = "7c3e5d0f9a61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Never queried, only maintained on every insert.
+    op.drop_index("ix_users_hashed_password", table_name="users")
+    op.drop_index("ix_users_is_active", table_name="users")
+    op.drop_index("ix_users_name", table_name="users")
+
+    # Names are unique ignoring the case, which get_by_name relies on. Fails
+    # if two scenarios only differ by the case of their names.
+    op.create_index(
+        "ix_scenarios_lower_name",
+        "scenarios",
+        [sa.text("lower(name)")],
+        unique=True,
+    )
+    op.drop_constraint("scenarios_name_key", "scenarios", type_="unique")
+    op.create_index(
+        "ix_usage_rollups_user_id_day",
+        "usage_rollups",
+        ["user_id", "day"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_usage_rollups_user_id_day", table_name="usage_rollups")
+    op.create_unique_constraint("scenarios_name_key", "scenarios", ["name"])
+    op.drop_index("ix_scenarios_lower_name", table_name="scenarios")
+
+    op.create_index("ix_users_name", "users", ["name"], unique=False)
+    op.create_index("ix_users_is_active", "users", ["is_active"], unique=False)
+    op.create_index(
+        "ix_users_hashed_password", "users", ["hashed_password"], unique=False
+    )
@@ -5,7 +5,8 @@ from fastapi import FastAPI, Request
 from httpx import ASGITransport, AsyncClient
 from jose import JWTError
 
-from app.auth.application.decorators.auth_decorator import require_auth
+from app.auth.application.decorators.auth_decorator import require_admin, require_auth
+from app.core.settings.config import settings
 
 # Create a separate test app
 test_app = FastAPI()
@@ -150,3 +151,37 @@ async def test_general_exception_handling(test_client, mock_auth_service):
     assert response.status_code == 401
     assert response.json()["detail"] == "Could not validate credentials"
     assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+@test_app.get("/test-admin")
+@require_admin
+async def admin_endpoint(request: Request):
+    return {"message": "success"}
+
+
+@pytest.mark.asyncio
+async def test_admin_route_rejects_other_users(test_client, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["admin@example.com"])
+    headers = {"Authorization": "Bearer valid.token"}
+
+    response = await test_client.get("/test-admin", headers=headers)
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Administrator privileges required"
+
+
+@pytest.mark.asyncio
+async def test_admin_route_allows_admins(test_client, test_user, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [test_user.email])
+    headers = {"Authorization": "Bearer valid.token"}
+
+    response = await test_client.get("/test-admin", headers=headers)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_admin_route_requires_authentication(test_client):
+    response = await test_client.get("/test-admin")
+
+    assert response.status_code == 401
@@ -4,7 +4,10 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.infrastructure.persistence.models.user import User as UserModel
-from app.auth.infrastructure.repositories.user_repository import UserRepository
+from app.auth.infrastructure.repositories.user_repository import (
+    SessionFactoryUserRepository,
+    UserRepository,
+)
 from tests.utils.fakers import UserFactory
 
 
@@ -71,3 +74,20 @@ async def test_get_by_email_not_found(async_db_session: AsyncSession):
 
     # Assert
     assert retrieved_user is None
+
+
+@pytest.mark.asyncio
+async def test_session_factory_repository_opens_a_session_per_call(
+    async_db_session: AsyncSession, session_manager
+):
+    user_repository = SessionFactoryUserRepository(session_manager.session)
+    user = UserFactory()
+    pool = session_manager.engine.pool
+    checked_out = pool.checkedout()
+
+    await user_repository.save(user)
+    found = await user_repository.get_by_email(user.email)
+
+    assert found is not None
+    assert found.email == user.email
+    assert pool.checkedout() == checked_out
@@ -0,0 +1,122 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.fake_llm.config import FakeLLMConfig
+from benchmarks.fake_llm.server import create_app
+
+
+def fake_client(**overrides) -> AsyncClient:
+    app = create_app(FakeLLMConfig.instant(output_tokens=8, **overrides))
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://fake")
+
+
+def sse_events(text: str) -> list:
+    payloads = [line[len("data: ") :] for line in text.splitlines() if line]
+    assert payloads[-1] == "[DONE]"
+    return [json.loads(payload) for payload in payloads[:-1]]
+
+
+@pytest.mark.asyncio
+async def test_completion_output_is_deterministic():
+    payload = {"model": "llama3", "prompt": "Tell a story", "max_tokens": 5}
+
+    async with fake_client() as first, fake_client() as second:
+        one = (await first.post("/v1/completions", json=payload)).json()
+        two = (await second.post("/v1/completions", json=payload)).json()
+
+    assert one["choices"][0]["text"] == two["choices"][0]["text"]
+    assert len(one["choices"][0]["text"].split()) == 5
+    assert one["usage"]["completion_tokens"] == 5
+
+
+@pytest.mark.asyncio
+async def test_completion_accepts_prompt_lists():
+    payload = {"prompt": ["first story", "second story"], "max_tokens": 3}
+
+    async with fake_client() as client:
+        response = await client.post("/v1/completions", json=payload)
+
+    body = response.json()
+    assert [choice["index"] for choice in body["choices"]] == [0, 1]
+    assert body["usage"]["prompt_tokens"] == 4
+    assert body["usage"]["completion_tokens"] == 6
+    assert body["timings"]["predicted_n"] == 6
+
+
+@pytest.mark.asyncio
+async def test_completion_rejects_prompt_lists_without_batching():
+    async with fake_client(batching=False) as client:
+        response = await client.post("/v1/completions", json={"prompt": ["a", "b"]})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_prompt_cache_reuses_shared_prefix():
+    prefix = "You are a story writer. Keep it short. "
+
+    async with fake_client() as client:
+        await client.post(
+            "/v1/completions",
+            json={"prompt": prefix + "About a fox", "cache_prompt": True},
+        )
+        body = (
+            await client.post(
+                "/v1/completions",
+                json={"prompt": prefix + "About a bear", "cache_prompt": True},
+            )
+        ).json()
+
+    assert body["tokens_cached"] == len(prefix.split()) + 2
+    assert body["timings"]["prompt_n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_completion_streaming():
+    async with fake_client() as client:
+        response = await client.post(
+            "/v1/completions", json={"prompt": "Tell a story", "stream": True}
+        )
+
+    events = sse_events(response.text)
+    text = "".join(event["choices"][0]["text"] for event in events)
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert len(text.split()) == 8
+    assert events[-1]["choices"][0]["finish_reason"] == "length"
+
+
+@pytest.mark.asyncio
+async def test_chat_completion():
+    payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "Hi"}]}
+
+    async with fake_client() as client:
+        body = (await client.post("/v1/chat/completions", json=payload)).json()
+
+    assert body["object"] == "chat.completion"
+    assert body["choices"][0]["message"]["role"] == "assistant"
+    assert len(body["choices"][0]["message"]["content"].split()) == 8
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_streaming():
+    payload = {"messages": [{"role": "user", "content": "Hi"}], "stream": True}
+
+    async with fake_client() as client:
+        response = await client.post("/v1/chat/completions", json=payload)
+
+    events = sse_events(response.text)
+    assert all(event["object"] == "chat.completion.chunk" for event in events)
+    text = "".join(event["choices"][0]["delta"].get("content", "") for event in events)
+    assert len(text.split()) == 8
+
+
+@pytest.mark.asyncio
+async def test_error_rate_returns_configured_status():
+    async with fake_client(error_rate=1.0, error_status=503) as client:
+        response = await client.post("/v1/completions", json={"prompt": "Hi"})
+        stats = (await client.get("/stats")).json()
+
+    assert response.status_code == 503
+    assert stats["errors"] == 1
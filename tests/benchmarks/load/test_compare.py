@@ -0,0 +1,74 @@
+from benchmarks.load.compare import compare, format_table
+
+
+def report(**results) -> dict:
+    return {"meta": {}, "results": results}
+
+
+def result(p50=10.0, p95=20.0, p99=30.0, throughput=100.0, error_rate=0.0) -> dict:
+    return {
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "p99_ms": p99,
+        "throughput_rps": throughput,
+        "error_rate": error_rate,
+    }
+
+
+def test_compare_within_threshold_has_no_regressions():
+    base = report(login=result())
+    head = report(login=result(p50=10.5, throughput=96.0))
+
+    rows, regressions = compare(base, head, threshold=0.1)
+
+    assert len(rows) == 4
+    assert not any(row["regression"] for row in rows)
+    assert regressions == []
+
+
+def test_compare_flags_slower_latency_and_lower_throughput():
+    base = report(login=result())
+    head = report(login=result(p95=30.0, throughput=50.0))
+
+    rows, regressions = compare(base, head, threshold=0.1)
+
+    flagged = {row["metric"] for row in rows if row["regression"]}
+    assert flagged == {"p95_ms", "throughput_rps"}
+    assert len(regressions) == 2
+
+
+def test_compare_improvements_are_not_regressions():
+    base = report(login=result())
+    head = report(login=result(p50=1.0, p95=2.0, p99=3.0, throughput=1000.0))
+
+    _, regressions = compare(base, head, threshold=0.1)
+
+    assert regressions == []
+
+
+def test_compare_flags_error_rate_increase():
+    base = report(generate_story=result())
+    head = report(generate_story=result(error_rate=0.05))
+
+    _, regressions = compare(base, head, threshold=0.1)
+
+    assert regressions == ["generate_story error_rate: 0.0 -> 0.05"]
+
+
+def test_compare_skips_endpoints_missing_from_base():
+    base = report(login=result())
+    head = report(login=result(), list_scenarios=result(p50=1000.0))
+
+    rows, regressions = compare(base, head, threshold=0.1)
+
+    assert {row["endpoint"] for row in rows} == {"login"}
+    assert regressions == []
+
+
+def test_format_table_marks_regressions():
+    rows, _ = compare(report(login=result()), report(login=result(p99=60.0)), 0.1)
+
+    table = format_table(rows)
+
+    assert table.splitlines()[0].startswith("endpoint")
+    assert "p99_ms" in table and "<-- regression" in table
@@ -0,0 +1,40 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.load import harness
+from benchmarks.load.scenarios import Context
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    calls = {"count": 0}
+
+    @app.get("/ping")
+    async def ping():
+        calls["count"] += 1
+        if calls["count"] % 4 == 0:
+            raise HTTPException(status_code=503)
+        return {"ok": True}
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_run_scenario_reports_latency_and_errors(client, monkeypatch):
+    async def ping(client, context):
+        return await client.get("/ping")
+
+    monkeypatch.setitem(harness.SCENARIOS, "ping", ping)
+
+    async with client:
+        summary = await harness.run_scenario(
+            client, Context(), "ping", requests=12, concurrency=3
+        )
+
+    assert summary["requests"] == 12
+    assert summary["errors"] == 3
+    assert summary["statuses"] == {"200": 9, "503": 3}
+    assert summary["error_rate"] == 0.25
+    assert 0 < summary["p50_ms"] <= summary["p95_ms"] <= summary["max_ms"]
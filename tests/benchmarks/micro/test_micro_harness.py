@@ -0,0 +1,43 @@
+from benchmarks.micro.harness import (
+    BenchmarkResult,
+    load_baseline,
+    measure,
+    regressions,
+    save_baseline,
+)
+
+
+def result(name: str, median_ns: float) -> BenchmarkResult:
+    return BenchmarkResult(name, loops=1000, best_ns=median_ns, median_ns=median_ns)
+
+
+def test_measure_reports_per_call_cost():
+    measured = measure("noop", lambda: None, repeat=2)
+
+    assert measured.name == "noop"
+    assert measured.loops > 0
+    assert 0 < measured.best_ns <= measured.median_ns
+
+
+def test_baseline_round_trip(tmp_path):
+    path = str(tmp_path / "baseline.json")
+
+    save_baseline(path, [result("a", 100.0), result("b", 200.0)])
+
+    baseline = load_baseline(path)
+    assert set(baseline) == {"a", "b"}
+    assert baseline["b"]["median_ns"] == 200.0
+
+
+def test_regressions_beyond_threshold_are_reported():
+    baseline = {"fast": {"median_ns": 100.0}, "slow": {"median_ns": 100.0}}
+
+    slower = regressions(
+        [result("fast", 115.0), result("slow", 150.0)], baseline, threshold=0.2
+    )
+
+    assert slower == ["slow: 100 ns -> 150 ns (+50.0%)"]
+
+
+def test_regressions_ignore_new_benchmarks():
+    assert regressions([result("new", 1e9)], {}, threshold=0.2) == []
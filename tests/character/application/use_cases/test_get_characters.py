@@ -0,0 +1,55 @@
+from uuid import uuid4
+
+import pytest
+
+from app.character.application.use_cases.get_characters import GetCharactersUseCase
+from app.character.domain.exceptions.character_exceptions import (
+    TooManyCharacterIdsError,
+)
+from tests.utils.fakers import CharacterFactory
+from tests.utils.mocks import MockCharacterRepository
+
+
+@pytest.fixture
+def mock_character_repository():
+    return MockCharacterRepository()
+
+
+@pytest.mark.asyncio
+async def test_get_characters_keeps_the_requested_order(mock_character_repository):
+    first, second, third = (CharacterFactory.create() for _ in range(3))
+    mock_character_repository.get_by_ids.return_value = [second, third, first]
+
+    use_case = GetCharactersUseCase(mock_character_repository)
+
+    result = await use_case.execute([third.id, first.id, second.id])
+
+    assert result.characters == [third, first, second]
+    assert result.missing == []
+
+
+@pytest.mark.asyncio
+async def test_get_characters_reports_missing_ids(mock_character_repository):
+    character = CharacterFactory.create()
+    unknown = uuid4()
+    mock_character_repository.get_by_ids.return_value = [character]
+
+    use_case = GetCharactersUseCase(mock_character_repository)
+
+    result = await use_case.execute([unknown, character.id, unknown])
+
+    assert result.characters == [character]
+    assert result.missing == [unknown]
+    mock_character_repository.get_by_ids.assert_called_once_with(
+        [unknown, character.id]
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_characters_limits_the_number_of_ids(mock_character_repository):
+    use_case = GetCharactersUseCase(mock_character_repository, max_ids=2)
+
+    with pytest.raises(TooManyCharacterIdsError):
+        await use_case.execute([uuid4() for _ in range(3)])
+
+    mock_character_repository.get_by_ids.assert_not_called()
@@ -71,3 +71,27 @@ async def test_get_character_by_nonexistent_id(async_db_session: AsyncSession):
     # Assert
     assert retrieved_character is None
     assert retrieved_character is None
+
+
+@pytest.mark.asyncio
+async def test_get_characters_by_ids(async_db_session: AsyncSession):
+    # Arrange
+    character_repository = CharacterRepository(async_db_session)
+    characters = [CharacterFactory.create() for _ in range(3)]
+    for character in characters:
+        await character_repository.save(character=character)
+
+    # Act
+    retrieved = await character_repository.get_by_ids(
+        [characters[0].id, characters[1].id, UUID(int=0)]  # type: ignore
+    )
+
+    # Assert
+    assert {c.id for c in retrieved} == {characters[0].id, characters[1].id}
+
+
+@pytest.mark.asyncio
+async def test_get_characters_by_ids_empty(async_db_session: AsyncSession):
+    character_repository = CharacterRepository(async_db_session)
+
+    assert await character_repository.get_by_ids([]) == []
@@ -1,14 +1,23 @@
+from typing import List
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.character.domain.entities.character import Character
 from app.core.dependencies import (
+    catalog_versions,
     get_character_repository,
     get_create_character_use_case,
 )
 from tests.utils.fakers import CharacterFactory
 
 
+@pytest.fixture(autouse=True)
+def fresh_catalog_versions():
+    """The database is recreated for each test, forget the cached versions."""
+    catalog_versions.invalidate()
+
+
 @pytest.fixture(scope="function")
 async def created_character(async_db_session: AsyncSession) -> Character:
     character_factory = CharacterFactory.create()
@@ -26,3 +35,12 @@ async def created_character(async_db_session: AsyncSession) -> Character:
     )
 
     return character
+
+
+@pytest.fixture(scope="function")
+async def created_characters(async_db_session: AsyncSession) -> List[Character]:
+    character_repository = get_character_repository(async_db_session)
+
+    return [
+        await character_repository.save(CharacterFactory.create()) for _ in range(3)
+    ]
@@ -4,6 +4,8 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from app.core.settings.config import settings
+
 
 @pytest.mark.asyncio
 async def test_create_character(async_client: AsyncClient):
@@ -70,3 +72,117 @@ async def test_get_character_by_id_existing(
     assert response_data["superpower"] == created_character.superpower
     assert response_data["hobby"] == created_character.hobby
     assert response_data["personality"] == created_character.personality
+
+
+@pytest.mark.asyncio
+async def test_get_character_by_id_not_modified(
+    async_client: AsyncClient, created_character
+):
+    url = f"/characters/{created_character.id}"
+    response = await async_client.get(url)
+    etag = response.headers["etag"]
+
+    assert etag == f'"characters-{created_character.id}-v0"'
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_get_character_by_id_with_other_etag(
+    async_client: AsyncClient, created_character
+):
+    response = await async_client.get(
+        f"/characters/{created_character.id}",
+        headers={"If-None-Match": '"characters-other-v0"'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_get_character_by_id_returns_the_requested_fields(
+    async_client: AsyncClient, created_character
+):
+    response = await async_client.get(
+        f"/characters/{created_character.id}?fields=name,hobby"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "id": str(created_character.id),
+        "name": created_character.name,
+        "hobby": created_character.hobby,
+    }
+    assert response.headers["etag"] != f'"characters-{created_character.id}-v0"'
+
+
+@pytest.mark.asyncio
+async def test_get_characters_by_ids(async_client: AsyncClient, created_characters):
+    first, second, third = created_characters
+    unknown = uuid4()
+
+    response = await async_client.get(
+        f"/characters/?ids={third.id},{unknown}&ids={first.id}"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert [c["id"] for c in response_data["characters"]] == [
+        str(third.id),
+        str(first.id),
+    ]
+    assert response_data["characters"][0]["name"] == third.name
+    assert response_data["missing"] == [str(unknown)]
+
+
+@pytest.mark.asyncio
+async def test_get_characters_with_fields(
+    async_client: AsyncClient, created_characters
+):
+    character = created_characters[0]
+
+    response = await async_client.get(f"/characters/?ids={character.id}&fields=name")
+
+    assert response.json() == {
+        "characters": [{"id": str(character.id), "name": character.name}],
+        "missing": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_characters_with_malformed_id(async_client: AsyncClient):
+    response = await async_client.get("/characters/?ids=not-a-uuid")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"] == "Character IDs must be UUIDs."
+
+
+@pytest.mark.asyncio
+async def test_batch_get_characters(async_client: AsyncClient, created_characters):
+    ids = [str(c.id) for c in reversed(created_characters)]
+
+    response = await async_client.post("/characters/batch-get", json={"ids": ids})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [c["id"] for c in response.json()["characters"]] == ids
+    assert response.json()["missing"] == []
+
+
+@pytest.mark.asyncio
+async def test_batch_get_characters_limits_the_number_of_ids(
+    async_client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr(settings, "CHARACTERS_MAX_IDS_PER_REQUEST", 2)
+
+    response = await async_client.post(
+        "/characters/batch-get", json={"ids": [str(uuid4()) for _ in range(3)]}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"] == (
+        "At most 2 characters can be requested at once."
+    )
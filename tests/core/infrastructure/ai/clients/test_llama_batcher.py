@@ -0,0 +1,166 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from requests import HTTPError
+
+from app.core.infrastructure.ai.clients.llama_batcher import (
+    BatchingUnsupportedError,
+    LlamaBatcher,
+)
+from app.core.metrics import LLM_BATCH_SIZE, LLM_BATCHING_SUPPORTED
+
+
+def echo_response(url, json):
+    """Fake completion server answering each prompt with its upper-cased text."""
+    prompts = json["prompt"] if isinstance(json["prompt"], list) else [json["prompt"]]
+    response = Mock(status_code=200)
+    response.raise_for_status.return_value = None
+    response.json.return_value = {
+        "choices": [
+            {"index": index, "text": f" {prompt.upper()} "}
+            for index, prompt in reversed(list(enumerate(prompts)))
+        ]
+    }
+    return response
+
+
+def submit_concurrently(batcher, prompts, temperature=0.5, max_tokens=100):
+    with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+        futures = [
+            executor.submit(batcher.submit, prompt, temperature, max_tokens)
+            for prompt in prompts
+        ]
+        return [text(future.result()) for future in futures]
+
+
+def text(body):
+    (choice,) = body["choices"]
+    return choice["text"].strip()
+
+
+def test_concurrent_prompts_are_sent_in_one_request():
+    post = Mock(side_effect=echo_response)
+    batcher = LlamaBatcher("http://llama", "llama3", 4, linger_ms=500, post=post)
+
+    results = submit_concurrently(batcher, ["a", "b", "c", "d"])
+
+    assert results == ["A", "B", "C", "D"]
+    post.assert_called_once()
+    payload = post.call_args.kwargs["json"]
+    assert sorted(payload["prompt"]) == ["a", "b", "c", "d"]
+    assert payload["temperature"] == 0.5
+
+
+def test_full_batch_is_sent_without_waiting_for_linger():
+    post = Mock(side_effect=echo_response)
+    batcher = LlamaBatcher("http://llama", "llama3", 2, linger_ms=60_000, post=post)
+
+    results = submit_concurrently(batcher, ["a", "b"])
+
+    assert results == ["A", "B"]
+    stats = batcher.stats()
+    assert stats["batches_total"] == 1
+    assert stats["prompts_total"] == 2
+    assert stats["fill_ratio"] == 1.0
+    assert stats["batch_sizes"] == {2: 1}
+
+
+def test_single_prompt_is_sent_as_plain_string():
+    post = Mock(side_effect=echo_response)
+    batcher = LlamaBatcher("http://llama", "llama3", 8, linger_ms=1, post=post)
+
+    assert text(batcher.submit("solo", 0.7, 50)) == "SOLO"
+    assert post.call_args.kwargs["json"]["prompt"] == "solo"
+    assert batcher.stats()["average_batch_size"] == 1.0
+
+
+def test_server_rejecting_lists_disables_batching():
+    response = Mock(status_code=422)
+    post = Mock(return_value=response)
+    batcher = LlamaBatcher("http://llama", "llama3", 2, linger_ms=60_000, post=post)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(batcher.submit, p, 0.5, 10) for p in ("a", "b")]
+        for future in futures:
+            with pytest.raises(BatchingUnsupportedError):
+                future.result()
+
+    assert batcher.supported is False
+    assert LLM_BATCHING_SUPPORTED.labels().value == 0
+
+
+def test_server_errors_reach_every_caller():
+    response = Mock(status_code=500)
+    response.raise_for_status.side_effect = HTTPError("500 Server Error")
+    post = Mock(return_value=response)
+    batcher = LlamaBatcher("http://llama", "llama3", 2, linger_ms=60_000, post=post)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(batcher.submit, p, 0.5, 10) for p in ("a", "b")]
+        for future in futures:
+            with pytest.raises(HTTPError):
+                future.result()
+
+    assert batcher.supported is True
+
+
+def test_options_are_added_to_every_payload():
+    post = Mock(side_effect=echo_response)
+    batcher = LlamaBatcher(
+        "http://llama",
+        "llama3",
+        8,
+        linger_ms=1,
+        post=post,
+        options={"cache_prompt": True},
+    )
+
+    batcher.submit("solo", 0.7, 50)
+
+    assert post.call_args.kwargs["json"]["cache_prompt"] is True
+
+
+def test_batch_sizes_are_exported_as_metrics():
+    post = Mock(side_effect=echo_response)
+    batcher = LlamaBatcher("http://llama", "llama3", 2, linger_ms=60_000, post=post)
+    _, batches_before, prompts_before = LLM_BATCH_SIZE.labels().snapshot()
+
+    submit_concurrently(batcher, ["a", "b"])
+
+    _, batches, prompts = LLM_BATCH_SIZE.labels().snapshot()
+    assert batches == batches_before + 1
+    assert prompts == prompts_before + 2
+
+
+def test_batch_usage_is_shared_among_its_prompts():
+    def respond(url, json):
+        response = echo_response(url, json)
+        response.json.return_value.update(
+            {
+                "created": 1700000000,
+                "usage": {"prompt_tokens": 101, "completion_tokens": 20},
+                "tokens_cached": 80,
+                "timings": {
+                    "prompt_n": 21,
+                    "prompt_ms": 42.0,
+                    "prompt_per_second": 500,
+                },
+            }
+        )
+        return response
+
+    batcher = LlamaBatcher(
+        "http://llama", "llama3", 2, linger_ms=60_000, post=Mock(side_effect=respond)
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(batcher.submit, p, 0.5, 10) for p in ("a", "b")]
+        bodies = [future.result() for future in futures]
+
+    assert sorted(body["usage"]["prompt_tokens"] for body in bodies) == [50, 51]
+    assert sum(body["usage"]["completion_tokens"] for body in bodies) == 20
+    assert sum(body["tokens_cached"] for body in bodies) == 80
+    assert [body["timings"]["prompt_ms"] for body in bodies] == [21.0, 21.0]
+    assert all(body["timings"]["prompt_per_second"] == 500 for body in bodies)
+    assert all(body["created"] == 1700000000 for body in bodies)
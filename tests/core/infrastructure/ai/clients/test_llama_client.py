@@ -1,10 +1,13 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 from requests import HTTPError
 
 from app.core.infrastructure.ai.clients.llama_client import LlamaClient
+from app.core.usage import collect_usage
 
 
 @pytest.fixture
@@ -72,6 +75,7 @@ def test_generate_text_request_payload(llama_client):
             "prompt": prompt,
             "temperature": temperature,
             "max_tokens": max_tokens,
+            "cache_prompt": True,
         }
 
         mock_post.assert_called_once_with(llama_client.api_url, json=expected_payload)
@@ -84,3 +88,152 @@ def test_generate_text_request_exception(llama_client):
     with patch("requests.post", return_value=mock_response):
         with pytest.raises(HTTPError):
             llama_client.generate_text("Test prompt")
+
+
+def test_batching_disabled_by_default(llama_client):
+    assert llama_client.batcher is None
+
+
+def test_explicit_batch_size_overrides_environment():
+    with patch.dict(os.environ, {"LLAMA_BATCH_MAX_SIZE": "8"}):
+        disabled = LlamaClient(batch_max_size=0)
+        enabled = LlamaClient(batch_max_size=4, batch_linger_ms=0)
+
+    assert disabled.batcher is None
+    assert enabled.batcher.max_batch_size == 4
+    assert enabled.batcher.linger == 0
+
+
+def test_generate_text_goes_through_batcher_when_enabled():
+    client = LlamaClient(batch_max_size=4, batch_linger_ms=1)
+    mock_response = Mock(status_code=200)
+    mock_response.json.return_value = {"choices": [{"index": 0, "text": " Batched "}]}
+
+    with patch("requests.post", return_value=mock_response):
+        result = client.generate_text("Test prompt", temperature=0.5, max_tokens=10)
+
+    assert result == "Batched"
+    assert client.batcher.stats()["prompts_total"] == 1
+
+
+def test_generate_text_records_usage_of_batched_calls():
+    client = LlamaClient(batch_max_size=4, batch_linger_ms=1, cache_prompt=True)
+    mock_response = Mock(status_code=200)
+    mock_response.json.return_value = {
+        "choices": [{"index": 0, "text": " Batched "}],
+        "usage": {"prompt_tokens": 120, "completion_tokens": 10},
+        "timings": {"prompt_n": 20, "prompt_ms": 40.0},
+    }
+
+    with patch("requests.post", return_value=mock_response), collect_usage() as usage:
+        client.generate_text("Test prompt")
+
+    assert usage.prompt_tokens == 120
+    assert usage.completion_tokens == 10
+    assert client.prompt_cache.snapshot()["cached_tokens"] == 100
+
+
+def test_generate_text_falls_back_when_batching_unsupported():
+    client = LlamaClient(batch_max_size=4, batch_linger_ms=1)
+    client.batcher.supported = False
+    mock_response = Mock()
+    mock_response.json.return_value = {"choices": [{"text": "Single"}]}
+
+    with patch("requests.post", return_value=mock_response) as mock_post:
+        result = client.generate_text("Test prompt")
+
+    assert result == "Single"
+    assert mock_post.call_args.kwargs["json"]["prompt"] == "Test prompt"
+
+
+def test_generate_text_reuses_the_warm_slot_of_a_prefix():
+    client = LlamaClient(slot_count=4)
+    mock_response = Mock()
+    mock_response.json.return_value = {"choices": [{"text": "Generated text"}]}
+
+    with patch("requests.post", return_value=mock_response) as mock_post:
+        client.generate_text("Instructions. Story A", prefix="Instructions. ")
+        client.generate_text("Instructions. Story B", prefix="Instructions. ")
+
+    slots = [call.kwargs["json"]["id_slot"] for call in mock_post.call_args_list]
+    assert slots[0] == slots[1]
+    assert 0 <= slots[0] < 4
+
+
+def test_concurrent_requests_with_one_prefix_use_different_slots():
+    client = LlamaClient(slot_count=4)
+    arrived = threading.Barrier(4, timeout=5)
+
+    def post(url, json):
+        arrived.wait()
+        response = Mock()
+        response.json.return_value = {"choices": [{"text": "Generated text"}]}
+        return response
+
+    with (
+        patch("requests.post", side_effect=post) as mock_post,
+        ThreadPoolExecutor(max_workers=4) as executor,
+    ):
+        list(
+            executor.map(
+                lambda story: client.generate_text(
+                    f"Instructions. {story}", prefix="Instructions. "
+                ),
+                "ABCD",
+            )
+        )
+
+    slots = [call.kwargs["json"]["id_slot"] for call in mock_post.call_args_list]
+    assert sorted(slots) == [0, 1, 2, 3]
+
+
+def test_generate_text_without_slots_lets_server_choose(llama_client):
+    mock_response = Mock()
+    mock_response.json.return_value = {"choices": [{"text": "Generated text"}]}
+
+    with patch("requests.post", return_value=mock_response) as mock_post:
+        llama_client.generate_text("Instructions. Story", prefix="Instructions. ")
+
+    assert "id_slot" not in mock_post.call_args.kwargs["json"]
+
+
+def test_generate_text_records_prompt_cache_timings():
+    client = LlamaClient(cache_prompt=True)
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "choices": [{"text": "Generated text"}],
+        "usage": {"prompt_tokens": 120, "completion_tokens": 10},
+        "timings": {"prompt_n": 20, "prompt_ms": 40.0},
+    }
+
+    with patch("requests.post", return_value=mock_response):
+        client.generate_text("Test prompt")
+
+    stats = client.prompt_cache.snapshot()
+    assert stats["cached_tokens"] == 100
+    assert stats["saved_ms_estimate"] == 200.0
+
+
+def test_generate_text_adds_token_usage_to_the_request(llama_client):
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "choices": [{"text": "Generated text"}],
+        "usage": {"prompt_tokens": 120, "completion_tokens": 10},
+        "tokens_cached": 100,
+    }
+
+    with patch("requests.post", return_value=mock_response), collect_usage() as usage:
+        llama_client.generate_text("Test prompt")
+
+    assert usage.prompt_tokens == 120
+    assert usage.cached_tokens == 100
+    assert usage.completion_tokens == 10
+    assert usage.llm_calls == 1
+    assert usage.generation_seconds > 0
+
+
+def test_cache_prompt_can_be_disabled_from_environment():
+    with patch.dict(os.environ, {"LLAMA_CACHE_PROMPT": "false"}):
+        client = LlamaClient()
+
+    assert client.cache_prompt is False
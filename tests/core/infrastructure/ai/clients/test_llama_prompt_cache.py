@@ -0,0 +1,99 @@
+import contextlib
+
+import pytest
+
+from app.core.infrastructure.ai.clients.llama_prompt_cache import (
+    PromptCacheStats,
+    SlotScheduler,
+)
+from app.core.metrics import (
+    LLM_PROMPT_CACHE_TOKENS,
+    LLM_PROMPT_EVAL_SAVED_SECONDS,
+    LLM_PROMPT_EVAL_SECONDS,
+)
+
+
+def test_scheduler_reuses_the_warm_slot_of_a_prefix():
+    scheduler = SlotScheduler(4)
+
+    with scheduler.slot("a") as first:
+        pass
+    with scheduler.slot("b") as other:
+        pass
+    with scheduler.slot("a") as again:
+        pass
+
+    assert 0 <= first < 4
+    assert other != first
+    assert again == first
+
+
+def test_scheduler_spreads_concurrent_requests_over_idle_slots():
+    scheduler = SlotScheduler(4)
+
+    with contextlib.ExitStack() as stack:
+        slots = [stack.enter_context(scheduler.slot("a")) for _ in range(6)]
+
+    assert sorted(slots[:4]) == [0, 1, 2, 3]
+    assert all(0 <= slot < 4 for slot in slots[4:])
+
+
+def test_scheduler_lets_the_server_choose_without_slots_or_prefix():
+    with SlotScheduler(0).slot("a") as slot:
+        assert slot is None
+    with SlotScheduler(4).slot(None) as slot:
+        assert slot is None
+
+
+def test_record_uses_tokens_cached_when_reported():
+    stats = PromptCacheStats()
+
+    stats.record({"tokens_cached": 300, "timings": {"prompt_n": 50, "prompt_ms": 25.0}})
+
+    snapshot = stats.snapshot()
+    assert snapshot["prompt_tokens"] == 350
+    assert snapshot["cached_tokens"] == 300
+    assert snapshot["hit_ratio"] == round(300 / 350, 3)
+    assert snapshot["saved_ms_estimate"] == 150.0
+
+
+def test_record_uses_openai_style_cached_tokens():
+    stats = PromptCacheStats()
+
+    stats.record(
+        {
+            "usage": {
+                "prompt_tokens": 100,
+                "prompt_tokens_details": {"cached_tokens": 80},
+            },
+            "timings": {"prompt_n": 20, "prompt_ms": 10.0},
+        }
+    )
+
+    assert stats.snapshot()["cached_tokens"] == 80
+
+
+def test_record_ignores_responses_without_timings():
+    stats = PromptCacheStats()
+
+    stats.record({"choices": [{"text": "hi"}], "usage": {"prompt_tokens": 10}})
+
+    assert stats.snapshot()["requests"] == 0
+
+
+def test_record_exports_cache_counters():
+    cached_before = LLM_PROMPT_CACHE_TOKENS.labels("cached").value
+    evaluated_before = LLM_PROMPT_CACHE_TOKENS.labels("evaluated").value
+    eval_before = LLM_PROMPT_EVAL_SECONDS.labels().value
+    saved_before = LLM_PROMPT_EVAL_SAVED_SECONDS.labels().value
+
+    PromptCacheStats().record(
+        {"tokens_cached": 300, "timings": {"prompt_n": 50, "prompt_ms": 25.0}}
+    )
+
+    assert LLM_PROMPT_CACHE_TOKENS.labels("cached").value == cached_before + 300
+    assert LLM_PROMPT_CACHE_TOKENS.labels("evaluated").value == evaluated_before + 50
+    assert LLM_PROMPT_EVAL_SECONDS.labels().value == pytest.approx(eval_before + 0.025)
+    assert LLM_PROMPT_EVAL_SAVED_SECONDS.labels().value == pytest.approx(
+        saved_before + 0.15
+    )
@@ -32,6 +32,7 @@ def clean_env(monkeypatch):
     """Clean environment variables before each test"""
     monkeypatch.delenv("OPENAI_API_KEY", raising=False)
     monkeypatch.delenv("LLM_MODEL", raising=False)
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
     return monkeypatch
 
 
@@ -60,6 +61,18 @@ def test_init_with_custom_values(clean_env):
     assert client.api_key == custom_api_key
 
 
+def test_init_with_base_url(clean_env):
+    # Arrange
+    clean_env.setenv("OPENAI_BASE_URL", "http://localhost:8089/v1")
+
+    # Act
+    client = OpenAIClient(api_key="test-api-key")
+
+    # Assert
+    assert client.base_url == "http://localhost:8089/v1"
+    assert str(client.client.base_url).startswith("http://localhost:8089/v1")
+
+
 def test_init_without_api_key(clean_env):
     # Arrange & Act & Assert
     with pytest.raises(ValueError, match="OpenAI API key is missing"):
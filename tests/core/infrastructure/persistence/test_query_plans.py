@@ -0,0 +1,101 @@
+"""
+Every lookup of the repositories must be able to use an index. The statements
+are captured as the repositories run them and explained with sequential scans
+disabled, so the plan shows the index Postgres would use on a large table.
+
+Disabling sequential scans makes Postgres read any index matching the
+predicate, even in full, so only lookups that an index narrows down are
+listed: listing every available scenario reads most of the table anyway.
+"""
+
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from app.auth.infrastructure.repositories.user_repository import UserRepository
+from app.character.infrastructure.repositories.character_repository import (
+    CharacterRepository,
+)
+from app.core.ids import uuid7
+from app.scenario.infrastructure.repositories.scenario_repository import (
+    ScenarioRepository,
+)
+from app.usage.infrastructure.repositories.usage_repository import UsageRepository
+
+QUERIES = {
+    "users.get_by_email": (
+        lambda s: UserRepository(s).get_by_email("luna@example.com"),
+        "ix_users_email",
+    ),
+    "characters.get_by_id": (
+        lambda s: CharacterRepository(s).get_by_id(uuid7()),
+        "characters_pkey",
+    ),
+    "characters.get_by_ids": (
+        lambda s: CharacterRepository(s).get_by_ids([uuid7(), uuid7()]),
+        "characters_pkey",
+    ),
+    "scenarios.get_by_id": (
+        lambda s: ScenarioRepository(s).get_by_id(uuid7()),
+        "scenarios_pkey",
+    ),
+    "scenarios.get_by_ids": (
+        lambda s: ScenarioRepository(s).get_by_ids([uuid7(), uuid7()]),
+        "scenarios_pkey",
+    ),
+    "scenarios.get_by_name": (
+        lambda s: ScenarioRepository(s).get_by_name("Mystic River"),
+        "ix_scenarios_lower_name",
+    ),
+    "usage_rollups.get_by_user": (
+        lambda s: UsageRepository(s).get_by_user(uuid7()),
+        "ix_usage_rollups_user_id_day",
+    ),
+}
+
+
+@pytest_asyncio.fixture
+async def captured_statements(session_manager, async_db_session):
+    """The SELECTs run through the test session, with their parameters."""
+    statements: List[Tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = session_manager.engine.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def index_names(plan: dict) -> Iterator[str]:
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from index_names(child)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", QUERIES)
+async def test_repository_query_uses_an_index(
+    query, session_manager, async_db_session, captured_statements
+):
+    run, index = QUERIES[query]
+
+    await run(async_db_session)
+    assert captured_statements, "the repository ran no SELECT"
+
+    plans = []
+    async with session_manager.connect() as conn:
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        for statement, parameters in captured_statements:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plans.append(result.scalar_one()[0]["Plan"])
+
+    for plan in plans:
+        assert index in set(index_names(plan)), plan
@@ -0,0 +1,60 @@
+import pytest
+from pydantic import BaseModel, PrivateAttr
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.character.domain.entities.character import Character
+from app.character.infrastructure.persistence.models.character import (
+    Character as CharacterModel,
+)
+from app.core.infrastructure.persistence.rows import (
+    entity_columns,
+    select_entities,
+    to_entity,
+)
+from tests.utils.fakers import CharacterFactory
+
+
+def test_to_entity_builds_the_same_entity_as_validation():
+    character = CharacterFactory()
+    row = tuple(getattr(character, name) for name in Character.model_fields)
+
+    entity = to_entity(Character, row)
+
+    assert entity == character
+    assert entity.model_fields_set == set(Character.model_fields)
+    assert entity.model_dump() == character.model_dump()
+
+
+def test_to_entity_keeps_the_private_attributes():
+    class Tagged(BaseModel):
+        name: str
+        _tag: str = PrivateAttr(default="new")
+
+    entity = to_entity(Tagged, ("Luna",))
+
+    assert entity.name == "Luna"
+    assert entity._tag == "new"
+
+
+def test_entity_columns_requires_a_column_per_field():
+    class Hero(Character):
+        catchphrase: str
+
+    with pytest.raises(ValueError, match="catchphrase"):
+        entity_columns(CharacterModel, Hero)
+
+
+@pytest.mark.asyncio
+async def test_select_entities_autoflushes_pending_objects(
+    async_db_session: AsyncSession,
+):
+    character = CharacterFactory()
+    async_db_session.add(CharacterModel(**character.model_dump()))
+
+    result = await async_db_session.execute(
+        select_entities(CharacterModel, Character).where(
+            CharacterModel.id == character.id
+        )
+    )
+
+    assert to_entity(Character, result.one()) == character
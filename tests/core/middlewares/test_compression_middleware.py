@@ -0,0 +1,149 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.core.middlewares.compression_middleware import CompressionMiddleware
+
+STORY = "Once upon a time, in a kingdom far away... " * 100
+
+
+def make_app(minimum_size: int = 500) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size)
+
+    @app.get("/story")
+    async def story():
+        return Response(STORY, media_type="text/plain", headers={"ETag": '"story-v1"'})
+
+    @app.get("/short")
+    async def short():
+        return {"title": "Short"}
+
+    @app.get("/image")
+    async def image():
+        return Response(b"\x89PNG" * 500, media_type="image/png")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(
+            gzip.compress(STORY.encode()),
+            media_type="text/plain",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    @app.get("/stream")
+    async def stream():
+        async def lines():
+            for index in range(3):
+                yield f'{{"index": {index}}}\n'.encode()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+
+async def get(app: FastAPI, path: str, accept_encoding: str = "gzip"):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_compressed():
+    response = await get(make_app(), "/story")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(STORY)
+    assert response.text == STORY
+
+
+@pytest.mark.asyncio
+async def test_compressed_responses_get_a_weak_etag():
+    response = await get(make_app(), "/story")
+
+    assert response.headers["etag"] == 'W/"story-v1"'
+
+
+@pytest.mark.asyncio
+async def test_small_bodies_are_sent_as_is():
+    response = await get(make_app(), "/short")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == {"title": "Short"}
+
+
+@pytest.mark.asyncio
+async def test_minimum_size_is_configurable():
+    response = await get(make_app(minimum_size=1), "/short")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"title": "Short"}
+
+
+@pytest.mark.asyncio
+async def test_bodies_are_sent_as_is_when_no_encoding_is_accepted():
+    response = await get(make_app(), "/story", accept_encoding="identity")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == '"story-v1"'
+    assert response.text == STORY
+
+
+@pytest.mark.asyncio
+async def test_binary_and_encoded_bodies_are_not_compressed():
+    image = await get(make_app(), "/image")
+    encoded = await get(make_app(), "/encoded")
+
+    assert "content-encoding" not in image.headers
+    assert "vary" not in image.headers
+    assert image.content == b"\x89PNG" * 500
+    assert encoded.headers["content-encoding"] == "gzip"
+    assert encoded.text == STORY
+
+
+@pytest.mark.asyncio
+async def test_streamed_bodies_are_compressed_and_flushed_per_chunk():
+    sent = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # The client stays connected until the stream ends.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "server": ("test", 80),
+    }
+    await make_app()(scope, receive, send)
+
+    start, *chunks = sent
+    assert (b"content-encoding", b"gzip") in start["headers"]
+    assert b"content-length" not in dict(start["headers"])
+
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    lines = [decoder.decompress(chunk["body"]) for chunk in chunks]
+    assert lines[:3] == [b'{"index": 0}\n', b'{"index": 1}\n', b'{"index": 2}\n']
+    assert decoder.eof
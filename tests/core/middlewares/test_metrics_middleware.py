@@ -0,0 +1,50 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from app.core.metrics import HTTP_REQUEST_DURATION
+from app.core.middlewares.metrics_middleware import MetricsMiddleware
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/middleware-test/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+def request_count(method: str, route: str, status: int) -> float:
+    return HTTP_REQUEST_DURATION.labels(method, route, status).snapshot()[1]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_labelled_with_the_route_template(client):
+    route = "/middleware-test/{item_id}"
+    ok_before = request_count("GET", route, 200)
+    not_found_before = request_count("GET", route, 404)
+
+    async with client:
+        await client.get("/middleware-test/1")
+        await client.get("/middleware-test/2")
+        await client.get("/middleware-test/0")
+
+    assert request_count("GET", route, 200) == ok_before + 2
+    assert request_count("GET", route, 404) == not_found_before + 1
+
+
+@pytest.mark.asyncio
+async def test_unmatched_requests_share_one_label(client):
+    before = request_count("GET", "unmatched", 404)
+
+    async with client:
+        await client.get("/nothing/here")
+        await client.get("/nothing/there")
+
+    assert request_count("GET", "unmatched", 404) == before + 2
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.middlewares.timing_middleware import ServerTimingMiddleware
+from app.core.timing import phase
+
+
+def make_client(slow_request_ms: float) -> AsyncClient:
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware, slow_request_ms=slow_request_ms)
+
+    @app.get("/timed/{item_id}")
+    async def timed(item_id: int):
+        with phase("db"):
+            await asyncio.sleep(0.01)
+        return {"id": item_id}
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_response_carries_server_timing_header():
+    async with make_client(slow_request_ms=10_000) as client:
+        response = await client.get("/timed/1")
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert "total;dur=" in timing
+
+
+@pytest.mark.asyncio
+async def test_slow_requests_are_logged_with_their_phases(caplog):
+    with caplog.at_level(logging.WARNING):
+        async with make_client(slow_request_ms=0) as client:
+            await client.get("/timed/1")
+
+    (record,) = [r for r in caplog.records if r.getMessage().startswith("Slow")]
+    assert record.route == "/timed/{item_id}"
+    assert record.status == 200
+    assert "db" in record.phases_ms
+
+
+@pytest.mark.asyncio
+async def test_fast_requests_are_not_logged(caplog):
+    with caplog.at_level(logging.WARNING):
+        async with make_client(slow_request_ms=10_000) as client:
+            await client.get("/timed/1")
+
+    assert not [r for r in caplog.records if r.getMessage().startswith("Slow")]
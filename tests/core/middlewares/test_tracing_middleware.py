@@ -0,0 +1,68 @@
+import io
+import json
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.middlewares.tracing_middleware import TracingMiddleware
+from app.core.tracing import SpanExporter, tracer
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+
+
+@pytest.fixture
+def stream():
+    stream = io.StringIO()
+    tracer.configure(SpanExporter(stream))
+    yield stream
+    tracer.configure(None)
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        with tracer.span("handler"):
+            return {"id": item_id}
+
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_request_span_is_named_after_the_route(client, stream):
+    async with client:
+        response = await client.get("/items/1")
+
+    handler, request = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert request["name"] == "GET /items/{item_id}"
+    assert request["kind"] == "SpanKind.SERVER"
+    assert request["attributes"]["http.route"] == "/items/{item_id}"
+    assert request["attributes"]["http.status_code"] == 200
+    assert handler["parent_id"] == request["context"]["span_id"]
+    assert response.headers["traceparent"].split("-")[1] == request["context"][
+        "trace_id"
+    ].removeprefix("0x")
+
+
+@pytest.mark.asyncio
+async def test_incoming_trace_is_continued(client, stream):
+    async with client:
+        response = await client.get(
+            "/items/1", headers={"traceparent": f"00-{TRACE_ID}-b7ad6b7169203331-01"}
+        )
+
+    assert response.headers["traceparent"].startswith(f"00-{TRACE_ID}-")
+    request = json.loads(stream.getvalue().splitlines()[-1])
+    assert request["parent_id"] == "0xb7ad6b7169203331"
+
+
+@pytest.mark.asyncio
+async def test_disabled_tracer_adds_nothing(client):
+    async with client:
+        response = await client.get("/items/1")
+
+    assert "traceparent" not in response.headers
@@ -0,0 +1,62 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.settings.config import settings
+
+
+@pytest.fixture
+def admin(test_user, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [test_user.email])
+
+
+@pytest.mark.asyncio
+async def test_query_stats_list_the_statements_run(
+    authenticated_client: AsyncClient, admin
+):
+    await authenticated_client.delete("/debug/queries")
+    await authenticated_client.get("/scenarios/")
+
+    response = await authenticated_client.get("/debug/queries", params={"limit": 5})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["dropped"] == 0
+    (statement,) = [
+        s for s in body["statements"] if "FROM scenarios" in s["fingerprint"]
+    ]
+    assert statement["calls"] >= 1
+    assert set(statement) == {
+        "fingerprint",
+        "calls",
+        "total_ms",
+        "mean_ms",
+        "max_ms",
+        "rows",
+    }
+
+
+@pytest.mark.asyncio
+async def test_query_stats_reject_unknown_ordering(
+    authenticated_client: AsyncClient, admin
+):
+    response = await authenticated_client.get(
+        "/debug/queries", params={"order_by": "name"}
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_query_stats_require_authentication(async_client: AsyncClient):
+    assert (await async_client.get("/debug/queries")).status_code == 401
+    assert (await async_client.delete("/debug/queries")).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_query_stats_require_an_admin(
+    authenticated_client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [])
+
+    assert (await authenticated_client.get("/debug/queries")).status_code == 403
+    assert (await authenticated_client.delete("/debug/queries")).status_code == 403
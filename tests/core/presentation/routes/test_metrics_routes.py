@@ -0,0 +1,22 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_route_and_database_metrics(
+    async_client: AsyncClient,
+):
+    await async_client.get("/scenarios/")
+
+    response = await async_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/scenarios/",'
+        'status="200"}' in body
+    )
+    assert 'db_query_duration_seconds_count{operation="SELECT"}' in body
+    assert "# TYPE llm_request_duration_seconds histogram" in body
+    assert "# TYPE password_hash_duration_seconds histogram" in body
@@ -0,0 +1,61 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.dependencies import get_profiler
+from app.core.profiler import SamplingProfiler
+from app.core.settings.config import settings
+from app.main import app
+
+
+@pytest.fixture
+def admin(test_user, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [test_user.email])
+
+
+@pytest.mark.asyncio
+async def test_profile_returns_collapsed_stacks(
+    authenticated_client: AsyncClient, admin
+):
+    response = await authenticated_client.get(
+        "/admin/profile", params={"seconds": 0.05, "interval_ms": 5}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text.strip()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in response.text.splitlines())
+
+
+@pytest.mark.asyncio
+async def test_profile_returns_speedscope_document(
+    authenticated_client: AsyncClient, admin
+):
+    response = await authenticated_client.get(
+        "/admin/profile", params={"seconds": 0.05, "format": "speedscope"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["profiles"]
+
+
+@pytest.mark.asyncio
+async def test_profile_is_admin_only(authenticated_client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [])
+
+    response = await authenticated_client.get("/admin/profile")
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_concurrent_profile_is_rejected(authenticated_client: AsyncClient, admin):
+    busy = SamplingProfiler()
+    busy._lock.acquire()
+    app.dependency_overrides[get_profiler] = lambda: busy
+    try:
+        response = await authenticated_client.get("/admin/profile")
+    finally:
+        app.dependency_overrides.pop(get_profiler)
+        busy._lock.release()
+
+    assert response.status_code == 409
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from app.core.admission import AdmissionController, AdmissionMode, ConcurrencyLimiter
+from app.core.exceptions.admission_exceptions import AdmissionRejectedError
+
+
+@pytest.fixture
+def limiter():
+    return ConcurrencyLimiter(
+        backend="llama", limit=1, max_queue_size=1, max_queue_time=0.2
+    )
+
+
+@pytest.mark.asyncio
+async def test_acquire_under_limit_is_immediate(limiter):
+    waited = await limiter.acquire()
+
+    assert waited == 0.0
+    assert limiter.in_flight == 1
+    assert limiter.snapshot()["admitted_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_full_is_rejected_immediately(limiter):
+    await limiter.acquire()
+    queued = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        await limiter.acquire()
+
+    assert exc_info.value.reason == "queue_full"
+    assert exc_info.value.retry_after >= 1
+    assert limiter.snapshot()["rejected_total"]["queue_full"] == 1
+
+    limiter.release()
+    await queued
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_is_rejected(limiter):
+    await limiter.acquire()
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        await limiter.acquire()
+
+    assert exc_info.value.reason == "queue_timeout"
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_release_hands_slot_to_oldest_waiter(limiter):
+    await limiter.acquire()
+    queued = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    limiter.release(latency=0.05)
+    waited = await queued
+
+    assert waited > 0
+    assert limiter.in_flight == 1
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue(limiter):
+    await limiter.acquire()
+    queued = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    assert limiter.queue_depth == 0
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_aimd_increases_on_fast_success_and_backs_off_on_error():
+    limiter = ConcurrencyLimiter(
+        backend="llama",
+        limit=2,
+        max_queue_size=4,
+        max_queue_time=1,
+        mode=AdmissionMode.AIMD,
+        max_limit=4,
+        target_latency=1.0,
+        backoff_ratio=0.5,
+    )
+
+    for _ in range(4):
+        await limiter.acquire()
+        limiter.release(latency=0.1, success=True)
+    assert limiter.limit == 3
+
+    await limiter.acquire()
+    limiter.release(latency=0.1, success=False)
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_controller_uses_per_backend_limits():
+    controller = AdmissionController(
+        default_limit=2,
+        max_queue_size=0,
+        max_queue_time=1,
+        backend_limits={"llama": 1},
+    )
+
+    async with controller.admit("llama"):
+        with pytest.raises(AdmissionRejectedError):
+            async with controller.admit("llama"):
+                pass  # pragma: no cover
+
+        async with controller.admit("chatgpt"):
+            stats = controller.stats()
+
+    assert stats["llama"]["limit"] == 1
+    assert stats["llama"]["in_flight"] == 1
+    assert stats["chatgpt"]["limit"] == 2
+    assert controller.stats()["llama"]["in_flight"] == 0
@@ -0,0 +1,51 @@
+from typing import Dict
+
+import pytest
+
+from app.core.catalog import SCENARIOS, CatalogVersions
+
+
+class FakeRepository:
+    def __init__(self, versions: Dict[str, int]) -> None:
+        self.versions = versions
+        self.reads = 0
+
+    async def get_all(self) -> Dict[str, int]:
+        self.reads += 1
+        return dict(self.versions)
+
+
+@pytest.mark.asyncio
+async def test_versions_are_read_once_per_ttl():
+    repository = FakeRepository({SCENARIOS: 3})
+    versions = CatalogVersions(ttl=60)
+
+    assert await versions.get(SCENARIOS, repository) == 3
+    repository.versions[SCENARIOS] = 4
+    assert await versions.get(SCENARIOS, repository) == 3
+    assert await versions.get("characters", repository) == 0
+    assert repository.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_reads_the_versions_again():
+    repository = FakeRepository({SCENARIOS: 3})
+    versions = CatalogVersions(ttl=60)
+    await versions.get(SCENARIOS, repository)
+
+    repository.versions[SCENARIOS] = 4
+    versions.invalidate()
+
+    assert await versions.get(SCENARIOS, repository) == 4
+    assert repository.reads == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_versions_are_read_again():
+    repository = FakeRepository({})
+    versions = CatalogVersions(ttl=0)
+
+    await versions.get(SCENARIOS, repository)
+    await versions.get(SCENARIOS, repository)
+
+    assert repository.reads == 2
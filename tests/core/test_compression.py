@@ -0,0 +1,88 @@
+import gzip
+
+import pytest
+
+from app.core.compression import (
+    MeteredCompressor,
+    create_compressor,
+    negotiate_encoding,
+    supported_encodings,
+)
+from app.core.metrics import HTTP_COMPRESSION_INPUT_BYTES, HTTP_COMPRESSION_OUTPUT_BYTES
+
+ENCODINGS = ["zstd", "br", "gzip"]
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip;q=1.0, zstd;q=0.5", "gzip"),
+        ("br;q=0.9, gzip;q=0.9", "br"),
+        ("*", "zstd"),
+        ("*;q=0.5, gzip", "gzip"),
+        ("x-gzip", "gzip"),
+        ("GZIP", "gzip"),
+        ("gzip;q=0", None),
+        ("*;q=0", None),
+        ("identity", None),
+        ("deflate", None),
+        ("", None),
+        ("gzip;q=oops, br", "br"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ENCODINGS) == expected
+
+
+def test_negotiate_encoding_only_offers_the_given_encodings():
+    assert negotiate_encoding("zstd, br", ["gzip"]) is None
+
+
+def test_gzip_is_always_supported():
+    assert "gzip" in supported_encodings()
+
+
+def test_create_compressor_rejects_unknown_encodings():
+    with pytest.raises(ValueError):
+        create_compressor("deflate")
+
+
+def test_flushed_gzip_chunks_decode_before_the_stream_ends():
+    compressor = create_compressor("gzip")
+    decoder = gzip.zlib.decompressobj(16 + gzip.zlib.MAX_WBITS)
+
+    first = compressor.compress(b'{"index": 0}\n') + compressor.flush()
+    assert decoder.decompress(first) == b'{"index": 0}\n'
+
+    last = compressor.compress(b'{"index": 1}\n') + compressor.finish()
+    assert decoder.decompress(last) == b'{"index": 1}\n'
+    assert decoder.eof
+
+
+@pytest.mark.parametrize("encoding", ["br", "zstd"])
+def test_optional_encodings_round_trip(encoding):
+    module = pytest.importorskip({"br": "brotli", "zstd": "zstandard"}[encoding])
+    compressor = create_compressor(encoding, level=1)
+
+    data = compressor.compress(b"story " * 100) + compressor.finish()
+
+    if encoding == "br":
+        assert module.decompress(data) == b"story " * 100
+    else:
+        assert module.ZstdDecompressor().decompressobj().decompress(data) == (
+            b"story " * 100
+        )
+
+
+def test_metered_compressor_records_bytes_in_and_out():
+    input_bytes = HTTP_COMPRESSION_INPUT_BYTES.labels("gzip").value
+    output_bytes = HTTP_COMPRESSION_OUTPUT_BYTES.labels("gzip").value
+
+    compressed = MeteredCompressor("gzip").compress(b"a" * 1000, finish=True)
+
+    assert gzip.decompress(compressed) == b"a" * 1000
+    assert HTTP_COMPRESSION_INPUT_BYTES.labels("gzip").value == input_bytes + 1000
+    assert HTTP_COMPRESSION_OUTPUT_BYTES.labels("gzip").value == (
+        output_bytes + len(compressed)
+    )
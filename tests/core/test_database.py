@@ -1,7 +1,11 @@
+import io
+import json
+
 import pytest
 from sqlalchemy import text
 
-from app.core.database import sessionmanager
+from app.core.database import DatabaseSessionManager, release_connection, sessionmanager
+from app.core.tracing import SpanExporter, tracer
 
 
 @pytest.mark.asyncio
@@ -10,3 +14,55 @@ async def test_database_connection():
     async with sessionmanager.connect() as conn:
         result = await conn.execute(text("SELECT 1"))
         assert result.scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_statements_are_traced():
+    stream = io.StringIO()
+    tracer.configure(SpanExporter(stream))
+    sessionmanager.init_db()
+    try:
+        async with sessionmanager.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    finally:
+        tracer.configure(None)
+
+    spans = [json.loads(line) for line in stream.getvalue().splitlines()]
+    (query,) = [s for s in spans if s["attributes"]["db.statement"] == "SELECT 1"]
+    assert query["name"] == "db.query"
+    assert query["attributes"]["db.operation"] == "SELECT"
+
+
+@pytest.mark.asyncio
+async def test_pool_is_sized_from_the_manager_options():
+    manager = DatabaseSessionManager(
+        sessionmanager.database_url, pool_size=2, max_overflow=1, pool_timeout=5
+    )
+    manager.init_db()
+    try:
+        assert manager.engine.pool.size() == 2
+        assert manager.engine.pool._max_overflow == 1
+        assert manager.engine.pool._timeout == 5
+    finally:
+        await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_release_connection_returns_the_connection_to_the_pool(
+    session_manager,
+):
+    pool = session_manager.engine.pool
+    checked_out = pool.checkedout()
+
+    async with session_manager.session() as session:
+        # Nothing is checked out until the first statement.
+        assert pool.checkedout() == checked_out
+
+        await session.execute(text("SELECT 1"))
+        assert pool.checkedout() == checked_out + 1
+
+        await release_connection(session)
+        assert pool.checkedout() == checked_out
+
+        # The session checks a connection out again when it is used.
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from app.core.exceptions.fieldset_exceptions import InvalidFieldSelectionError
+from app.core.fieldsets import select_fields, selection_tag
+from app.core.responses import EntityJSONResponse
+from app.scenario.presentation.models.scenario import ScenarioResponse
+from app.story.presentation.models.story import GenerateStoryResponse
+from tests.utils.fakers import CharacterFactory, ScenarioFactory, StoryFactory
+
+RELATIONS = ("characters", "scenario")
+
+
+def test_relations_are_references_unless_expanded():
+    include = select_fields(GenerateStoryResponse, relations=RELATIONS)
+
+    assert include["title"] is True
+    assert include["characters"] == {"__all__": {"id": True}}
+    assert include["scenario"] == {"id": True}
+
+
+def test_expanded_relations_keep_every_field():
+    include = select_fields(
+        GenerateStoryResponse, expand=("scenario",), relations=RELATIONS
+    )
+
+    assert include["characters"] == {"__all__": {"id": True}}
+    assert set(include["scenario"]) == {"id", "name", "description"}
+
+
+def test_fields_select_top_level_and_related_fields():
+    include = select_fields(
+        GenerateStoryResponse, ("characters.name", "title"), relations=RELATIONS
+    )
+
+    assert include == {
+        "title": True,
+        "characters": {"__all__": {"id": True, "name": True}},
+    }
+
+
+def test_id_is_always_selected():
+    assert select_fields(ScenarioResponse, ("name",)) == {"id": True, "name": True}
+
+
+def test_selection_tag_tells_the_selections_apart():
+    full = select_fields(ScenarioResponse)
+    names = select_fields(ScenarioResponse, ("name",))
+
+    assert selection_tag(ScenarioResponse, full) is None
+    assert selection_tag(ScenarioResponse, names) == selection_tag(
+        ScenarioResponse, select_fields(ScenarioResponse, ("name",))
+    )
+    assert selection_tag(ScenarioResponse, names) != selection_tag(
+        ScenarioResponse, select_fields(ScenarioResponse, ("description",))
+    )
+
+
+@pytest.mark.parametrize(
+    "fields, expand, parameter",
+    [
+        (("author",), (), "fields"),
+        (("characters.age",), (), "fields"),
+        (("title.length",), (), "fields"),
+        (None, ("title",), "expand"),
+    ],
+)
+def test_unknown_names_are_rejected(fields, expand, parameter):
+    with pytest.raises(InvalidFieldSelectionError) as error:
+        select_fields(GenerateStoryResponse, fields, expand, RELATIONS)
+
+    assert error.value.parameter == parameter
+
+
+def test_unselected_fields_are_not_serialized():
+    story = StoryFactory(characters=[CharacterFactory() for _ in range(2)])
+    include = select_fields(GenerateStoryResponse, ("title",), relations=RELATIONS)
+
+    response = EntityJSONResponse(story, GenerateStoryResponse, include=include)
+
+    assert json.loads(response.body) == {"title": story.title}
+
+
+def test_entity_response_renders_lists():
+    scenarios = [ScenarioFactory(), ScenarioFactory()]
+    include = select_fields(ScenarioResponse, ("name",))
+
+    response = EntityJSONResponse(scenarios, ScenarioResponse, include=include)
+
+    assert json.loads(response.body) == [
+        {"id": str(scenario.id), "name": scenario.name} for scenario in scenarios
+    ]
@@ -0,0 +1,41 @@
+import pytest
+from starlette.requests import Request
+
+from app.core.http_cache import etag_matches, make_etag, not_modified
+
+
+def make_request(if_none_match: str | None) -> Request:
+    headers = (
+        [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    )
+    return Request({"type": "http", "headers": headers})
+
+
+def test_make_etag_is_quoted_and_versioned():
+    assert make_etag("scenarios", 3) == '"scenarios-v3"'
+    assert make_etag("characters", 0, "abc") == '"characters-abc-v0"'
+    assert make_etag("scenarios", 3, variant="1a2b") == '"scenarios-v3-1a2b"'
+
+
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        (None, False),
+        ('"scenarios-v2"', False),
+        ('"scenarios-v3"', True),
+        ('W/"scenarios-v3"', True),
+        ('"scenarios-v1", "scenarios-v3"', True),
+        ("*", True),
+    ],
+)
+def test_etag_matches(header, matches):
+    assert etag_matches(make_request(header), '"scenarios-v3"') is matches
+
+
+def test_not_modified_repeats_the_cache_headers():
+    response = not_modified('"scenarios-v3"', 60)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"scenarios-v3"'
+    assert response.headers["cache-control"] == "public, max-age=60"
@@ -0,0 +1,38 @@
+import time
+
+from app.core import ids
+from app.core.ids import uuid7
+
+
+def test_uuid7_layout():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_is_increasing():
+    values = [uuid7() for _ in range(10_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_uuid7_borrows_the_next_millisecond_when_the_counter_is_full(monkeypatch):
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    values = [uuid7() for _ in range(5_000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert values[-1].int >> 80 > 1_700_000_000_000
+
+
+def test_uuid7_keeps_increasing_when_the_clock_goes_back(monkeypatch):
+    first = uuid7()
+    monkeypatch.setattr(ids.time, "time_ns", lambda: 1_000_000_000_000_000)
+
+    assert uuid7() > first
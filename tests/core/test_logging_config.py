@@ -0,0 +1,116 @@
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from app.core.logging_config import (
+    ContextQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    configure_logging,
+    stop_logging,
+)
+from app.core.tracing import SpanExporter, tracer
+
+
+def make_record(name="app.test", level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_json_formatter_includes_extra_fields():
+    record = make_record()
+    record.duration_ms = 12.5
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.test"
+    assert entry["duration_ms"] == 12.5
+    assert "args" not in entry and "msg" not in entry
+
+
+def test_queue_handler_formats_the_exception_in_the_caller():
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        record = make_record(msg="failed", args=())
+        record.exc_info = (type(e), e, e.__traceback__)
+
+    prepared = ContextQueueHandler(None).prepare(record)
+
+    assert prepared.exc_info is None
+    assert "ValueError: boom" in prepared.exc_text
+    assert (
+        "ValueError: boom" in json.loads(JsonFormatter().format(prepared))["exception"]
+    )
+
+
+def test_queue_handler_tags_records_with_the_current_trace():
+    tracer.configure(SpanExporter(io.StringIO()))
+    try:
+        with tracer.span("request") as span:
+            prepared = ContextQueueHandler(None).prepare(make_record())
+    finally:
+        tracer.configure(None)
+
+    assert prepared.trace_id == f"{span.trace_id:032x}"
+    assert prepared.getMessage() == "hello world"
+
+
+def test_sampling_filter_applies_to_children_and_keeps_warnings():
+    sampling = SamplingFilter({"sqlalchemy.engine": 0.0})
+
+    assert not sampling.filter(make_record(name="sqlalchemy.engine.Engine"))
+    assert sampling.filter(make_record(name="sqlalchemy.engine", level=logging.ERROR))
+    assert sampling.filter(make_record(name="app.story"))
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    configure_logging()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def test_records_are_written_by_the_listener_thread(restore_logging, monkeypatch):
+    stream = io.StringIO()
+    writers = []
+
+    class RecordingHandler(logging.StreamHandler):
+        def emit(self, record):
+            writers.append(threading.current_thread())
+            super().emit(record)
+
+    monkeypatch.setattr(
+        logging, "StreamHandler", lambda stream_=None: RecordingHandler(stream)
+    )
+    configure_logging("INFO", {"app.noisy": "ERROR"}, "json", {"app.sampled": 0.0})
+
+    logger = logging.getLogger("app.story")
+    logger.info("story %d generated", 7, extra={"backend": "llama"})
+    logging.getLogger("app.noisy").warning("dropped by level")
+    logging.getLogger("app.sampled").info("dropped by sampling")
+    stop_logging()
+    monkeypatch.undo()
+
+    (line,) = stream.getvalue().splitlines()
+    entry = json.loads(line)
+    assert entry["message"] == "story 7 generated"
+    assert entry["backend"] == "llama"
+    assert writers and all(w is not threading.current_thread() for w in writers)
+
+
+def test_stop_logging_can_run_twice(restore_logging):
+    configure_logging()
+
+    stop_logging()
+    stop_logging()
@@ -0,0 +1,135 @@
+import threading
+
+import pytest
+
+from app.core.metrics import (
+    LLM_ERRORS,
+    LLM_REQUEST_DURATION,
+    LLM_TOKENS,
+    MetricsRegistry,
+    record_llm_usage,
+    track_llm_call,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+def test_counter_renders_labelled_series(registry):
+    counter = registry.counter("jobs_total", "Jobs done.", ("queue",))
+
+    counter.labels("fast").inc()
+    counter.labels("fast").inc(2)
+    counter.labels("slow").inc()
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP jobs_total Jobs done.", "# TYPE jobs_total counter"]
+    assert 'jobs_total{queue="fast"} 3' in lines
+    assert 'jobs_total{queue="slow"} 1' in lines
+
+
+def test_counter_cannot_decrease(registry):
+    counter = registry.counter("jobs_total", "Jobs done.")
+
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+
+
+def test_labels_must_match_label_names(registry):
+    counter = registry.counter("jobs_total", "Jobs done.", ("queue",))
+
+    with pytest.raises(ValueError):
+        counter.labels("fast", "extra")
+
+
+def test_metric_names_are_unique(registry):
+    registry.counter("jobs_total", "Jobs done.")
+
+    with pytest.raises(ValueError):
+        registry.gauge("jobs_total", "Jobs done.")
+
+
+def test_histogram_renders_cumulative_buckets(registry):
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    lines = registry.render().splitlines()
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_count 4" in lines
+    assert "latency_seconds_sum 3.65" in lines
+
+
+def test_histogram_time_observes_block_duration(registry):
+    histogram = registry.histogram("latency_seconds", "Latency.", ("op",))
+
+    with histogram.labels("hash").time():
+        pass
+
+    _, count, total = histogram.labels("hash").snapshot()
+    assert count == 1
+    assert total >= 0
+
+
+def test_gauge_reads_function_at_scrape_time(registry):
+    gauge = registry.gauge("pool_connections", "Connections.", ("state",))
+    connections = [1, 2]
+
+    gauge.labels("checked_out").set_function(lambda: len(connections))
+    connections.append(3)
+
+    assert 'pool_connections{state="checked_out"} 3' in registry.render()
+
+
+def test_label_values_are_escaped(registry):
+    registry.counter("jobs_total", "Jobs done.", ("queue",)).labels('a"b\\c').inc()
+
+    assert 'jobs_total{queue="a\\"b\\\\c"} 1' in registry.render()
+
+
+def test_updates_from_many_threads_are_not_lost(registry):
+    counter = registry.counter("jobs_total", "Jobs done.")
+
+    def work():
+        for _ in range(10_000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.labels().value == 80_000
+
+
+def test_track_llm_call_counts_errors():
+    errors_before = LLM_ERRORS.labels("test-backend").value
+
+    with pytest.raises(RuntimeError):
+        with track_llm_call("test-backend"):
+            raise RuntimeError("boom")
+
+    assert LLM_ERRORS.labels("test-backend").value == errors_before + 1
+    assert LLM_REQUEST_DURATION.labels("test-backend").snapshot()[1] >= 1
+
+
+def test_record_llm_usage_counts_tokens_by_kind():
+    record_llm_usage(
+        "usage-backend",
+        {
+            "prompt_tokens": 100,
+            "completion_tokens": 20,
+            "prompt_tokens_details": {"cached_tokens": 80},
+        },
+    )
+    record_llm_usage("usage-backend", None)
+
+    assert LLM_TOKENS.labels("usage-backend", "prompt").value == 100
+    assert LLM_TOKENS.labels("usage-backend", "cached").value == 80
+    assert LLM_TOKENS.labels("usage-backend", "completion").value == 20
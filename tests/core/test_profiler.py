@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from app.core.exceptions.profiler_exceptions import ProfilerBusyError
+from app.core.profiler import SamplingProfiler
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_loop, args=(stop,), name="busy")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+def test_profile_samples_the_other_threads(busy_thread):
+    profile = SamplingProfiler().profile(0.1, interval=0.005)
+
+    assert profile.samples > 1
+    threads = {thread for thread, _ in profile.stacks}
+    assert "busy" in threads
+    assert threading.current_thread().name not in threads
+
+    collapsed = profile.to_collapsed()
+    # One line per distinct stack: busy_loop is seen on its two lines.
+    lines = [line for line in collapsed.splitlines() if "busy_loop" in line]
+    assert lines
+    assert all(line.startswith("busy;") for line in lines)
+    assert all(int(line.rsplit(" ", 1)[1]) >= 1 for line in lines)
+
+
+def test_speedscope_document_references_shared_frames(busy_thread):
+    profile = SamplingProfiler().profile(0.05, interval=0.005)
+
+    document = profile.to_speedscope()
+
+    frames = document["shared"]["frames"]
+    (busy,) = [p for p in document["profiles"] if p["name"] == "busy"]
+    assert busy["type"] == "sampled"
+    assert len(busy["samples"]) == len(busy["weights"])
+    assert any(
+        frames[index]["name"] == "busy_loop"
+        for sample in busy["samples"]
+        for index in sample
+    )
+
+
+def test_duration_and_interval_are_bounded():
+    sampling_profiler = SamplingProfiler(max_seconds=0.05, min_interval=0.01)
+
+    started_at = time.perf_counter()
+    profile = sampling_profiler.profile(60, interval=0)
+
+    assert time.perf_counter() - started_at < 1
+    assert profile.interval == 0.01
+
+
+def test_only_one_profile_runs_at_a_time():
+    sampling_profiler = SamplingProfiler()
+    thread = threading.Thread(target=sampling_profiler.profile, args=(0.2,))
+    thread.start()
+    while not sampling_profiler.running:
+        time.sleep(0.001)
+
+    with pytest.raises(ProfilerBusyError):
+        sampling_profiler.profile(0.01)
+
+    thread.join()
+    assert not sampling_profiler.running
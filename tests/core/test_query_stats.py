@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+
+from app.core.query_stats import QueryStats, fingerprint
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        (
+            "SELECT characters.id FROM characters WHERE characters.id = $1::UUID",
+            "SELECT characters.id FROM characters WHERE characters.id = ?::UUID",
+        ),
+        (
+            "SELECT * FROM scenarios WHERE id IN ($1, $2,\n $3) LIMIT 10",
+            "SELECT * FROM scenarios WHERE id IN (?) LIMIT ?",
+        ),
+        (
+            "UPDATE users SET name = 'O''Brien' WHERE users_1.age > 42",
+            "UPDATE users SET name = ? WHERE users_1.age > ?",
+        ),
+        ("SELECT :name, %(email)s, %s", "SELECT ?, ?, ?"),
+    ],
+)
+def test_fingerprint_strips_values(statement, expected):
+    assert fingerprint(statement) == expected
+
+
+def test_executions_are_grouped_by_fingerprint():
+    stats = QueryStats()
+
+    stats.record("SELECT * FROM t WHERE id IN ($1)", 0.002, 1)
+    stats.record("SELECT * FROM t WHERE id IN ($1, $2, $3)", 0.004, 3)
+    stats.record("SELECT 1", 0.010, 1)
+
+    by_total = stats.top(order_by="total")
+    assert [s.fingerprint for s in by_total] == [
+        "SELECT ?",
+        "SELECT * FROM t WHERE id IN (?)",
+    ]
+    grouped = stats.top(order_by="calls")[0]
+    assert grouped.calls == 2
+    assert grouped.rows == 4
+    assert grouped.total_ms == pytest.approx(6.0)
+    assert grouped.max_ms == pytest.approx(4.0)
+    assert grouped.mean_ms == pytest.approx(3.0)
+
+
+def test_statements_over_the_limit_are_dropped():
+    stats = QueryStats(max_statements=1)
+
+    stats.record("SELECT 1 FROM a", 0.001)
+    stats.record("SELECT 1 FROM b", 0.001)
+
+    assert len(stats.top()) == 1
+    assert stats.dropped == 1
+
+    stats.reset()
+    assert stats.top() == [] and stats.dropped == 0
+
+
+def test_slow_queries_are_logged_without_their_values(caplog):
+    stats = QueryStats(slow_query_ms=5)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        stats.record("SELECT * FROM users WHERE email = 'secret@example.com'", 0.001)
+        stats.record("SELECT * FROM users WHERE email = 'secret@example.com'", 0.050)
+
+    (record,) = caplog.records
+    assert "secret" not in record.getMessage()
+    assert record.fingerprint == "SELECT * FROM users WHERE email = ?"
+    assert record.duration_ms == pytest.approx(50.0)
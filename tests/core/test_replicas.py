@@ -0,0 +1,174 @@
+from typing import List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+
+from app.core.database import DatabaseSessionManager
+from app.core.dependencies import get_catalog_version_repository
+from app.core.replicas import ReplicaSet
+from app.scenario.domain.entities.scenario import Scenario as ScenarioEntity
+from app.scenario.infrastructure.repositories.scenario_repository import (
+    ScenarioRepository,
+)
+
+
+@pytest_asyncio.fixture
+async def replicated_manager(session_manager, async_db_session):
+    """A session manager whose single replica is the test database itself."""
+    manager = DatabaseSessionManager(
+        session_manager.database_url, replica_urls=[session_manager.database_url]
+    )
+    manager.init_db()
+    yield manager
+    await manager.close()
+
+
+def record_statements(manager: DatabaseSessionManager) -> List[str]:
+    """Record on which engine every statement runs."""
+    statements: List[str] = []
+    engines = {"primary": manager.engine}
+    engines.update({f"replica-{r.name}": r.engine for r in manager.replicas.replicas})
+    for name, engine in engines.items():
+
+        def before(conn, cursor, statement, *args, name=name):
+            statements.append(f"{name}: {statement.split()[0]}")
+
+        event.listen(engine.sync_engine, "before_cursor_execute", before)
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_read_only_methods_run_on_a_replica(replicated_manager):
+    statements = record_statements(replicated_manager)
+
+    async with replicated_manager.session() as session:
+        repository = ScenarioRepository(session)
+        await repository.get_all()
+        await repository.get_by_name("Missing")
+        await session.execute(text("SELECT 1"))
+
+    assert statements == [
+        "replica-0: SELECT",
+        "replica-0: SELECT",
+        "primary: SELECT",
+    ]
+
+
+@pytest_asyncio.fixture
+async def two_replicas_manager(session_manager, async_db_session):
+    """A session manager with two replicas, both the test database itself."""
+    url = session_manager.database_url
+    manager = DatabaseSessionManager(url, replica_urls=[url, url])
+    manager.init_db()
+    yield manager
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_of_a_session_stay_on_one_replica(two_replicas_manager):
+    statements = record_statements(two_replicas_manager)
+
+    async with two_replicas_manager.session() as session:
+        repository = ScenarioRepository(session)
+        await repository.get_all()
+        await repository.get_by_name("Missing")
+        first = session.sync_session.replica
+
+    async with two_replicas_manager.session() as session:
+        await ScenarioRepository(session).get_all()
+        second = session.sync_session.replica
+
+    assert statements[0] == statements[1]
+    assert statements[2] != statements[0]
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_reads_stay_on_the_primary_after_a_write(replicated_manager):
+    statements = record_statements(replicated_manager)
+
+    async with replicated_manager.session() as session:
+        repository = ScenarioRepository(session)
+        scenario = await repository.save(
+            ScenarioEntity(name="Castle", description="A dark castle")
+        )
+        statements.clear()
+
+        assert await repository.get_by_id(scenario.id) == scenario
+
+    assert statements == ["primary: SELECT"]
+
+    # A new session reads from the replica again.
+    async with replicated_manager.session() as session:
+        await ScenarioRepository(session).get_by_id(scenario.id)
+
+    assert statements[-1] == "replica-0: SELECT"
+
+
+@pytest.mark.asyncio
+async def test_etag_version_and_body_are_read_from_one_replica(
+    two_replicas_manager,
+):
+    statements = record_statements(two_replicas_manager)
+
+    async with two_replicas_manager.session() as session:
+        await get_catalog_version_repository(session).get("scenarios")
+        await ScenarioRepository(session).get_all()
+
+    assert len(statements) == 2
+    assert statements[0] == statements[1]
+    assert statements[0].startswith("replica-")
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_the_primary_without_healthy_replica(
+    replicated_manager, monkeypatch
+):
+    statements = record_statements(replicated_manager)
+    replicas = replicated_manager.replicas
+
+    async def lagging(replica):
+        return 60.0
+
+    monkeypatch.setattr(replicas, "lag", lagging)
+    await replicas.check()
+    assert not replicas.replicas[0].healthy
+
+    async with replicated_manager.session() as session:
+        await ScenarioRepository(session).get_all()
+
+    assert statements == ["primary: SELECT"]
+
+
+@pytest.mark.asyncio
+async def test_check_measures_the_replica_lag(replicated_manager, monkeypatch):
+    replicas = replicated_manager.replicas
+    (replica,) = replicas.replicas
+
+    # The test database is no replica: it has no lag.
+    await replicas.check()
+    assert replica.healthy and replica.lag == 0
+
+    async def unreachable(replica):
+        raise ConnectionRefusedError("connection refused")
+
+    monkeypatch.setattr(replicas, "lag", unreachable)
+    await replicas.check()
+    assert not replica.healthy and replica.lag is None
+
+    monkeypatch.undo()
+    await replicas.check()
+    assert replica.healthy
+
+
+def test_pick_rotates_over_the_healthy_replicas():
+    first, second, third = object(), object(), object()
+    replicas = ReplicaSet([first, second, third])
+    replicas.replicas[1].healthy = False
+
+    assert [replicas.pick() for _ in range(4)] == [first, third, first, third]
+
+    for replica in replicas.replicas:
+        replica.healthy = False
+    assert replicas.pick() is None
@@ -0,0 +1,50 @@
+import json
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.core.responses import (
+    EntityJSONResponse,
+    default_response_class,
+    json_dumps,
+    response_fields,
+)
+from app.story.presentation.models.story import GenerateStoryResponse
+from tests.utils.fakers import CharacterFactory, StoryFactory
+
+
+def test_default_response_class_uses_orjson_when_enabled():
+    assert default_response_class(True) is ORJSONResponse
+    assert default_response_class(False) is JSONResponse
+
+
+def test_response_fields_follow_nested_models():
+    include = response_fields(GenerateStoryResponse)
+
+    assert set(include) == set(GenerateStoryResponse.model_fields)
+    assert include["title"] is True
+    assert set(include["characters"]["__all__"]) == {
+        "id",
+        "name",
+        "favorite_color",
+        "animal_friend",
+        "superpower",
+        "hobby",
+        "personality",
+    }
+    assert set(include["scenario"]) == {"id", "name", "description"}
+
+
+def test_entity_response_matches_the_validated_response_model():
+    story = StoryFactory(characters=[CharacterFactory() for _ in range(3)])
+
+    response = EntityJSONResponse(story, GenerateStoryResponse, status_code=201)
+
+    expected = GenerateStoryResponse.model_validate(story.model_dump())
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == expected.model_dump(mode="json")
+    assert "usage" not in json.loads(response.body)
+
+
+def test_json_dumps_is_compact():
+    assert json_dumps({"index": 1, "story": None}) == b'{"index":1,"story":null}'
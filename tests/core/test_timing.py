@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.timing import (
+    RequestTimer,
+    current_timer,
+    phase,
+    record_phase,
+    time_request,
+)
+
+
+def test_phases_outside_a_request_are_ignored():
+    with phase("llm"):
+        pass
+    record_phase("queue", 1.0)
+
+    assert current_timer() is None
+
+
+def test_repeated_phases_are_summed():
+    with time_request() as timer:
+        record_phase("characters", 0.010)
+        record_phase("characters", 0.015)
+        with phase("llm"):
+            time.sleep(0.01)
+
+    assert timer.phases["characters"] == pytest.approx(0.025)
+    assert timer.phases["llm"] >= 0.01
+    assert current_timer() is None
+
+
+def test_server_timing_lists_phases_then_total():
+    timer = RequestTimer()
+    timer.record("auth", 0.0031)
+    timer.record("llm", 0.8124)
+
+    header = timer.server_timing()
+
+    assert header.startswith("auth;dur=3.1, llm;dur=812.4, total;dur=")
+    assert timer.as_dict() == {"auth": 3.1, "llm": 812.4}
+
+
+@pytest.mark.asyncio
+async def test_phases_recorded_in_a_worker_thread_reach_the_request():
+    def generate():
+        with phase("prompt"):
+            pass
+
+    with time_request() as timer:
+        await asyncio.to_thread(generate)
+
+    assert "prompt" in timer.phases
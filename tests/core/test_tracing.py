@@ -0,0 +1,127 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from app.core.tracing import (
+    SpanExporter,
+    Tracer,
+    configure_tracing,
+    current_span,
+    parse_traceparent,
+    set_span_attributes,
+    tracer,
+)
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+@pytest.fixture
+def stream():
+    return io.StringIO()
+
+
+@pytest.fixture
+def recording_tracer(stream):
+    return Tracer(SpanExporter(stream))
+
+
+def exported(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_disabled_tracer_yields_no_span(stream):
+    disabled = Tracer()
+
+    with disabled.span("noop") as span:
+        set_span_attributes({"ignored": True})
+
+    assert span is None
+    assert current_span() is None
+
+
+def test_children_share_the_trace_and_point_to_their_parent(recording_tracer, stream):
+    with recording_tracer.span("parent", {"story.backend": "llama"}):
+        with recording_tracer.span("child"):
+            set_span_attributes({"llm.usage.prompt_tokens": 12})
+
+    child, parent = exported(stream)
+    assert child["context"]["trace_id"] == parent["context"]["trace_id"]
+    assert child["parent_id"] == parent["context"]["span_id"]
+    assert parent["parent_id"] is None
+    assert child["attributes"] == {"llm.usage.prompt_tokens": 12}
+    assert parent["attributes"] == {"story.backend": "llama"}
+    assert parent["end_time"] >= child["end_time"] >= child["start_time"]
+
+
+def test_errors_are_recorded_on_the_span(recording_tracer, stream):
+    with pytest.raises(RuntimeError):
+        with recording_tracer.span("failing"):
+            raise RuntimeError("boom")
+
+    (span,) = exported(stream)
+    assert span["status"] == {"status_code": "ERROR"}
+    assert span["attributes"]["exception.type"] == "RuntimeError"
+    assert current_span() is None
+
+
+def test_incoming_traceparent_is_continued(recording_tracer, stream):
+    with recording_tracer.span("GET", traceparent=TRACEPARENT) as span:
+        pass
+
+    assert span.traceparent.startswith("00-0af7651916cd43dd8448eb211c80319c-")
+    (exported_span,) = exported(stream)
+    assert exported_span["parent_id"] == "0xb7ad6b7169203331"
+
+
+@pytest.mark.parametrize(
+    "header", [None, "", "garbage", "00-" + "0" * 32 + "-b7ad6b7169203331-01"]
+)
+def test_invalid_traceparent_is_ignored(header):
+    assert parse_traceparent(header) is None
+
+
+def test_unsampled_traces_are_not_exported(stream):
+    never = Tracer(SpanExporter(stream), sample_ratio=0.0)
+
+    with never.span("parent") as parent:
+        with never.span("child") as child:
+            pass
+
+    assert not parent.sampled and not child.sampled
+    assert stream.getvalue() == ""
+
+
+@pytest.mark.asyncio
+async def test_spans_opened_in_a_worker_thread_are_children(recording_tracer, stream):
+    def generate():
+        with recording_tracer.span("llm.call"):
+            pass
+
+    with recording_tracer.span("story.generate") as parent:
+        await asyncio.to_thread(generate)
+
+    child, _ = exported(stream)
+    assert child["parent_id"] == f"0x{parent.span_id:016x}"
+
+
+def test_file_exporter_appends_json_lines(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    configure_tracing("file", str(path), 1.0)
+    try:
+        with tracer.span("one"):
+            pass
+        with tracer.span("two"):
+            pass
+    finally:
+        configure_tracing("none", "", 1.0)
+
+    names = [json.loads(line)["name"] for line in path.read_text().splitlines()]
+    assert names == ["one", "two"]
+    assert not tracer.enabled
+
+
+def test_unknown_exporter_is_rejected():
+    with pytest.raises(ValueError):
+        configure_tracing("jaeger", "", 1.0)
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from app.core.usage import (
+    TokenUsage,
+    collect_usage,
+    current_usage,
+    record_call,
+    record_tokens,
+)
+
+
+def test_records_outside_a_collection_are_ignored():
+    record_tokens(prompt=10, cached=0, completion=5)
+    record_call(0.5)
+
+    assert current_usage() is None
+
+
+def test_collect_usage_sums_tokens_and_calls():
+    with collect_usage() as usage:
+        record_tokens(prompt=100, cached=80, completion=20)
+        record_tokens(prompt=50, cached=0, completion=10)
+        record_call(1.5)
+
+    assert usage == TokenUsage(
+        prompt_tokens=150,
+        cached_tokens=80,
+        completion_tokens=30,
+        generation_seconds=1.5,
+        llm_calls=1,
+    )
+    assert usage.total_tokens == 180
+    assert current_usage() is None
+
+
+def test_nested_collections_add_up_to_the_outer_one():
+    with collect_usage() as request_usage:
+        with collect_usage() as first:
+            record_tokens(prompt=10, cached=0, completion=1)
+        with collect_usage() as second:
+            record_tokens(prompt=20, cached=0, completion=2)
+
+    assert first.prompt_tokens == 10
+    assert second.prompt_tokens == 20
+    assert request_usage.prompt_tokens == 30
+    assert request_usage.completion_tokens == 3
+
+
+@pytest.mark.asyncio
+async def test_usage_recorded_in_a_worker_thread_is_collected():
+    def generate():
+        record_tokens(prompt=42, cached=0, completion=7)
+
+    with collect_usage() as usage:
+        await asyncio.to_thread(generate)
+
+    assert usage.prompt_tokens == 42
+    assert usage.completion_tokens == 7
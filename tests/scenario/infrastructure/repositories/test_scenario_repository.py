@@ -5,6 +5,9 @@ import pytest
 import sqlalchemy
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.infrastructure.repositories.catalog_version_repository import (
+    CatalogVersionRepository,
+)
 from app.scenario.domain.entities.scenario import Scenario as ScenarioEntity
 from app.scenario.infrastructure.persistence.models.scenario import (
     Scenario as ScenarioModel,
@@ -132,6 +135,39 @@ async def test_get_by_id_with_invalid_uuid(scenario_repository: ScenarioReposito
         await scenario_repository.get_by_id(invalid_scenario_id)  # type: ignore
 
 
+@pytest.mark.asyncio
+async def test_get_by_ids_with_success(
+    scenario_repository: ScenarioRepository,
+    async_db_session: AsyncSession,
+    scenario_id: UUID,
+):
+    # Arrange
+    factories: List[ScenarioEntity] = [ScenarioFactory.create() for _ in range(3)]
+    models = [
+        ScenarioModel(name=f"{factory.name} {i}", description=factory.description)
+        for i, factory in enumerate(factories)
+    ]
+    async_db_session.add_all(models)
+    await async_db_session.commit()
+
+    # Act
+    result = await scenario_repository.get_by_ids(
+        [models[0].id, models[2].id, models[0].id, scenario_id]
+    )
+
+    # Assert
+    assert {scenario.id for scenario in result} == {models[0].id, models[2].id}
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_with_empty_list(scenario_repository: ScenarioRepository):
+    # Act
+    result = await scenario_repository.get_by_ids([])
+
+    # Assert
+    assert result == []
+
+
 @pytest.mark.asyncio
 async def test_get_by_name_with_success(
     scenario_repository: ScenarioRepository, async_db_session: AsyncSession
@@ -152,6 +188,37 @@ async def test_get_by_name_with_success(
     assert result.description == factory.description
 
 
+@pytest.mark.asyncio
+async def test_get_by_name_ignores_the_case(
+    scenario_repository: ScenarioRepository, async_db_session: AsyncSession
+):
+    # Arrange
+    factory: ScenarioEntity = ScenarioFactory.create(name="Mystic River")
+    async_db_session.add(
+        ScenarioModel(name=factory.name, description=factory.description)
+    )
+    await async_db_session.commit()
+
+    # Act
+    result = await scenario_repository.get_by_name("mystic RIVER")
+
+    # Assert
+    assert result is not None
+    assert result.name == "Mystic River"
+
+
+@pytest.mark.asyncio
+async def test_names_differing_by_case_only_are_rejected(
+    async_db_session: AsyncSession,
+):
+    async_db_session.add(ScenarioModel(name="Forest", description="Tall trees"))
+    await async_db_session.commit()
+
+    async_db_session.add(ScenarioModel(name="forest", description="Short trees"))
+    with pytest.raises(sqlalchemy.exc.IntegrityError):
+        await async_db_session.commit()
+
+
 @pytest.mark.asyncio
 async def test_get_by_name_with_nonexistent_name(
     scenario_repository: ScenarioRepository,
@@ -183,3 +250,15 @@ async def test_save_scenario(scenario_repository: ScenarioRepository):
     assert result is not None
     assert result.name == factory.name
     assert result.description == factory.description
+
+
+@pytest.mark.asyncio
+async def test_save_scenario_bumps_the_catalog_version(
+    scenario_repository: ScenarioRepository, async_db_session: AsyncSession
+):
+    versions = CatalogVersionRepository(async_db_session)
+
+    await scenario_repository.save(ScenarioFactory.create(name="First"))
+    await scenario_repository.save(ScenarioFactory.create(name="Second"))
+
+    assert await versions.get_all() == {"scenarios": 2}
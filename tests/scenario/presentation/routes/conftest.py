@@ -1,11 +1,17 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_scenario_repository
+from app.core.dependencies import catalog_versions, get_scenario_repository
 from app.scenario.domain.entities.scenario import Scenario as ScenarioEntity
 from tests.utils.fakers import ScenarioFactory
 
 
+@pytest.fixture(autouse=True)
+def fresh_catalog_versions():
+    """The database is recreated for each test, forget the cached versions."""
+    catalog_versions.invalidate()
+
+
 @pytest.fixture(scope="function")
 async def created_scenario(async_db_session: AsyncSession) -> ScenarioEntity:
     factory: ScenarioEntity = ScenarioFactory.create()
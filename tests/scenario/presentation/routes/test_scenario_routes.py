@@ -59,3 +59,86 @@ async def test_create_scenario_invalid_data(async_client: AsyncClient):
     assert response.status_code == 422
     data = response.json()
     assert "detail" in data
+
+
+@pytest.mark.asyncio
+async def test_get_scenarios_sets_cache_headers(
+    async_client: AsyncClient, created_scenario: Scenario
+):
+    response = await async_client.get("/scenarios/")
+
+    assert response.headers["etag"] == '"scenarios-v1"'
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
+@pytest.mark.asyncio
+async def test_get_scenarios_not_modified(
+    async_client: AsyncClient, created_scenario: Scenario
+):
+    etag = (await async_client.get("/scenarios/")).headers["etag"]
+
+    response = await async_client.get("/scenarios/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_get_scenario_by_id_not_modified(
+    async_client: AsyncClient, created_scenario: Scenario
+):
+    url = f"/scenarios/{created_scenario.id}"
+    etag = (await async_client.get(url)).headers["etag"]
+
+    response = await async_client.get(url, headers={"If-None-Match": f"W/{etag}"})
+
+    assert response.status_code == 304
+    assert str(created_scenario.id) in etag
+
+
+@pytest.mark.asyncio
+async def test_creating_a_scenario_changes_the_etag(
+    async_client: AsyncClient, created_scenario: Scenario
+):
+    etag = (await async_client.get("/scenarios/")).headers["etag"]
+
+    await async_client.post(
+        "/scenarios/", json={"name": "New Scenario", "description": "New Description"}
+    )
+    response = await async_client.get("/scenarios/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"scenarios-v2"'
+    assert len(response.json()) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_scenarios_returns_the_requested_fields(
+    async_client: AsyncClient, created_scenario: Scenario
+):
+    response = await async_client.get("/scenarios/?fields=name")
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": str(created_scenario.id), "name": created_scenario.name}
+    ]
+    # Another representation of the same version: its own validator.
+    etag = response.headers["etag"]
+    assert etag.startswith('"scenarios-v1-') and etag != '"scenarios-v1"'
+
+    full = await async_client.get("/scenarios/", headers={"If-None-Match": etag})
+    assert full.status_code == 200
+    assert full.headers["etag"] == '"scenarios-v1"'
+
+
+@pytest.mark.asyncio
+async def test_get_scenario_rejects_unknown_fields(
+    async_client: AsyncClient, created_scenario: Scenario
+):
+    response = await async_client.get(
+        f"/scenarios/{created_scenario.id}?fields=name,available"
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Unknown fields: available."
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from app.core.admission import AdmissionController
+from app.core.exceptions.admission_exceptions import AdmissionRejectedError
+from app.story.application.use_cases.generate_stories_batch import (
+    GenerateStoriesBatchUseCase,
+    StorySpec,
+)
+from app.story.domain.exceptions.story_exceptions import (
+    CharactersEmptyError,
+    InvalidScenarioError,
+    TooManyStoriesError,
+)
+from tests.utils.fakers import CharacterFactory, ScenarioFactory, StoryFactory
+
+
+@pytest.fixture
+def admission_controller():
+    return AdmissionController(default_limit=8, max_queue_size=8, max_queue_time=5)
+
+
+@pytest.fixture
+def batch_use_case(
+    mock_story_generator,
+    mock_character_repository,
+    mock_scenario_repository,
+    admission_controller,
+):
+    return GenerateStoriesBatchUseCase(
+        story_generator=mock_story_generator,
+        character_repository=mock_character_repository,
+        scenario_repository=mock_scenario_repository,
+        admission_controller=admission_controller,
+        backend="local",
+        max_concurrency=2,
+        max_stories=5,
+        release_connections=AsyncMock(),
+    )
+
+
+@pytest.fixture
+def characters(mock_character_repository):
+    characters = [CharacterFactory() for _ in range(3)]
+    mock_character_repository.get_by_ids.return_value = characters
+    return characters
+
+
+@pytest.fixture
+def scenario(mock_scenario_repository):
+    scenario = ScenarioFactory()
+    mock_scenario_repository.get_by_ids.return_value = [scenario]
+    return scenario
+
+
+async def collect(batch_use_case, specs):
+    prepared = await batch_use_case.prepare(specs)
+    return [result async for result in batch_use_case.stream(prepared)]
+
+
+@pytest.mark.asyncio
+async def test_prepare_fetches_everything_in_one_query_each(
+    batch_use_case,
+    mock_character_repository,
+    mock_scenario_repository,
+    characters,
+    scenario,
+):
+    specs = [
+        StorySpec([characters[0].id, characters[1].id], scenario.id, "comedy"),
+        StorySpec([characters[2].id], scenario.id, "mystery"),
+    ]
+
+    prepared = await batch_use_case.prepare(specs)
+
+    mock_character_repository.get_by_ids.assert_called_once_with(
+        [characters[0].id, characters[1].id, characters[2].id]
+    )
+    mock_scenario_repository.get_by_ids.assert_called_once_with(
+        [scenario.id, scenario.id]
+    )
+    mock_character_repository.get_by_id.assert_not_called()
+    assert [item.error for item in prepared] == [None, None]
+    assert prepared[0].characters == characters[:2]
+    assert prepared[1].scenario == scenario
+    batch_use_case.release_connections.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_prepare_reports_invalid_items(batch_use_case, characters, scenario):
+    specs = [
+        StorySpec([uuid4()], scenario.id, "comedy"),
+        StorySpec([characters[0].id], uuid4(), "comedy"),
+        StorySpec([characters[0].id], scenario.id, "comedy"),
+    ]
+
+    prepared = await batch_use_case.prepare(specs)
+
+    assert isinstance(prepared[0].error, CharactersEmptyError)
+    assert isinstance(prepared[1].error, InvalidScenarioError)
+    assert prepared[2].error is None
+
+
+@pytest.mark.asyncio
+async def test_prepare_rejects_oversized_batch(batch_use_case):
+    specs = [StorySpec([uuid4()], uuid4(), "comedy") for _ in range(6)]
+
+    with pytest.raises(TooManyStoriesError):
+        await batch_use_case.prepare(specs)
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_stories_and_errors_by_index(
+    batch_use_case, mock_story_generator, characters, scenario
+):
+    story = StoryFactory(characters=characters[:1], scenario=scenario)
+    mock_story_generator.generate = Mock(side_effect=[story, RuntimeError("boom")])
+    specs = [
+        StorySpec([characters[0].id], scenario.id, "comedy"),
+        StorySpec([uuid4()], scenario.id, "comedy"),
+        StorySpec([characters[1].id], scenario.id, "comedy"),
+    ]
+
+    results = dict(await collect(batch_use_case, specs))
+
+    assert isinstance(results[1], CharactersEmptyError)
+    assert {type(results[0]), type(results[2])} == {type(story), RuntimeError}
+    assert mock_story_generator.generate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_respects_max_concurrency(
+    batch_use_case, mock_story_generator, characters, scenario
+):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def generate(*args):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return StoryFactory(characters=characters[:1], scenario=scenario)
+
+    mock_story_generator.generate = Mock(side_effect=generate)
+    specs = [StorySpec([characters[0].id], scenario.id, "comedy")] * 5
+
+    results = await collect(batch_use_case, specs)
+
+    assert sorted(index for index, _ in results) == [0, 1, 2, 3, 4]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_admission_rejections(
+    batch_use_case, admission_controller, mock_story_generator, characters, scenario
+):
+    admission_controller.max_queue_size = 0
+    limiter = admission_controller.limiter("local")
+    for _ in range(limiter.limit):
+        await limiter.acquire()
+    mock_story_generator.generate = Mock()
+
+    results = await collect(
+        batch_use_case, [StorySpec([characters[0].id], scenario.id, "comedy")]
+    )
+
+    assert isinstance(results[0][1], AdmissionRejectedError)
+    mock_story_generator.generate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_cancels_pending_generations_when_closed(
+    batch_use_case, mock_story_generator, characters, scenario
+):
+    batch_use_case.max_concurrency = 1
+    mock_story_generator.generate = Mock(
+        side_effect=lambda *args: time.sleep(0.05)
+        or StoryFactory(characters=characters[:1], scenario=scenario)
+    )
+    specs = [StorySpec([characters[0].id], scenario.id, "comedy")] * 4
+    prepared = await batch_use_case.prepare(specs)
+
+    stream = batch_use_case.stream(prepared)
+    await anext(stream)
+    await stream.aclose()
+    await asyncio.sleep(0.1)
+
+    assert mock_story_generator.generate.call_count <= 2
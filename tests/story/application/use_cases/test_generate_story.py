@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.admission import AdmissionController, AdmissionMode
 from app.core.dependencies import get_generate_story_use_case
 from app.story.domain.exceptions.story_exceptions import (
     CharactersEmptyError,
@@ -13,14 +15,25 @@ from app.story.domain.exceptions.story_exceptions import (
 from tests.utils.fakers import CharacterFactory, ScenarioFactory, StoryFactory
 
 
+@pytest.fixture
+def mock_db_session():
+    return AsyncMock(spec=AsyncSession)
+
+
 @pytest.fixture
 def generate_story_use_case(
-    mock_story_generator, mock_character_repository, mock_scenario_repository
+    mock_story_generator,
+    mock_character_repository,
+    mock_scenario_repository,
+    mock_db_session,
 ):
     return get_generate_story_use_case(
         story_generator=mock_story_generator,
         character_repository=mock_character_repository,
         scenario_repository=mock_scenario_repository,
+        admission_controller=None,
+        backend="local",
+        db=mock_db_session,
     )
 
 
@@ -48,7 +61,8 @@ async def test_generate_story_success(
         character_ids, scenario_id, narrative_style
     )
 
-    assert await result == generated_story
+    assert result == generated_story
+    assert result.usage is not None
     mock_character_repository.get_by_id.assert_any_call(character_ids[0])
     mock_character_repository.get_by_id.assert_any_call(character_ids[1])
     mock_scenario_repository.get_by_id.assert_called_once_with(scenario_id)
@@ -140,3 +154,74 @@ async def test_generate_story_invalid_narrative_style(
         await generate_story_use_case.execute(
             character_ids, scenario_id, narrative_style
         )
+
+
+@pytest.mark.asyncio
+async def test_generate_story_releases_the_connection_before_generating(
+    generate_story_use_case,
+    mock_character_repository,
+    mock_scenario_repository,
+    mock_story_generator,
+    mock_db_session,
+):
+    story = StoryFactory()
+    mock_character_repository.get_by_id.return_value = CharacterFactory()
+    mock_scenario_repository.get_by_id.return_value = ScenarioFactory()
+
+    def generate(*args):
+        # The transaction is over, the connection is back in the pool.
+        mock_db_session.commit.assert_awaited_once()
+        return story
+
+    mock_story_generator.generate.side_effect = generate
+
+    assert await generate_story_use_case.execute([uuid4()], uuid4(), "epic") == story
+
+
+@pytest.mark.asyncio
+async def test_generate_story_releases_the_connection_on_validation_errors(
+    generate_story_use_case, mock_scenario_repository, mock_db_session
+):
+    mock_scenario_repository.get_by_id.return_value = None
+
+    with pytest.raises(CharactersEmptyError):
+        await generate_story_use_case.execute([], uuid4(), "epic")
+
+    mock_db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_only_the_generation_holds_an_admission_slot(
+    mock_story_generator,
+    mock_character_repository,
+    mock_scenario_repository,
+    mock_db_session,
+):
+    controller = AdmissionController(
+        default_limit=2, max_queue_size=0, max_queue_time=1, mode=AdmissionMode.AIMD
+    )
+    use_case = get_generate_story_use_case(
+        story_generator=mock_story_generator,
+        character_repository=mock_character_repository,
+        scenario_repository=mock_scenario_repository,
+        admission_controller=controller,
+        backend="local",
+        db=mock_db_session,
+    )
+    mock_character_repository.get_by_id.return_value = CharacterFactory()
+    mock_scenario_repository.get_by_id.return_value = None
+
+    with pytest.raises(InvalidScenarioError):
+        await use_case.execute([uuid4()], uuid4(), "adventurous")
+
+    assert controller.stats() == {}
+
+    scenario = ScenarioFactory()
+    mock_scenario_repository.get_by_id.return_value = scenario
+    mock_story_generator.configure_generate(StoryFactory(scenario=scenario))
+
+    await use_case.execute([uuid4()], scenario.id, "adventurous")
+
+    stats = controller.stats()["local"]
+    assert stats["admitted_total"] == 1
+    assert stats["in_flight"] == 0
@@ -0,0 +1,110 @@
+import pytest
+
+from app.story.infrastructure.ai.prompts.prompt_builder import (
+    TEMPLATES,
+    PromptBuilder,
+    PromptTemplate,
+)
+
+
+def test_build_prompt_with_single_character(main_character, test_scenario):
+    # Arrange
+    builder = PromptBuilder(locale="en", tone="default")
+
+    # Act
+    prompt = builder.build([main_character], test_scenario, "magical")
+
+    # Assert
+    assert prompt.prefix.startswith("You are an expert children's story writer.")
+    assert "Write the story in English." in prompt.prefix
+    assert prompt.suffix == (
+        "\n"
+        "Write a magical story.\n"
+        "\n"
+        "Main Character: Lucy\n"
+        "Favorite Color: purple\n"
+        "Animal Friend: unicorn\n"
+        "Superpower: magic\n"
+        "Hobby: painting\n"
+        "Personality: creative\n"
+        "\n"
+        "Other Characters: none.\n"
+        "\n"
+        "Setting: Crystal Palace - A shimmering castle made of pure crystal\n"
+    )
+    assert prompt.text == prompt.prefix + prompt.suffix
+
+
+def test_build_prompt_with_supporting_characters(
+    main_character, supporting_character, test_scenario
+):
+    # Arrange
+    builder = PromptBuilder(locale="en", tone="default")
+
+    # Act
+    prompt = builder.build(
+        [main_character, supporting_character, supporting_character],
+        test_scenario,
+        "magical",
+    )
+
+    # Assert
+    assert (
+        "Other Characters: Tom (a energetic friend with fire-breathing), "
+        "Tom (a energetic friend with fire-breathing).\n"
+    ) in prompt.suffix
+
+
+def test_prefix_is_stable_across_requests(
+    main_character, supporting_character, test_scenario
+):
+    # Arrange
+    builder = PromptBuilder(locale="en", tone="default")
+
+    # Act
+    first = builder.build([main_character], test_scenario, "magical")
+    second = builder.build([supporting_character], test_scenario, "comedy")
+
+    # Assert
+    assert first.prefix is second.prefix
+    assert first.suffix != second.suffix
+    assert "Lucy" not in first.prefix
+
+
+def test_locale_and_tone_select_the_template(main_character, test_scenario):
+    # Act
+    prompt = PromptBuilder(locale="pt-BR", tone="religious").build(
+        [main_character], test_scenario, "magical"
+    )
+
+    # Assert
+    assert "Write the story in Brazilian Portuguese." in prompt.prefix
+    assert "telling about God" in prompt.prefix
+    assert "Main Character: Lucy" in prompt.suffix
+
+
+def test_locale_and_tone_default_to_environment(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("PROMPT_LOCALE", "pt-BR")
+    monkeypatch.setenv("PROMPT_TONE", "religious")
+
+    # Act
+    builder = PromptBuilder()
+
+    # Assert
+    assert builder.template is TEMPLATES[("pt-BR", "religious")]
+
+
+def test_unknown_locale_raises_error():
+    with pytest.raises(ValueError, match="No prompt template"):
+        PromptBuilder(locale="fr", tone="default")
+
+
+def test_template_with_unknown_placeholder_fails_on_creation():
+    with pytest.raises(ValueError, match="Unknown prompt placeholders"):
+        PromptTemplate(
+            prefix="",
+            story="Write a {style} story.",
+            supporting_character="{name}",
+            no_supporting_characters="none",
+        )
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from app.story.infrastructure.ai.chatgpt_story_generator import ChatGPTStoryGenerator
+from app.story.infrastructure.ai.prompts.prompt_builder import PromptBuilder
 
 
 @pytest.fixture
@@ -39,89 +40,37 @@ def test_generate_story_returns_story_object(
     assert story.narrative_style == narrative_style
 
 
-def test_create_prompt_with_single_character(
-    chatgpt_story_generator, main_character, test_scenario
+def test_openai_client_called_with_built_prompt(
+    chatgpt_story_generator, mock_openai_client, main_character, test_scenario
 ):
     # Arrange
     characters = [main_character]
     narrative_style = "magical"
-
-    # Act
-    prompt = chatgpt_story_generator._create_prompt(
+    expected_prompt = chatgpt_story_generator.prompt_builder.build(
         characters, test_scenario, narrative_style
     )
 
-    # Assert
-    expected_prompt = f"""
-        You are an expert children's story writer. Write a {narrative_style}
-        story for kids aged 3-8.
-
-        Main Character: {main_character.name},
-        Favorite Color: {main_character.favorite_color},
-        Animal Friend: {main_character.animal_friend},
-        Superpower: {main_character.superpower},
-        Hobby: {main_character.hobby},
-        Personality: {main_character.personality}.
-
-        Other Characters: none.
-
-        Setting: {test_scenario.name} - {test_scenario.description}
-
-        Make it engaging, fun, and suitable for young children.
-        Use simple words and short sentences.
-        """
-    assert prompt.strip() == expected_prompt.strip()
-
-
-def test_create_prompt_with_multiple_characters(
-    chatgpt_story_generator, main_character, supporting_character, test_scenario
-):
-    # Arrange
-    characters = [main_character, supporting_character]
-    narrative_style = "magical"
-
     # Act
-    prompt = chatgpt_story_generator._create_prompt(
-        characters, test_scenario, narrative_style
-    )
+    chatgpt_story_generator.generate(characters, test_scenario, narrative_style)
 
     # Assert
-    expected_prompt = f"""
-        You are an expert children's story writer. Write a {narrative_style}
-        story for kids aged 3-8.
-
-        Main Character: {main_character.name},
-        Favorite Color: {main_character.favorite_color},
-        Animal Friend: {main_character.animal_friend},
-        Superpower: {main_character.superpower},
-        Hobby: {main_character.hobby},
-        Personality: {main_character.personality}.
-
-        Other Characters: {supporting_character.name}.
-
-        Setting: {test_scenario.name} - {test_scenario.description}
+    mock_openai_client.generate_text.assert_called_once_with(expected_prompt.text)
 
-        Make it engaging, fun, and suitable for young children.
-        Use simple words and short sentences.
-        """
-    assert prompt.strip() == expected_prompt.strip()
 
-
-def test_openai_client_called_with_correct_parameters(
-    chatgpt_story_generator, mock_openai_client, main_character, test_scenario
+def test_generator_uses_given_prompt_builder(
+    mock_openai_client, main_character, test_scenario
 ):
     # Arrange
-    characters = [main_character]
-    narrative_style = "magical"
-    expected_prompt = chatgpt_story_generator._create_prompt(
-        characters, test_scenario, narrative_style
-    )
+    prompt_builder = PromptBuilder(locale="pt-BR", tone="religious")
+    generator = ChatGPTStoryGenerator(prompt_builder=prompt_builder)
 
     # Act
-    chatgpt_story_generator.generate(characters, test_scenario, narrative_style)
+    generator.generate([main_character], test_scenario, "magical")
 
     # Assert
-    mock_openai_client.generate_text.assert_called_once_with(expected_prompt)
+    prompt = mock_openai_client.generate_text.call_args.args[0]
+    assert "Brazilian Portuguese" in prompt
+    assert "God" in prompt
 
 
 def test_generate_story_with_empty_character_list_raises_error(
@@ -1,5 +1,8 @@
 import pytest
 
+from app.core.dependencies import _build_story_generator
+from app.core.settings.config import settings
+from app.core.timing import time_request
 from app.story.infrastructure.ai.llama_story_generator import LlamaStoryGenerator
 
 
@@ -26,64 +29,14 @@ def test_generate_story_returns_story_object(
     assert story.narrative_style == narrative_style
 
 
-def test_create_prompt_with_single_character(
-    llama_story_generator, main_character, test_scenario
-):
-    # Arrange
-    narrative_style = "whimsical"
-
-    # Act
-    prompt = llama_story_generator._create_prompt(
-        main_character, [], test_scenario, narrative_style
-    )
-
-    # Assert
-    expected_prompt = (
-        f"Write a {narrative_style} story for kids aged 3-8 featuring {main_character.name}."
-        f"{main_character.name} loves {main_character.favorite_color}, has an animal friend {main_character.animal_friend}, "
-        f"and has the superpower of {main_character.superpower}. Their favorite hobby is {main_character.hobby}. "
-        f"They are {main_character.personality}. "
-        f"The story takes place in {test_scenario.name}, described as {test_scenario.description}. "
-        f"Make it in portuguese language, fun, religious, educative (telling about God), engaging, "
-        f"child-friendly, with a happy ending and a teaching moral!"
-    )
-    assert prompt == expected_prompt
-
-
-def test_create_prompt_with_multiple_characters(
-    llama_story_generator, main_character, supporting_character, test_scenario
-):
-    # Arrange
-    narrative_style = "whimsical"
-    supporting_characters = [supporting_character]
-
-    # Act
-    prompt = llama_story_generator._create_prompt(
-        main_character, supporting_characters, test_scenario, narrative_style
-    )
-
-    # Assert
-    expected_prompt = (
-        f"Write a {narrative_style} story for kids aged 3-8 featuring {main_character.name}."
-        f"{main_character.name} loves {main_character.favorite_color}, has an animal friend {main_character.animal_friend}, "
-        f"and has the superpower of {main_character.superpower}. Their favorite hobby is {main_character.hobby}. "
-        f"They are {main_character.personality}. They are joined by "
-        f"{supporting_character.name} (a {supporting_character.personality} friend with {supporting_character.superpower}). "
-        f"The story takes place in {test_scenario.name}, described as {test_scenario.description}. "
-        f"Make it in portuguese language, fun, religious, educative (telling about God), engaging, "
-        f"child-friendly, with a happy ending and a teaching moral!"
-    )
-    assert prompt == expected_prompt
-
-
 def test_llama_client_called_with_correct_parameters(
     llama_story_generator, mock_llama_client, main_character, test_scenario
 ):
     # Arrange
     characters = [main_character]
     narrative_style = "whimsical"
-    expected_prompt = llama_story_generator._create_prompt(
-        main_character, [], test_scenario, narrative_style
+    expected_prompt = llama_story_generator.prompt_builder.build(
+        characters, test_scenario, narrative_style
     )
 
     # Act
@@ -91,10 +44,27 @@ def test_llama_client_called_with_correct_parameters(
 
     # Assert
     mock_llama_client.generate_text.assert_called_once_with(
-        expected_prompt, max_tokens=1000, temperature=0.5
+        expected_prompt.text,
+        max_tokens=1000,
+        temperature=0.5,
+        prefix=expected_prompt.prefix,
     )
 
 
+def test_generate_story_times_prompt_and_llm_phases(
+    llama_story_generator, main_character, test_scenario
+):
+    with time_request() as timer:
+        llama_story_generator.generate([main_character], test_scenario, "whimsical")
+
+    assert set(timer.phases) == {"prompt", "llm"}
+
+
+def test_default_prompt_locale_and_tone(llama_story_generator):
+    assert llama_story_generator.prompt_builder.locale == "en"
+    assert llama_story_generator.prompt_builder.tone == "default"
+
+
 def test_generate_story_with_empty_character_list_raises_error(
     llama_story_generator, test_scenario
 ):
@@ -122,3 +92,17 @@ def test_generate_story_preserves_input_parameters(
     assert len(story.characters) == 2
     assert story.scenario == test_scenario
     assert story.narrative_style == narrative_style
+
+
+def test_llama_client_is_configured_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "LLAMA_BATCH_MAX_SIZE", 6)
+    monkeypatch.setattr(settings, "LLAMA_BATCH_LINGER_MS", 25.0)
+    monkeypatch.setattr(settings, "LLAMA_CACHE_PROMPT", False)
+    monkeypatch.setattr(settings, "LLAMA_SLOT_COUNT", 3)
+
+    client = _build_story_generator.__wrapped__("llama").llama_client
+
+    assert client.batcher.max_batch_size == 6
+    assert client.batcher.linger == 0.025
+    assert client.cache_prompt is False
+    assert client.slots.slot_count == 3
@@ -1,3 +1,4 @@
+import json
 from uuid import uuid4
 
 import pytest
@@ -8,9 +9,18 @@ from starlette import status
 from app.character.infrastructure.persistence.models.character import (
     Character as CharacterModel,
 )
+from app.core.admission import AdmissionController
+from app.core.dependencies import (
+    get_admission_controller,
+    get_story_generator_type,
+    get_usage_aggregator,
+)
+from app.core.settings.config import settings
+from app.main import app
 from app.scenario.infrastructure.persistence.models.scenario import (
     Scenario as ScenarioModel,
 )
+from app.usage.application.services.usage_aggregator import UsageAggregator
 from tests.utils.fakers import CharacterFactory, ScenarioFactory, StoryFactory
 
 
@@ -53,7 +63,9 @@ async def test_generate_story_success(
     }
 
     # Act
-    response = await authenticated_client.post("/stories/generate", json=request_data)
+    response = await authenticated_client.post(
+        "/stories/generate?expand=characters,scenario", json=request_data
+    )
 
     # Assert
     assert response.status_code == status.HTTP_201_CREATED
@@ -64,6 +76,33 @@ async def test_generate_story_success(
     assert response_data["narrative_style"] == test_story.narrative_style
     assert response_data["scenario"]["name"] == test_scenario.name
     assert response_data["characters"][0]["name"] == test_characters[0].name
+    phases = [m.split(";")[0] for m in response.headers["server-timing"].split(", ")]
+    assert {"auth", "queue", "characters", "scenario", "total"} <= set(phases)
+
+
+@pytest.mark.asyncio
+async def test_generate_story_records_usage_of_the_user(
+    authenticated_client: AsyncClient, test_characters, test_scenario, test_user
+):
+    aggregator = UsageAggregator(repository_factory=None)
+    app.dependency_overrides[get_usage_aggregator] = lambda: aggregator
+    request_data = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(test_scenario.id),
+        "narrative_style": "adventurous",
+    }
+
+    try:
+        response = await authenticated_client.post(
+            "/stories/generate", json=request_data
+        )
+    finally:
+        app.dependency_overrides.pop(get_usage_aggregator, None)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    ((day, user_id, backend),) = aggregator._pending
+    assert user_id == test_user.id
+    assert aggregator._pending[(day, user_id, backend)].stories == 1
 
 
 @pytest.mark.asyncio
@@ -150,3 +189,213 @@ async def test_generate_story_invalid_narrative_style(
     response = await authenticated_client.post("/stories/generate", json=request_data)
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_generate_story_rejected_when_backend_saturated(
+    authenticated_client: AsyncClient,
+    test_characters,
+    test_scenario,
+):
+    """Test that a saturated backend answers 503 with Retry-After"""
+    controller = AdmissionController(
+        default_limit=1, max_queue_size=0, max_queue_time=1
+    )
+    await controller.limiter(get_story_generator_type()).acquire()
+    app.dependency_overrides[get_admission_controller] = lambda: controller
+
+    request_data = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(test_scenario.id),
+        "narrative_style": "adventure",
+    }
+
+    try:
+        response = await authenticated_client.post(
+            "/stories/generate", json=request_data
+        )
+    finally:
+        app.dependency_overrides.pop(get_admission_controller, None)
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert int(response.headers["Retry-After"]) >= 1
+    assert controller.stats()["local"]["rejected_total"]["queue_full"] == 1
+
+
+@pytest.fixture
+def admin(test_user, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [test_user.email])
+
+
+@pytest.mark.asyncio
+async def test_get_admission_stats(
+    authenticated_client: AsyncClient,
+    admin,
+    test_characters,
+    test_scenario,
+):
+    request_data = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(test_scenario.id),
+        "narrative_style": "adventure",
+    }
+    await authenticated_client.post("/stories/generate", json=request_data)
+
+    response = await authenticated_client.get("/stories/admission")
+
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()[get_story_generator_type()]
+    assert stats["in_flight"] == 0
+    assert stats["admitted_total"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_get_admission_stats_requires_an_admin(
+    authenticated_client: AsyncClient, monkeypatch
+):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [])
+
+    response = await authenticated_client.get("/stories/admission")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_invalid_story_request_takes_no_admission_slot(
+    authenticated_client: AsyncClient, test_characters
+):
+    controller = AdmissionController(
+        default_limit=1, max_queue_size=0, max_queue_time=1
+    )
+    app.dependency_overrides[get_admission_controller] = lambda: controller
+
+    request_data = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(uuid4()),
+        "narrative_style": "adventure",
+    }
+
+    try:
+        response = await authenticated_client.post(
+            "/stories/generate", json=request_data
+        )
+    finally:
+        app.dependency_overrides.pop(get_admission_controller, None)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert controller.stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_generate_story_returns_related_ids_by_default(
+    authenticated_client: AsyncClient, test_characters, test_scenario
+):
+    request_data = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(test_scenario.id),
+        "narrative_style": "adventure",
+    }
+
+    response = await authenticated_client.post("/stories/generate", json=request_data)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = response.json()
+    assert response_data["scenario"] == {"id": str(test_scenario.id)}
+    assert response_data["characters"] == [
+        {"id": str(char.id)} for char in test_characters
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_story_returns_the_requested_fields(
+    authenticated_client: AsyncClient, test_characters, test_scenario
+):
+    request_data = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(test_scenario.id),
+        "narrative_style": "adventure",
+    }
+
+    response = await authenticated_client.post(
+        "/stories/generate?fields=title,characters.name", json=request_data
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json() == {
+        "title": f"{test_characters[0].name}'s Magical Adventure",
+        "characters": [
+            {"id": str(char.id), "name": char.name} for char in test_characters
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_generate_story_rejects_unknown_fields(
+    authenticated_client: AsyncClient, test_characters, test_scenario
+):
+    request_data = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(test_scenario.id),
+        "narrative_style": "adventure",
+    }
+
+    response = await authenticated_client.post(
+        "/stories/generate?expand=author", json=request_data
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"] == "Unknown expand: author."
+
+
+@pytest.mark.asyncio
+async def test_generate_stories_batch_streams_ndjson(
+    authenticated_client: AsyncClient,
+    test_characters,
+    test_scenario,
+):
+    valid = {
+        "character_ids": [str(char.id) for char in test_characters],
+        "scenario_id": str(test_scenario.id),
+        "narrative_style": "adventure",
+    }
+    invalid = {**valid, "scenario_id": str(uuid4())}
+
+    response = await authenticated_client.post(
+        "/stories/generate/batch?expand=scenario",
+        json={"stories": [valid, invalid, valid]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    by_index = {line["index"]: line for line in lines}
+    assert sorted(by_index) == [0, 1, 2]
+    assert by_index[1] == {
+        "index": 1,
+        "status": "error",
+        "error": "Scenario not found.",
+    }
+    assert by_index[0]["status"] == "ok"
+    assert by_index[2]["story"]["scenario"]["name"] == test_scenario.name
+    assert by_index[2]["story"]["characters"] == [
+        {"id": str(char.id)} for char in test_characters
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_stories_batch_malformed_id(authenticated_client: AsyncClient):
+    request_data = {
+        "stories": [
+            {
+                "character_ids": ["not-a-uuid"],
+                "scenario_id": str(uuid4()),
+                "narrative_style": "adventure",
+            }
+        ]
+    }
+
+    response = await authenticated_client.post(
+        "/stories/generate/batch", json=request_data
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,91 @@
+import contextlib
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.usage import TokenUsage
+from app.usage.application.services.usage_aggregator import UsageAggregator
+
+
+@pytest.fixture
+def repository():
+    repository = AsyncMock()
+    repository.add.return_value = None
+    return repository
+
+
+@pytest.fixture
+def aggregator(repository):
+    @contextlib.asynccontextmanager
+    async def repository_factory():
+        yield repository
+
+    return UsageAggregator(repository_factory, flush_interval=3600)
+
+
+def usage(prompt: int, completion: int, seconds: float = 1.0) -> TokenUsage:
+    return TokenUsage(
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        generation_seconds=seconds,
+        llm_calls=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_sums_usage_per_user_and_backend(aggregator, repository):
+    user_id, other_user_id = uuid4(), uuid4()
+
+    aggregator.record(user_id, "llama", usage(100, 10))
+    aggregator.record(user_id, "llama", usage(200, 20))
+    aggregator.record(user_id, "chatgpt", usage(50, 5))
+    aggregator.record(other_user_id, "llama", usage(1, 1))
+    aggregator.record(user_id, "llama", None)
+
+    assert aggregator.pending == 3
+    assert await aggregator.flush() == 3
+
+    rollups = {(r.user_id, r.backend): r for r in repository.add.call_args.args[0]}
+    llama = rollups[(user_id, "llama")]
+    assert llama.stories == 2
+    assert llama.prompt_tokens == 300
+    assert llama.completion_tokens == 30
+    assert llama.generation_seconds == 2.0
+    assert rollups[(user_id, "chatgpt")].stories == 1
+    assert aggregator.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_without_usage_skips_the_database(aggregator, repository):
+    assert await aggregator.flush() == 0
+
+    repository.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_usage_for_the_next_one(aggregator, repository):
+    user_id = uuid4()
+    aggregator.record(user_id, "llama", usage(100, 10))
+    repository.add.side_effect = RuntimeError("database down")
+
+    assert await aggregator.flush() == 0
+
+    aggregator.record(user_id, "llama", usage(100, 10))
+    repository.add.side_effect = None
+    assert await aggregator.flush() == 1
+
+    (rollup,) = repository.add.call_args.args[0]
+    assert rollup.stories == 2
+    assert rollup.prompt_tokens == 200
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_usage(aggregator, repository):
+    aggregator.start()
+    aggregator.record(uuid4(), "local", usage(0, 0, seconds=0.0))
+
+    await aggregator.stop()
+
+    repository.add.assert_awaited_once()
+    assert aggregator.pending == 0
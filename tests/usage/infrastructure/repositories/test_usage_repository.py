@@ -0,0 +1,65 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.usage.domain.entities.usage_rollup import UsageRollup
+from app.usage.infrastructure.repositories.usage_repository import UsageRepository
+
+
+@pytest.fixture
+def usage_repository(async_db_session: AsyncSession) -> UsageRepository:
+    return UsageRepository(async_db_session)
+
+
+@pytest.mark.asyncio
+async def test_add_creates_then_increments_rollups(usage_repository):
+    user_id = uuid4()
+    day = date(2025, 3, 1)
+
+    await usage_repository.add(
+        [
+            UsageRollup(
+                day=day,
+                user_id=user_id,
+                backend="llama",
+                stories=1,
+                prompt_tokens=100,
+                completion_tokens=10,
+                generation_seconds=1.5,
+            ),
+            UsageRollup(day=day, user_id=user_id, backend="chatgpt", stories=1),
+        ]
+    )
+    await usage_repository.add(
+        [
+            UsageRollup(
+                day=day,
+                user_id=user_id,
+                backend="llama",
+                stories=2,
+                prompt_tokens=200,
+                cached_tokens=150,
+                completion_tokens=20,
+                generation_seconds=2.5,
+            )
+        ]
+    )
+
+    rollups = await usage_repository.get_by_user(user_id)
+
+    assert [r.backend for r in rollups] == ["chatgpt", "llama"]
+    llama = rollups[1]
+    assert llama.stories == 3
+    assert llama.prompt_tokens == 300
+    assert llama.cached_tokens == 150
+    assert llama.completion_tokens == 30
+    assert llama.generation_seconds == 4.0
+
+
+@pytest.mark.asyncio
+async def test_add_nothing_is_a_no_op(usage_repository):
+    await usage_repository.add([])
+
+    assert await usage_repository.get_by_user(uuid4()) == []
@@ -95,6 +95,7 @@ class MockCharacterRepository:
     def __init__(self) -> None:
         self.save = AsyncMock()
         self.get_by_id = AsyncMock()
+        self.get_by_ids = AsyncMock(return_value=[])
 
     def configure_save(self, character: Character | None):
         """
@@ -126,6 +127,7 @@ class MockScenarioRepository:
     def __init__(self) -> None:
         self.get_all = AsyncMock()
         self.get_by_id = AsyncMock()
+        self.get_by_ids = AsyncMock(return_value=[])
         self.get_by_name = AsyncMock()
         self.save = AsyncMock()
 
@@ -181,7 +183,7 @@ class MockStoryGenerator:
     """Mock for the StoryGenerator interface"""
 
     def __init__(self) -> None:
-        self.generate = AsyncMock()
+        self.generate = Mock()
 
     def configure_generate(self, story: Story | None):
         """